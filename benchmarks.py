@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from collections.abc import Callable
+from pathlib import Path
+
+from priority_sorter.containers import BlockedList
+from priority_sorter.items import Item, ItemStore
+from priority_sorter.sorter import Choice, PairwiseSorter, SortedFactory
+
+DEFAULT_BASELINE = Path(__file__).with_name("bench_baseline.json")
+
+# Every metric is "lower is better": seconds per operation or bytes per item.
+Metrics = dict[str, float]
+
+
+def _best_of(repeats: int, func: Callable[[], float]) -> float:
+    return min(func() for _ in range(repeats))
+
+
+def _drive(sorter: PairwiseSorter[int], budget: int | None = None) -> int:
+    comparisons = 0
+    while budget is None or comparisons < budget:
+        pair = sorter.current_pair()
+        if pair is None:
+            break
+        current, pivot = pair
+        sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        comparisons += 1
+    return comparisons
+
+
+def _shuffled(n: int, seed: int = 0xBE7C) -> list[int]:
+    items = list(range(n))
+    random.Random(seed).shuffle(items)
+    return items
+
+
+def _make_choice_seconds(n: int, factory: SortedFactory[int]) -> float:
+    items = _shuffled(n)
+    sorter: PairwiseSorter[int] = PairwiseSorter(factory)
+    sorter.start_sorting(items)
+    start = time.perf_counter()
+    comparisons = _drive(sorter)
+    return (time.perf_counter() - start) / max(1, comparisons)
+
+
+def bench_make_choice() -> Metrics:
+    """Seconds per make_choice for growing n; flat numbers mean O(log n) steps."""
+    sizes = [1_000, 4_000, 16_000]
+    factories: dict[str, SortedFactory[int]] = {"list": list, "blocked": BlockedList}
+    samples: dict[str, list[float]] = {}
+    # Rounds interleave every size, so a slower stretch of the run hits
+    # them all alike instead of skewing one.
+    for _ in range(5):
+        for n in sizes:
+            for label, factory in factories.items():
+                samples.setdefault(f"{label}_n{n}", []).append(_make_choice_seconds(n, factory))
+    metrics: Metrics = {key: min(values) for key, values in samples.items()}
+    # The large/small ratio is machine independent and catches O(n) slips;
+    # pairing the sizes round by round cancels most of the drift.
+    metrics["blocked_growth_16000_over_1000"] = statistics.median(
+        large / small for large, small in zip(samples["blocked_n16000"], samples["blocked_n1000"])
+    )
+    return metrics
+
+
+def _bytes_per_item(n: int, build: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        kept = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (peak - baseline) / n
+
+
+def bench_memory() -> Metrics:
+    """Peak traced bytes per item for Item objects, an ItemStore and a live CompareState."""
+    n = 20_000
+    labels = [f"Priority number {index}" for index in range(n)]
+
+    def build_items() -> object:
+        return [Item(label) for label in labels]
+
+    def build_store() -> object:
+        return ItemStore(labels)
+
+    values = _shuffled(n)
+
+    def build_state() -> object:
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        sorter.start_sorting(values)
+        _drive(sorter, budget=n)
+        return sorter
+
+    return {
+        "item_bytes_per_item": _bytes_per_item(n, build_items),
+        "item_store_bytes_per_item": _bytes_per_item(n, build_store),
+        "compare_state_bytes_per_item": _bytes_per_item(n, build_state),
+    }
+
+
+def bench_snapshot_ordering() -> Metrics:
+    """Cost of reading the live ordering mid-session."""
+    n = 20_000
+    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter.start_sorting(_shuffled(n))
+    _drive(sorter, budget=n * 4)
+
+    def snapshot() -> float:
+        start = time.perf_counter()
+        for _ in range(20):
+            sorter.snapshot_ordering()
+        return (time.perf_counter() - start) / 20
+
+    def view_window() -> float:
+        # Thousands of windows per sample: a handful is too short to time.
+        start = time.perf_counter()
+        for offset in range(0, 20_000, 5):
+            sorter.ordering_view()[offset : offset + 40]
+        return (time.perf_counter() - start) / 4_000
+
+    rounds = [(snapshot(), view_window()) for _ in range(9)]
+    return {
+        "snapshot_ordering_n20000": min(full for full, _ in rounds),
+        "ordering_view_window_n20000": min(window for _, window in rounds),
+        # A window should cost a sliver of a full copy however fast the
+        # machine is; an O(n) slice pushes this towards 1.
+        "ordering_view_window_over_snapshot": statistics.median(
+            window / full for full, window in rounds
+        ),
+    }
+
+
+class _StandInWidget:
+    """Accepts any widget call; geometry queries answer for a 500x800 window."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self._windows = 0
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return _ignore
+
+    def winfo_width(self) -> int:
+        return 500
+
+    def winfo_height(self) -> int:
+        return 800
+
+    def canvasy(self, y: float) -> float:
+        return y
+
+    def winfo_children(self) -> list[object]:
+        return []
+
+    def create_window(self, *args: object, **kwargs: object) -> int:
+        self._windows += 1
+        return self._windows
+
+
+def _ignore(*args: object, **kwargs: object) -> None:
+    return None
+
+
+class _StandInVariable:
+    def __init__(self, master: object = None, value: object = None) -> None:
+        self._value = value
+
+    def get(self) -> object:
+        return self._value
+
+    def set(self, value: object) -> None:
+        self._value = value
+
+
+class _StandInRoot(_StandInWidget):
+    """Queues `after` / `after_idle` callbacks and runs them on update."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__()
+        self._queued: list[Callable[[], object]] = []
+
+    def after(self, delay: int, callback: Callable[[], object]) -> str:
+        self._queued.append(callback)
+        return f"after#{len(self._queued)}"
+
+    def after_idle(self, callback: Callable[[], object]) -> str:
+        return self.after(0, callback)
+
+    def update(self) -> None:
+        while self._queued:
+            self._queued.pop(0)()
+
+    update_idletasks = update
+
+
+def _import_gui_with_tk_stand_in() -> types.ModuleType:
+    """
+    Import a private copy of priority_sorter.gui on top of a Tk stand-in.
+
+    Every widget call is a no-op, so what is timed is the GUI's own Python
+    work: which rows get rebound and what each binding computes. That is what
+    the virtual lists exist to keep small, and it runs without a display.
+    """
+    tk = types.ModuleType("tkinter")
+    ttk = types.ModuleType("tkinter.ttk")
+    tk.Tk = _StandInRoot  # type: ignore[attr-defined]
+    tk.Widget = tk.Canvas = _StandInWidget  # type: ignore[attr-defined]
+    tk.Event = object  # type: ignore[attr-defined]
+    tk.TclError = type("TclError", (Exception,), {})  # type: ignore[attr-defined]
+    tk.StringVar = tk.IntVar = tk.BooleanVar = _StandInVariable  # type: ignore[attr-defined]
+    for name in (
+        "Button", "Checkbutton", "Entry", "Frame", "Label",
+        "Progressbar", "Scrollbar", "Spinbox", "Style",
+    ):
+        setattr(ttk, name, _StandInWidget)
+    tk.ttk = ttk  # type: ignore[attr-defined]
+
+    names = ("tkinter", "tkinter.ttk", "priority_sorter.gui")
+    saved = {name: sys.modules.pop(name, None) for name in names}
+    sys.modules["tkinter"] = tk
+    sys.modules["tkinter.ttk"] = ttk
+    try:
+        return importlib.import_module("priority_sorter.gui")
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def bench_gui() -> Metrics:
+    """List and live-panel refreshes, driven headless through a Tk stand-in."""
+    gui = _import_gui_with_tk_stand_in()
+    rebinds = [0]
+    show = gui.LiveRow.show
+
+    def counted_show(row: object, *args: object) -> None:
+        rebinds[0] += 1
+        show(row, *args)
+
+    gui.LiveRow.show = counted_show
+
+    app = gui.PrioritySorterApp()
+    app.items = app.store.extend(f"Priority number {index}" for index in range(5_000))
+    app.root.update()
+
+    def refresh_items() -> float:
+        start = time.perf_counter()
+        for _ in range(10):
+            app.refresh_items()
+            app.root.update_idletasks()
+        return (time.perf_counter() - start) / 10
+
+    app.show_state_var.set(True)
+    app.enter_compare_mode()
+    app.root.update()
+
+    def refresh_state_view() -> float:
+        start = time.perf_counter()
+        for _ in range(20):
+            if app.sorter.current_pair() is None:
+                break
+            app._select_choice(Choice.LEFT)
+            app.root.update_idletasks()
+        return (time.perf_counter() - start) / 20
+
+    items_seconds = _best_of(5, refresh_items)
+    rebinds[0] = 0
+    answered = app.sorter.progress().comparisons
+    live_seconds = _best_of(5, refresh_state_view)
+    answered = app.sorter.progress().comparisons - answered
+    return {
+        "refresh_items_n5000": items_seconds,
+        "select_choice_live_view_n5000": live_seconds,
+        # Deterministic: grows if a click starts rebinding more than the
+        # rows whose marker moved.
+        "live_rows_rebound_per_choice_n5000": rebinds[0] / max(1, answered),
+    }
+
+
+def _collect_benchmarks() -> list[tuple[str, Callable[[], Metrics | None]]]:
+    benchmarks: list[tuple[str, Callable[[], Metrics | None]]] = []
+    for name, obj in globals().items():
+        if name.startswith("bench_") and callable(obj):
+            benchmarks.append((name, obj))  # type: ignore[arg-type]
+    benchmarks.sort(key=lambda pair: pair[0])
+    return benchmarks
+
+
+def _run_benchmarks(selected: set[str] | None) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, func in _collect_benchmarks():
+        if selected and name not in selected:
+            continue
+        metrics = func()
+        if metrics is None:
+            print(f"SKIP: {name}")
+            continue
+        for metric, value in metrics.items():
+            key = f"{name}.{metric}"
+            results[key] = value
+            print(f"{key}: {value:.6g}")
+    return results
+
+
+def _is_machine_independent(key: str) -> bool:
+    """Byte counts, rebind counts and ratios of timings taken side by side."""
+    return "bytes_per_item" in key or "_over_" in key or "rows_rebound" in key
+
+
+def _compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    timing_threshold: float,
+    ran: set[str],
+) -> list[str]:
+    regressions = []
+    # A benchmark that ran but skipped a baselined metric must not pass quietly.
+    for key in sorted(baseline):
+        if key.split(".", 1)[0] in ran and key not in results:
+            regressions.append(f"{key}: missing from this run")
+    for key, value in sorted(results.items()):
+        previous = baseline.get(key)
+        if previous is None or previous <= 0:
+            continue
+        ratio = value / previous
+        allowed = threshold if _is_machine_independent(key) else timing_threshold
+        if ratio > 1 + allowed:
+            regressions.append(f"{key}: {value:.6g} vs baseline {previous:.6g} ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Priority Sorter benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update", action="store_true", help="overwrite the baseline with this run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="allowed growth of ratios and byte counts, as a fraction (0.5 = 50%%)",
+    )
+    parser.add_argument(
+        "--timing-threshold",
+        type=float,
+        default=1.5,
+        help="allowed slowdown of raw timings, which swing with machine load",
+    )
+    parser.add_argument("--output", type=Path, help="also write this run's results here")
+    parser.add_argument("only", nargs="*", help="benchmark names to run (default: all)")
+    args = parser.parse_args(argv)
+
+    selected = set(args.only) or None
+    results = _run_benchmarks(selected)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    if args.update or not args.baseline.exists():
+        merged = {}
+        if args.baseline.exists():
+            merged = json.loads(args.baseline.read_text())
+        merged.update(results)
+        args.baseline.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    ran = {name for name, _ in _collect_benchmarks() if not selected or name in selected}
+    regressions = _compare(results, baseline, args.threshold, args.timing_threshold, ran)
+    if regressions:
+        print(f"{len(regressions)} regression{'s' if len(regressions) != 1 else ''}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,7 +30,10 @@
                 { pkgs, ... }:
                 let
                   pythonBase = if pkgs ? python313 then pkgs.python313 else pkgs.python3;
-                  python = pythonBase.withPackages (ps: [ ps.tkinter ]);
+                  python = pythonBase.withPackages (ps: [
+                    ps.tkinter
+                    ps.numpy
+                  ]);
                 in
                 {
                   packages = [
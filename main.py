@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import sys
-import tkinter as tk
 
 from priority_sorter import run_app
 
 
 def main() -> None:
+    # Imported here so headless tools importing this module never load Tk.
+    import tkinter as tk
+
     try:
         run_app()
     except tk.TclError as exc:  # pragma: no cover - only hit on missing Tk installation
@@ -1,17 +1,40 @@
 """Priority Sorter Python package."""
 
-from .items import Item, DEFAULT_ITEM_LABELS, DEFAULT_ITEMS, seeded_items
-from .sorter import Choice, PairwiseSorter, expected_max_comparisons
+from .async_sorter import AsyncMergeSorter
+from .containers import BlockedList
+from .items import Item, ItemStore, DEFAULT_ITEM_LABELS, DEFAULT_ITEMS, seeded_items
+from .journal import ChoiceJournal
+from .knowledge import ComparisonKnowledge
+from .merge_insertion import MergeInsertionSorter
+from .metrics import PrometheusMetrics
+from .sorter import (
+    Choice,
+    PairwiseSorter,
+    SortProgress,
+    SorterObserver,
+    expected_max_comparisons,
+    merge_insertion_max_comparisons,
+)
 
 __all__ = [
     "run_app",
+    "BlockedList",
     "Item",
+    "ItemStore",
     "DEFAULT_ITEM_LABELS",
     "DEFAULT_ITEMS",
     "seeded_items",
     "Choice",
     "PairwiseSorter",
+    "SortProgress",
+    "SorterObserver",
+    "PrometheusMetrics",
+    "ComparisonKnowledge",
+    "ChoiceJournal",
+    "MergeInsertionSorter",
+    "AsyncMergeSorter",
     "expected_max_comparisons",
+    "merge_insertion_max_comparisons",
 ]
 
 
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Iterable, List, Sequence, TypeVar
+
+from .sorter import DoneState, EmptyState
+
+
+T = TypeVar("T")
+
+AsyncPrefer = Callable[[T, T], Awaitable[bool]]
+
+AsyncSortState = EmptyState[T] | DoneState[T]
+
+
+class AsyncMergeSorter(Generic[T]):
+    """
+    Merge sort that keeps up to `max_in_flight` comparisons outstanding.
+
+    Binary insertion can only ever ask one question at a time. Merge sort has
+    independent sub-problems at every level, and each merge is further split
+    into `max_in_flight` segments by binary-searching the merge path, so a
+    pool of judges answering `prefer(a, b)` concurrently finishes in roughly
+    n log n / judges rounds instead of n log n.
+
+    `prefer(a, b)` resolves to True when `a` outranks `b`, mirroring
+    `Choice.LEFT` for the pair `(a, b)`.
+    """
+
+    def __init__(self, max_in_flight: int = 8, min_segment: int = 4) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.state: AsyncSortState[T] = EmptyState([])
+        self.max_in_flight = max_in_flight
+        self.min_segment = max(1, min_segment)
+        self.comparisons = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+
+    async def sort(self, items: Sequence[T], prefer: AsyncPrefer[T]) -> List[T]:
+        """Sort `items`, awaiting `prefer` for every comparison."""
+        data = list(items)
+        self.state = EmptyState(data)
+        self.comparisons = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        limiter = asyncio.Semaphore(self.max_in_flight)
+
+        async def ask(left: T, right: T) -> bool:
+            async with limiter:
+                self.comparisons += 1
+                self._in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+                try:
+                    return await prefer(left, right)
+                finally:
+                    self._in_flight -= 1
+
+        ordered = await self._sort(data, ask)
+        self.state = DoneState(ordered)
+        return list(ordered)
+
+    async def _sort(self, data: List[T], ask: AsyncPrefer[T]) -> List[T]:
+        if len(data) <= 1:
+            return data
+        middle = len(data) // 2
+        left, right = await asyncio.gather(
+            self._sort(data[:middle], ask), self._sort(data[middle:], ask)
+        )
+        return await self._merge(left, right, ask)
+
+    async def _merge(self, left: List[T], right: List[T], ask: AsyncPrefer[T]) -> List[T]:
+        total = len(left) + len(right)
+        parts = min(self.max_in_flight, total // self.min_segment)
+        if parts <= 1 or not left or not right:
+            return await _merge_run(left, right, ask)
+
+        diagonals = [part * total // parts for part in range(1, parts)]
+        splits = await asyncio.gather(
+            *(_co_rank(diagonal, left, right, ask) for diagonal in diagonals)
+        )
+        bounds = [(0, 0), *((i, d - i) for i, d in zip(splits, diagonals))]
+        bounds.append((len(left), len(right)))
+        segments = await asyncio.gather(
+            *(
+                _merge_run(left[i0:i1], right[j0:j1], ask)
+                for (i0, j0), (i1, j1) in zip(bounds, bounds[1:])
+            )
+        )
+        return [item for segment in segments for item in segment]
+
+    def snapshot_ordering(self, fallback: Iterable[T] | None = None) -> List[T]:
+        """Return the finished ordering, or the input order while sorting."""
+        if isinstance(self.state, DoneState):
+            return list(self.state.sorted)
+        if fallback is None:
+            return list(self.state.items)
+        return list(fallback)
+
+    def finish_sorting(self, fallback: Iterable[T] | None = None) -> List[T]:
+        return self.snapshot_ordering(fallback)
+
+    def is_done(self) -> bool:
+        return isinstance(self.state, DoneState)
+
+
+async def _co_rank(diagonal: int, left: List[T], right: List[T], ask: AsyncPrefer[T]) -> int:
+    """Return how many of the first `diagonal` merged items come from `left`."""
+    lo = max(0, diagonal - len(right))
+    hi = min(diagonal, len(left))
+    while lo < hi:
+        i = (lo + hi) // 2
+        # left[i] belongs in the prefix unless right[diagonal - i - 1] outranks it.
+        if await ask(right[diagonal - i - 1], left[i]):
+            hi = i
+        else:
+            lo = i + 1
+    return lo
+
+
+async def _merge_run(left: List[T], right: List[T], ask: AsyncPrefer[T]) -> List[T]:
+    merged: List[T] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        # Ties keep `left` first so segment boundaries agree with `_co_rank`.
+        if await ask(right[j], left[i]):
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+# (sessions still asking, their current items, their pivots), aligned.
+BatchPairs = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class BatchedSorter:
+    """
+    Many binary-insertion sessions over the same number of items, in lockstep.
+
+    Row b of `inputs` holds session b's items in input order, usually
+    indices into a shared item list. Each session asks exactly the questions
+    a `PairwiseSorter` given that row would ask, but the search windows,
+    prefix sizes and sorted prefixes of all sessions live in NumPy arrays, so
+    one `make_choices` call advances every session at once and the Python
+    overhead is paid per step rather than per session.
+
+    Typical loop::
+
+        engine = BatchedSorter(inputs)
+        sessions, current, pivot = engine.current_pairs()
+        while sessions.size:
+            sessions, current, pivot = engine.make_choices(current > pivot)
+
+    Only full sorts are supported; there is no undo, journal or top-k limit.
+    """
+
+    def __init__(self, inputs: np.ndarray) -> None:
+        data = np.asarray(inputs)
+        if data.ndim != 2 or not np.issubdtype(data.dtype, np.integer):
+            raise ValueError("inputs must be a 2-D integer array (sessions × items)")
+        sessions, size = data.shape
+        self._n = size
+        # Flat views: row b, column c lives at b * n + c, which NumPy gathers
+        # much faster than 2-D fancy indexing.
+        self._data = np.ascontiguousarray(data).reshape(-1)
+        self._order = np.empty_like(self._data)
+        self._order[:: max(size, 1)] = self._data[:: max(size, 1)]
+        self._sizes = np.full(sessions, min(size, 1), dtype=np.int32)
+        self._comparisons = np.zeros(sessions, dtype=np.int64)
+
+        # Per-session state of the sessions still asking, aligned with
+        # `_rows` and compacted whenever some of them finish.
+        rows = np.arange(sessions if size > 1 else 0, dtype=np.intp)
+        self._rows = rows
+        self._base = rows * size
+        # int32 so lo + hi cannot overflow however narrow the items are.
+        self._placed = np.ones(len(rows), dtype=np.int32)
+        self._lo = np.zeros(len(rows), dtype=np.int32)
+        self._hi = np.ones(len(rows), dtype=np.int32)
+        self._asked = np.zeros(len(rows), dtype=np.int64)
+
+    @property
+    def sessions(self) -> int:
+        return len(self._sizes)
+
+    @property
+    def comparisons(self) -> np.ndarray:
+        """Questions answered so far, per session."""
+        counts = self._comparisons.copy()
+        counts[self._rows] = self._asked
+        return counts
+
+    def is_done(self) -> bool:
+        return not self._rows.size
+
+    def current_pairs(self) -> BatchPairs:
+        """
+        Return (sessions, current, pivot) for every session still asking.
+
+        `sessions` holds their row numbers in increasing order; `current[i]`
+        is compared with `pivot[i]` in session `sessions[i]`.
+        """
+        base = self._base
+        current = self._data[base + (self._n - self._placed)]
+        pivot = self._order[base + (self._lo + self._hi) // 2]
+        return self._rows, current, pivot
+
+    def make_choices(self, left: np.ndarray) -> BatchPairs:
+        """
+        Answer the latest `current_pairs` and return the next ones.
+
+        `left[i]` is True where session `sessions[i]` picks `Choice.LEFT`
+        (its current item outranks the pivot). Sessions whose search window
+        closes insert their item; sessions that placed every item drop out of
+        the returned arrays.
+        """
+        left = np.asarray(left, dtype=bool)
+        if left.shape != self._rows.shape:
+            raise ValueError(f"expected {self._rows.size} choices, got {left.size}")
+        mid = (self._lo + self._hi) // 2
+        np.copyto(self._hi, mid, where=left)
+        np.copyto(self._lo, mid + 1, where=~left)
+        self._asked += 1
+
+        closed = np.flatnonzero(self._lo >= self._hi)
+        if closed.size:
+            self._insert(closed)
+            finished = self._placed == self._n
+            if finished.any():
+                self._retire(finished)
+        return self.current_pairs()
+
+    def _insert(self, closed: np.ndarray) -> None:
+        """Insert each closed session's current item at its window's position."""
+        rows = self._rows[closed]
+        placed = self._placed[closed]
+        position = self._lo[closed]
+        current = self._data[self._base[closed] + (self._n - placed)]
+        # Sessions move in lockstep, so only the widest live prefix is touched;
+        # whole-row copies plus a shifted select beat per-element gathers.
+        width = int(placed.max()) + 1
+        order = self._order.reshape(-1, self._n)
+        prefix = order[rows, :width]
+        after = np.arange(1, width) > position[:, None]
+        np.copyto(prefix[:, 1:], prefix[:, :-1].copy(), where=after)
+        prefix[np.arange(len(rows)), position] = current
+        order[rows, :width] = prefix
+        placed += 1
+        self._placed[closed] = placed
+        self._lo[closed] = 0
+        self._hi[closed] = placed
+
+    def _retire(self, finished: np.ndarray) -> None:
+        rows = self._rows[finished]
+        self._sizes[rows] = self._n
+        self._comparisons[rows] = self._asked[finished]
+        keep = ~finished
+        self._rows = self._rows[keep]
+        self._base = self._base[keep]
+        self._placed = self._placed[keep]
+        self._lo = self._lo[keep]
+        self._hi = self._hi[keep]
+        self._asked = self._asked[keep]
+
+    def run(self, prefer: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Answer every question with `prefer(current, pivot)` and return `orderings()`.
+
+        `prefer` is vectorized: it receives the aligned item arrays and
+        returns a boolean array, True where the current item outranks the pivot.
+        """
+        _, current, pivot = self.current_pairs()
+        while current.size:
+            _, current, pivot = self.make_choices(prefer(current, pivot))
+        return self.orderings()
+
+    def orderings(self) -> np.ndarray:
+        """
+        Best-known ordering of every session, one row each.
+
+        Mirrors `PairwiseSorter.snapshot_ordering`: the sorted prefix followed
+        by the items still pending, in their input order.
+        """
+        n = self._n
+        sizes = self._sizes.copy()
+        sizes[self._rows] = self._placed
+        data = self._data.reshape(-1, n) if n else self._data.reshape(len(sizes), 0)
+        order = self._order.reshape(data.shape)
+        columns = np.arange(n)
+        size = sizes[:, None]
+        pending = np.take_along_axis(data, np.clip(columns - size + 1, 0, max(n - 1, 0)), axis=1)
+        return np.where(columns < size, order, pending)
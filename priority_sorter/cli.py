@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, TextIO
+
+from .sorter import Choice, PairwiseSorter
+
+_CHOICES = {"left": Choice.LEFT, "right": Choice.RIGHT}
+
+
+def _emit(stdout: TextIO, message: Dict[str, Any]) -> None:
+    stdout.write(json.dumps(message, separators=(",", ":")) + "\n")
+    stdout.flush()
+
+
+def _session_items(request: Any) -> tuple[List[Any], int | None]:
+    """Validate a session request and return (items, limit)."""
+    if not isinstance(request, dict) or not isinstance(request.get("items"), list):
+        raise ValueError('expected {"items": [...]}')
+    limit = request.get("limit")
+    if limit is not None and (
+        isinstance(limit, bool) or not isinstance(limit, int) or limit < 1
+    ):
+        raise ValueError("limit must be a positive integer")
+    return request["items"], limit
+
+
+def _parse_request(line: str) -> tuple[List[Any], int | None]:
+    """Parse a session request line, naming stray answers as such."""
+    text = line.strip()
+    try:
+        request: Any = json.loads(text)
+    except json.JSONDecodeError:
+        request = text
+    if not isinstance(request, dict) or "items" not in request:
+        try:
+            _answer(request)
+        except ValueError:
+            pass
+        else:
+            raise ValueError(
+                f'no question is pending, ignoring {text}; start a session with {{"items": [...]}}'
+            )
+    return _session_items(request)
+
+
+def _parse_answer(line: str) -> str:
+    """Accept `left`, `"left"` or `{"choice": "left"}` (likewise right/undo)."""
+    text = line.strip()
+    try:
+        return _answer(json.loads(text))
+    except json.JSONDecodeError:
+        return _answer(text)
+
+
+def _answer(message: Any) -> str:
+    if isinstance(message, dict):
+        if message.get("undo"):
+            return "undo"
+        message = message.get("choice")
+    if message in _CHOICES or message == "undo":
+        return message
+    raise ValueError('expected "left", "right" or "undo"')
+
+
+def _question(sorter: PairwiseSorter[Any]) -> Dict[str, Any]:
+    left, right = sorter.current_pair()  # type: ignore[misc]
+    progress = sorter.progress()
+    return {
+        "event": "question",
+        "left": left,
+        "right": right,
+        "comparisons": progress.comparisons,
+        "remaining": progress.worst_remaining,
+    }
+
+
+def serve(stdin: Iterable[str], stdout: TextIO) -> int:
+    """
+    Run interactive sessions over JSON lines until `stdin` is exhausted.
+
+    Each session starts with a request line `{"items": [...], "limit": k}`
+    (`limit` optional, for a top-k session). Every question goes out as a
+    `question` event and is answered with a line holding `left`, `right` or
+    `undo`; the final ordering goes out as a `result` event. If input ends
+    mid-session, the best-known ordering is sent with `"done": false`. Answers
+    left over once a session has finished are reported as errors and skipped.
+    """
+    lines = (line for line in stdin if line.strip())
+    for request_line in lines:
+        try:
+            items, limit = _parse_request(request_line)
+        except ValueError as error:
+            _emit(stdout, {"event": "error", "message": str(error)})
+            continue
+        sorter: PairwiseSorter[Any] = PairwiseSorter()
+        sorter.start_sorting(items, limit=limit)
+        finished = _run_session(sorter, lines, stdout)
+        _emit(stdout, _result(sorter))
+        if not finished:
+            return 1
+    return 0
+
+
+def _run_session(sorter: PairwiseSorter[Any], lines: Iterator[str], stdout: TextIO) -> bool:
+    """Ask questions until the sorter is done; False if input ran out first."""
+    while sorter.current_pair() is not None:
+        _emit(stdout, _question(sorter))
+        while True:
+            line = next(lines, None)
+            if line is None:
+                return False
+            try:
+                answer = _parse_answer(line)
+            except ValueError as error:
+                _emit(stdout, {"event": "error", "message": str(error)})
+                continue
+            break
+        if answer == "undo":
+            sorter.undo()
+        else:
+            sorter.make_choice(_CHOICES[answer])
+    return True
+
+
+def _result(sorter: PairwiseSorter[Any]) -> Dict[str, Any]:
+    return {
+        "event": "result",
+        "done": sorter.is_done(),
+        "ordering": sorter.snapshot_ordering(),
+        "comparisons": sorter.progress().comparisons,
+    }
+
+
+def run_batch(stdin: Iterable[str], stdout: TextIO) -> int:
+    """
+    Replay many independent scripted sessions, one JSON line each.
+
+    A session line is `{"id": ..., "items": [...], "choices": [...],
+    "limit": k}`; `choices` are applied in order. One result line per session
+    is written as soon as it finishes, so memory stays bounded by the largest
+    single session. When a session's choices run out early, its result has
+    `"done": false` and the unanswered question in `pending`; choices left
+    over once it finishes are counted in `unused_choices`. Returns 1 if any
+    line failed.
+    """
+    failed = False
+    for number, line in enumerate(stdin, start=1):
+        if not line.strip():
+            continue
+        session_id: Any = number
+        try:
+            request = json.loads(line)
+            if isinstance(request, dict):
+                session_id = request.get("id", number)
+            items, limit = _session_items(request)
+            sorter: PairwiseSorter[Any] = PairwiseSorter()
+            sorter.start_sorting(items, limit=limit)
+            choices = request.get("choices", [])
+            if not isinstance(choices, list):
+                raise ValueError('"choices" must be a list')
+            unused = 0
+            for index, answer in enumerate(choices):
+                if sorter.current_pair() is None:
+                    unused = len(choices) - index
+                    break
+                answer = _answer(answer)
+                if answer == "undo":
+                    sorter.undo()
+                else:
+                    sorter.make_choice(_CHOICES[answer])
+        except ValueError as error:
+            failed = True
+            _emit(stdout, {"id": session_id, "error": str(error)})
+            continue
+        result = _result(sorter)
+        del result["event"]
+        result["id"] = session_id
+        result["pending"] = sorter.current_pair()
+        result["unused_choices"] = unused
+        _emit(stdout, result)
+    return 1 if failed else 0
+
+
+def _serve_http(args: argparse.Namespace) -> int:
+    from .server import SessionStore, SortingServer
+
+    server = SortingServer(
+        SessionStore(args.sessions, capacity=args.capacity), args.host, args.port
+    )
+
+    async def run() -> None:
+        await server.start()
+        print(f"Serving on http://{server.host}:{server.port}", file=sys.stderr)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _simulate(args: argparse.Namespace) -> int:
+    from .simulation import format_report, run_trials, summarize, trial_grid
+
+    try:
+        trials = trial_grid(args.strategies, args.sizes, args.seeds, args.noise)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    chunks = run_trials(trials, workers=args.workers, chunk_size=args.chunk_size)
+    print(format_report(summarize(chunks)))
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m priority_sorter",
+        description="Headless priority sorting over JSON lines.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="answer questions interactively on stdin/stdout")
+    batch = commands.add_parser("batch", help="replay scripted sessions from a JSONL file")
+    batch.add_argument("input", nargs="?", default="-", help="JSONL sessions (default: stdin)")
+    batch.add_argument("-o", "--output", default="-", help="where to write results")
+    http = commands.add_parser("http", help="host many sessions over HTTP")
+    http.add_argument("--host", default="127.0.0.1")
+    http.add_argument("--port", type=int, default=8080)
+    http.add_argument(
+        "--sessions",
+        default="priority_sorter_sessions",
+        help="directory for sessions evicted from memory",
+    )
+    http.add_argument(
+        "--capacity", type=int, default=1024, help="sessions kept in memory"
+    )
+    simulate = commands.add_parser(
+        "simulate", help="measure comparison counts of simulated sessions"
+    )
+    simulate.add_argument(
+        "--strategies", nargs="+", default=["insertion", "merge_insertion"]
+    )
+    simulate.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    simulate.add_argument("--seeds", type=int, default=100, help="trials per cell")
+    simulate.add_argument(
+        "--noise",
+        nargs="+",
+        type=float,
+        default=[0.0],
+        help="probabilities of a flipped answer",
+    )
+    simulate.add_argument("--workers", type=int, default=None)
+    simulate.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(sys.stdin, sys.stdout)
+    if args.command == "http":
+        return _serve_http(args)
+    if args.command == "simulate":
+        return _simulate(args)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        return run_batch(source, target)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
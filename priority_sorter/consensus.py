@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Dict, Generic, Hashable, Iterable, List, Sequence, TypeVar
+
+import numpy as np
+
+
+T = TypeVar("T", bound=Hashable)
+
+# Pairwise wins are tallied in a uint8 buffer and flushed before it can wrap.
+_FLUSH_EVERY = 255
+
+
+class ConsensusAccumulator(Generic[T]):
+    """
+    Streaming aggregate of many full orderings of the same items.
+
+    Each ordering (most important first, as `finish_sorting` returns it) is
+    folded into a Borda score vector and a pairwise-majority matrix and then
+    dropped, so memory stays at O(n²) no matter how many orderings arrive.
+    `add_many` converts a batch into a rank matrix in one go; either way each
+    ordering costs one vectorized n × n comparison.
+
+    `majority()[i, j]` counts the orderings that put `items[i]` ahead of
+    `items[j]`. `kemeny_ordering` searches for the ordering that disagrees
+    with the fewest of those pairwise votes.
+    """
+
+    def __init__(self, items: Sequence[T]) -> None:
+        self.items: List[T] = list(items)
+        self._index: Dict[T, int] = {item: index for index, item in enumerate(self.items)}
+        if len(self._index) != len(self.items):
+            raise ValueError("items must be distinct")
+        size = len(self.items)
+        self.count = 0
+        self._borda = np.zeros(size, dtype=np.int64)
+        self._majority = np.zeros((size, size), dtype=np.int64)
+        self._pending = np.zeros((size, size), dtype=np.uint8)
+        self._pending_count = 0
+        self._ahead = np.zeros((size, size), dtype=bool)
+
+    def add(self, ordering: Sequence[T]) -> None:
+        """Fold in one ordering."""
+        self.add_many([ordering])
+
+    def add_many(self, orderings: Iterable[Sequence[T]], batch: int = 256) -> None:
+        """Fold in many orderings, converting `batch` of them at a time."""
+        chunk: List[Sequence[T]] = []
+        for ordering in orderings:
+            chunk.append(ordering)
+            if len(chunk) >= batch:
+                self._fold(self._ranks(chunk))
+                chunk = []
+        if chunk:
+            self._fold(self._ranks(chunk))
+
+    def _ranks(self, orderings: List[Sequence[T]]) -> np.ndarray:
+        """Rank matrix: row b holds each item's position in ordering b."""
+        size = len(self.items)
+        # Narrow ranks halve the memory traffic of the n × n comparisons.
+        dtype = np.int16 if size <= np.iinfo(np.int16).max else np.int32
+        ranks = np.full((len(orderings), size), -1, dtype=dtype)
+        positions = np.arange(size, dtype=dtype)
+        index = self._index
+        for row, ordering in zip(ranks, orderings):
+            if len(ordering) != size:
+                raise ValueError("every ordering must contain each item exactly once")
+            try:
+                row[[index[item] for item in ordering]] = positions
+            except KeyError as error:
+                raise ValueError(f"unknown item {error.args[0]!r}") from None
+        if (ranks < 0).any():
+            # Right length but a repeated item leaves another one unranked.
+            raise ValueError("every ordering must contain each item exactly once")
+        return ranks
+
+    def _fold(self, ranks: np.ndarray) -> None:
+        size = len(self.items)
+        self._borda += (size - 1) * len(ranks) - ranks.sum(axis=0, dtype=np.int64)
+        pending = self._pending
+        ahead = self._ahead
+        for row in ranks:
+            np.less(row[:, None], row[None, :], out=ahead)
+            pending += ahead.view(np.uint8)
+            self._pending_count += 1
+            if self._pending_count == _FLUSH_EVERY:
+                self._flush()
+        self.count += len(ranks)
+
+    def _flush(self) -> None:
+        if self._pending_count:
+            self._majority += self._pending
+            self._pending.fill(0)
+            self._pending_count = 0
+
+    def borda_scores(self) -> np.ndarray:
+        """Total Borda points per item (n - 1 for first place, 0 for last)."""
+        return self._borda.copy()
+
+    def borda_ordering(self) -> List[T]:
+        order = np.argsort(-self._borda, kind="stable")
+        return [self.items[index] for index in order.tolist()]
+
+    def majority(self) -> np.ndarray:
+        """Pairwise-majority matrix: orderings ranking items[i] ahead of items[j]."""
+        self._flush()
+        return self._majority.copy()
+
+    def disagreements(self, ordering: Sequence[T]) -> int:
+        """Total Kendall tau distance from `ordering` to every folded ordering."""
+        self._flush()
+        order = np.array([self._index[item] for item in ordering], dtype=np.intp)
+        # Votes for each later item to be ahead of each earlier one.
+        against = self._majority[np.ix_(order, order)].T
+        return int(np.triu(against, 1).sum())
+
+    def kemeny_ordering(self, max_passes: int = 100) -> List[T]:
+        """
+        Approximate Kemeny consensus: the ordering with the fewest disagreements.
+
+        Starts from the Borda ordering and repeatedly moves single items to the
+        position that removes the most disagreeing votes until no move helps
+        (or `max_passes` sweeps ran). Exact Kemeny is NP-hard; the result is
+        locally optimal under single-item moves, so in particular every
+        adjacent pair follows the majority vote.
+        """
+        self._flush()
+        # net[i, j] > 0: more orderings put i ahead of j than the reverse.
+        net = self._majority - self._majority.T
+        order = np.argsort(-self._borda, kind="stable")
+        size = len(order)
+        for _ in range(max_passes):
+            improved = False
+            for item in order.tolist():
+                position = int(np.flatnonzero(order == item)[0])
+                row = net[item, order]
+                # gains[q]: disagreements removed by moving `item` to slot q.
+                gains = np.zeros(size, dtype=np.int64)
+                ahead = row[:position]
+                gains[:position] = np.cumsum(ahead[::-1])[::-1]
+                behind = -row[position + 1 :]
+                gains[position + 1 :] = np.cumsum(behind)
+                target = int(np.argmax(gains))
+                if gains[target] > 0:
+                    order = np.insert(np.delete(order, position), target, item)
+                    improved = True
+            if not improved:
+                break
+        return [self.items[index] for index in order.tolist()]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import Iterable, Iterator, List, MutableSequence, TypeVar, overload
+
+
+T = TypeVar("T")
+
+DEFAULT_LOAD = 512
+
+
+class BlockedList(MutableSequence[T]):
+    """
+    List-like container with cheap positional inserts and deletes.
+
+    Values live in a sequence of blocks holding between `load // 2` and
+    `2 * load` entries each, so an insert only shifts one short block instead
+    of the whole tail. A Fenwick tree over the block lengths turns positional
+    lookups into an O(log b) descent, giving O(log n + load) indexing and
+    insertion where a plain list would pay O(n) memmove per insert.
+    """
+
+    def __init__(self, values: Iterable[T] = (), load: int = DEFAULT_LOAD) -> None:
+        if load < 2:
+            raise ValueError("load must be at least 2")
+        self._load = load
+        self._blocks: List[List[T]] = []
+        self._tree: List[int] = []
+        self._len = 0
+        self._reset(list(values))
+
+    def _reset(self, data: List[T]) -> None:
+        load = self._load
+        self._blocks = [data[start : start + load] for start in range(0, len(data), load)]
+        self._len = len(data)
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        # Classic O(b) Fenwick construction: seed with the block sizes and push
+        # every partial sum into its parent once.
+        tree = [len(block) for block in self._blocks]
+        for pos, size in enumerate(tree):
+            parent = pos | (pos + 1)
+            if parent < len(tree):
+                tree[parent] += size
+        self._tree = tree
+
+    def _bump(self, block_index: int, delta: int) -> None:
+        tree = self._tree
+        pos = block_index
+        while pos < len(tree):
+            tree[pos] += delta
+            pos |= pos + 1
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Map a flat index to (block index, offset within that block)."""
+        tree = self._tree
+        size = len(tree)
+        block = -1
+        step = 1 << (size.bit_length() - 1) if size else 0
+        while step:
+            probe = block + step
+            if probe < size:
+                span = tree[probe]
+                if span <= index:
+                    block = probe
+                    index -= span
+            step >>= 1
+        return block + 1, index
+
+    def _window(self, start: int, stop: int) -> List[T]:
+        """Copy out `start:stop` touching only the blocks that overlap it."""
+        result: List[T] = []
+        if start >= stop:
+            return result
+        block, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._blocks[block][offset : offset + remaining]
+            result.extend(chunk)
+            remaining -= len(chunk)
+            block += 1
+            offset = 0
+        return result
+
+    def _stepped(self, start: int, stop: int, step: int) -> List[T]:
+        """Copy out `start:stop:step` touching only the blocks that overlap it."""
+        picks = range(start, stop, step)
+        if not picks:
+            return []
+        if step < 0:
+            return self._stepped(picks[-1], picks[0] + 1, -step)[::-1]
+        if step > self._load:
+            # Sparse picks: locate each one instead of walking every block between.
+            blocks = self._blocks
+            result = []
+            for index in picks:
+                block, offset = self._locate(index)
+                result.append(blocks[block][offset])
+            return result
+        result = []
+        block, offset = self._locate(start)
+        while len(result) < len(picks):
+            values = self._blocks[block]
+            taken = values[offset::step]
+            result.extend(taken)
+            # Where the stride lands in the next block.
+            offset += len(taken) * step - len(values)
+            block += 1
+        del result[len(picks) :]
+        return result
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockedList index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return self._stepped(start, stop, step)
+            return self._window(start, stop)
+        blocks = self._blocks
+        if len(blocks) == 1:
+            return blocks[0][index]
+        block, offset = self._locate(self._normalize(index))
+        return blocks[block][offset]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            data = list(self)
+            data[index] = value
+            self._reset(data)
+            return
+        block, offset = self._locate(self._normalize(index))
+        self._blocks[block][offset] = value
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            data = list(self)
+            del data[index]
+            self._reset(data)
+            return
+        block, offset = self._locate(self._normalize(index))
+        del self._blocks[block][offset]
+        self._len -= 1
+        if not self._blocks[block]:
+            del self._blocks[block]
+            self._rebuild_index()
+        elif len(self._blocks[block]) < self._load // 2 and len(self._blocks) > 1:
+            self._merge_with_neighbour(block)
+        else:
+            self._bump(block, -1)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0:
+            index = max(0, index + self._len)
+        index = min(index, self._len)
+        if not self._blocks:
+            self._blocks.append([value])
+            self._len = 1
+            self._rebuild_index()
+            return
+        if index == self._len:
+            block, offset = len(self._blocks) - 1, len(self._blocks[-1])
+        else:
+            block, offset = self._locate(index)
+        self._blocks[block].insert(offset, value)
+        self._len += 1
+        if len(self._blocks[block]) > 2 * self._load:
+            target = self._blocks[block]
+            half = len(target) // 2
+            self._blocks[block : block + 1] = [target[:half], target[half:]]
+            self._rebuild_index()
+        else:
+            self._bump(block, 1)
+
+    def _merge_with_neighbour(self, block: int) -> None:
+        left = block - 1 if block > 0 else block
+        merged = self._blocks[left] + self._blocks[left + 1]
+        if len(merged) > 2 * self._load:
+            half = len(merged) // 2
+            self._blocks[left : left + 2] = [merged[:half], merged[half:]]
+        else:
+            self._blocks[left : left + 2] = [merged]
+        self._rebuild_index()
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._tree = []
+        self._len = 0
+
+    def copy(self) -> "BlockedList[T]":
+        return BlockedList(self, load=self._load)
+
+    def __repr__(self) -> str:
+        return f"BlockedList({list(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BlockedList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
@@ -1,59 +1,409 @@
 from __future__ import annotations
 
 import tkinter as tk
+from array import array
+from pathlib import Path
 from tkinter import ttk
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
+
+from .items import DEFAULT_ITEM_LABELS, ItemHandle, ItemStore
+from .journal import ChoiceJournal
+from .knowledge import ComparisonKnowledge
+from .sorter import (
+    Choice,
+    CompareState,
+    DoneState,
+    EmptyState,
+    OrderingView,
+    PairwiseSorter,
+)
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".priority_sorter" / "session.jsonl"
+DEFAULT_TOP_K = 5
+
+
+class RowSlots:
+    """
+    Which pooled row shows which index, kept apart from Tk.
+
+    Index `i` always lives in slot `i % size`, so moving the visible range by
+    one line rebinds a single row rather than all of them. `layout` reports
+    its work through callbacks: `place(slot, index)` for every visible row,
+    `bind(slot, index)` only where a slot now shows a different index, and
+    `hide(slot)` for slots left over.
+    """
 
-from .items import Item, seeded_items
-from .sorter import Choice, PairwiseSorter, CompareState
+    def __init__(self) -> None:
+        self.bound: List[int | None] = []
+
+    def __len__(self) -> int:
+        return len(self.bound)
+
+    def grow(self, size: int) -> None:
+        """Make room for `size` rows; growing changes every index -> slot mapping."""
+        if size > len(self.bound):
+            self.bound = [None] * size
+
+    def invalidate(self) -> None:
+        """Forget what every slot shows, so the next layout rebinds them all."""
+        self.bound = [None] * len(self.bound)
+
+    def slot(self, index: int) -> int | None:
+        """Slot currently showing `index`, or None if it is not materialized."""
+        if not self.bound:
+            return None
+        slot = index % len(self.bound)
+        return slot if self.bound[slot] == index else None
+
+    def layout(
+        self,
+        first: int,
+        stop: int,
+        place: Callable[[int, int], None],
+        bind: Callable[[int, int], None],
+        hide: Callable[[int], None],
+    ) -> None:
+        """Show indices `first` to `stop - 1`, rebinding only slots that changed."""
+        size = len(self.bound)
+        if not size:
+            return
+        bound = self.bound
+        shown = set()
+        for index in range(first, stop):
+            slot = index % size
+            shown.add(slot)
+            place(slot, index)
+            if bound[slot] != index:
+                bind(slot, index)
+                bound[slot] = index
+        for slot in range(size):
+            if slot not in shown:
+                hide(slot)
+                bound[slot] = None
+
+
+class VirtualList(ttk.Frame):
+    """
+    Vertical scroll container that only materializes the rows on screen.
+
+    Rows have a fixed height, so the scroll region is just `count *
+    row_height` and a pool of roughly one screenful of row widgets is reused
+    as the view moves; `RowSlots` decides which of them to rebind.
+    `create_row(parent)` builds a pooled row and `bind_row(row, index)` fills
+    it with the data for `index`.
+    """
+
+    def __init__(
+        self,
+        master: tk.Widget,
+        row_height: int,
+        create_row: Callable[[tk.Widget], tk.Widget],
+        bind_row: Callable[[tk.Widget, int], None],
+        **kwargs,
+    ) -> None:
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._count = 0
+        # Pooled (canvas window id, row widget) pairs and the index each shows.
+        self._pool: List[tuple[int, tk.Widget]] = []
+        self._slots = RowSlots()
+
+        self.canvas = tk.Canvas(
+            self, highlightthickness=0, yscrollincrement=row_height
+        )
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self.canvas.yview
+        )
+        self.canvas.configure(yscrollcommand=self._on_view_changed)
+        self.canvas.bind("<Configure>", self._on_resize)
+        # Route the wheel to whichever list the pointer is over.
+        self.bind(
+            "<Enter>",
+            lambda event: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel),
+        )
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def set_count(self, count: int) -> None:
+        """Resize the list to `count` rows, re-binding only rows that moved."""
+        self._count = count
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, count * self.row_height))
+        self._layout()
+
+    def refresh(self) -> None:
+        """Re-bind every visible row, e.g. after indices shifted."""
+        self._slots.invalidate()
+        self._layout()
+
+    def refresh_range(self, start: int, stop: int) -> None:
+        """Re-bind the materialized rows among indices `start` to `stop - 1`."""
+        first, last = self._visible_range()
+        for index in range(max(start, first), min(stop, last)):
+            self.refresh_row(index)
+
+    def refresh_row(self, index: int) -> None:
+        """Re-bind a single row if it is currently materialized."""
+        row = self.row(index)
+        if row is not None:
+            self._bind_row(row, index)
+
+    def row(self, index: int) -> tk.Widget | None:
+        """The row widget showing `index`, if it is currently materialized."""
+        if not 0 <= index < self._count:
+            return None
+        slot = self._slots.slot(index)
+        return None if slot is None else self._pool[slot][1]
+
+    def see(self, index: int) -> None:
+        """Scroll so that row `index` is visible."""
+        if self._count:
+            self.canvas.yview_moveto(index / self._count)
+
+    def _visible_range(self) -> tuple[int, int]:
+        top = int(self.canvas.canvasy(0))
+        first = max(0, top // self.row_height)
+        rows = self.canvas.winfo_height() // self.row_height + 2
+        return first, min(self._count, first + rows)
+
+    def _layout(self) -> None:
+        first, stop = self._visible_range()
+        self._ensure_pool(stop - first)
+        pool = self._pool
+        canvas = self.canvas
+        width = canvas.winfo_width()
+
+        def place(slot: int, index: int) -> None:
+            window = pool[slot][0]
+            canvas.coords(window, 0, index * self.row_height)
+            canvas.itemconfigure(window, state="normal", width=width)
+
+        self._slots.layout(
+            first,
+            stop,
+            place,
+            lambda slot, index: self._bind_row(pool[slot][1], index),
+            lambda slot: canvas.itemconfigure(pool[slot][0], state="hidden"),
+        )
 
+    def _ensure_pool(self, needed: int) -> None:
+        if needed <= len(self._pool):
+            return
+        # Growing the pool changes every index -> slot mapping.
+        while len(self._pool) < needed:
+            row = self._create_row(self.canvas)
+            window = self.canvas.create_window(
+                (0, 0), window=row, anchor="nw", height=self.row_height
+            )
+            self._pool.append((window, row))
+        self._slots.grow(len(self._pool))
 
-class ScrollableFrame(ttk.Frame):
-    """Minimal vertical scroll container for item rows."""
+    def _on_view_changed(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self._layout()
 
-    def __init__(self, master: tk.Widget, **kwargs) -> None:
-        super().__init__(master, **kwargs)
-        canvas = tk.Canvas(self, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        self.inner = ttk.Frame(canvas)
-        self.inner.bind(
-            "<Configure>",
-            lambda event: canvas.configure(scrollregion=canvas.bbox("all")),
+    def _on_resize(self, event: tk.Event) -> None:
+        self.canvas.configure(
+            scrollregion=(0, 0, event.width, self._count * self.row_height)
         )
-        window = canvas.create_window((0, 0), window=self.inner, anchor="nw")
+        self._layout()
 
-        def _on_mousewheel(event: tk.Event) -> None:
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    def _on_mousewheel(self, event: tk.Event) -> None:
+        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        canvas.bind(
-            "<Configure>",
-            lambda event: canvas.itemconfig(window, width=event.width),
+
+class ItemRow(ttk.Frame):
+    """Recyclable list-view row; `show` rebinds it to another item."""
+
+    def __init__(self, master: tk.Widget, app: "PrioritySorterApp") -> None:
+        super().__init__(master, padding=(8, 4))
+        self.index = -1
+        self.counter = ttk.Label(self, width=4)
+        self.description = ttk.Label(self, anchor="w")
+        self.entry = ttk.Entry(self)
+        self.entry.bind("<Return>", lambda event: app.finish_edit(self.index))
+        self.edit_button = ttk.Button(
+            self, text="Edit", command=lambda: app.start_edit(self.index)
+        )
+        self.done_button = ttk.Button(
+            self, text="Done", command=lambda: app.finish_edit(self.index)
+        )
+        self.delete_button = ttk.Button(
+            self, text="Delete", command=lambda: app.delete_item(self.index)
         )
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+
+    def show(self, index: int, item: ItemHandle, edit_var: tk.StringVar) -> None:
+        self.index = index
+        for child in self.winfo_children():
+            child.pack_forget()
+        self.counter.configure(text=f"{index + 1}.")
+        self.counter.pack(side="left")
+        if not item.is_editing:
+            self.description.configure(text=item.description)
+            self.description.pack(side="left", fill="x", expand=True)
+            self.edit_button.pack(side="left", padx=5)
+        else:
+            self.entry.configure(textvariable=edit_var)
+            self.entry.pack(side="left", fill="x", expand=True)
+            self.done_button.pack(side="left", padx=5)
+        self.delete_button.pack(side="left")
+
+
+# (lo, hi, sorted prefix length, item count) behind the live panel's rows.
+LiveMarks = Tuple[int, int, int, int]
+
+
+def live_marks(state: object, count: int) -> LiveMarks:
+    """Marks for `state`; a session that is not comparing has no window."""
+    if isinstance(state, CompareState):
+        return state.lo, state.hi, len(state.sorted), count
+    return 0, 0, count, count
+
+
+def live_marker(index: int, marks: LiveMarks) -> str:
+    """
+    Search symbol for row `index` of the live panel.
+
+    "●" marks the item being inserted (the last pending one), "□" the active
+    search window in the sorted prefix.
+    """
+    lo, hi, prefix, count = marks
+    if prefix < count and index == count - 1:
+        return "●"
+    if index < prefix and lo <= index < hi:
+        return "□"
+    return ""
+
+
+def live_rows_to_refresh(
+    previous: LiveMarks | None, marks: LiveMarks
+) -> List[Tuple[int, int]] | None:
+    """
+    Index ranges of live-panel rows to rebind when `previous` becomes `marks`.
+
+    A choice that only narrows the window moves the □ markers at its edges,
+    so just the rows between the old and new `lo`, and the old and new `hi`,
+    change. None means every visible row: an insertion shifted them all (or
+    nothing was drawn yet).
+    """
+    if previous is None or previous[2:] != marks[2:]:
+        return None
+    old_lo, old_hi = previous[0], previous[1]
+    lo, hi = marks[0], marks[1]
+    return [(min(old_lo, lo), max(old_lo, lo)), (min(old_hi, hi), max(old_hi, hi))]
+
+
+class LiveRow(ttk.Frame):
+    """Recyclable live-order row: search marker, movement arrow and label."""
+
+    def __init__(self, master: tk.Widget) -> None:
+        super().__init__(master, padding=2)
+        self.status = ttk.Label(self, width=2)
+        self.status.pack(side="left")
+        self.arrow = ttk.Label(self, width=2)
+        self.arrow.pack(side="left")
+        self.text = ttk.Label(self, anchor="w")
+        self.text.pack(side="left", fill="x", expand=True)
+
+    def show(self, text: str, status: str, indicator: str, color: str | None) -> None:
+        self.status.configure(text=status)
+        self.arrow.configure(text=indicator)
+        if color is not None:
+            try:
+                self.arrow.configure(foreground=color)
+            except tk.TclError:
+                # Some themes may not support custom foreground; ignore.
+                pass
+        self.text.configure(text=text)
 
 
 class PrioritySorterApp:
     """Tkinter rendition of the interactive priority sorter."""
 
-    def __init__(self) -> None:
+    def __init__(self, journal_path: Path | None = None) -> None:
         self.root = tk.Tk()
         self.root.title("Priority Sorter")
         self.root.geometry("500x800")
         self.root.minsize(360, 600)
 
-        self.items: List[Item] = seeded_items()
-        self.sorter: PairwiseSorter[Item] = PairwiseSorter()
+        # Items are integer ids into the store; the sorter works on ids too.
+        self.store = ItemStore(DEFAULT_ITEM_LABELS)
+        self.items: List[int] = list(self.store.ids())
+        # Shared across sessions so re-sorting never repeats a settled question.
+        # Ids are unique for the store's lifetime, so they are their own keys.
+        self.knowledge: ComparisonKnowledge[int] = ComparisonKnowledge(key=int)
+        self.journal: ChoiceJournal[int] | None = None
+        if journal_path is not None:
+            self.journal = ChoiceJournal(
+                journal_path,
+                encode=self.store.description,
+                decode=self.store.add,
+            )
+        self.sorter: PairwiseSorter[int] = PairwiseSorter(
+            knowledge=self.knowledge, journal=self.journal
+        )
         self.mode: str = "list"
-        self._original_index: Dict[int, int] = {}
-        self._edit_vars: Dict[int, tk.StringVar] = {}
+        # Position of each item id when the current sort began, -1 if none.
+        self._original_index = array("l")
+        # K of the running top-K session, or None for a full sort.
+        self._top_k: int | None = None
+        # Only one item is edited at a time, so a single variable backs its entry.
+        self._edit_var = tk.StringVar()
+        self._editing_index: int | None = None
+        # Next pair and button labels for each answer, prepared while idle.
+        self._prepared: Dict[Choice, Tuple[Tuple[int, int], str, str]] = {}
+        self._idle_job: str | None = None
+        # Progress and the live panel lag behind a fast-path click.
+        self._catch_up = False
 
         self._build_ui()
         self._bind_shortcuts()
         self.refresh_items()
         self._update_sort_button()
+        self._resume_session()
+
+    def _resume_session(self) -> None:
+        """Pick up the items and any unfinished sort from the last run."""
+        try:
+            resumed = self.sorter.resume()
+        except (OSError, ValueError, KeyError):
+            # A damaged journal must never keep the app from starting.
+            return
+        if not resumed:
+            return
+        state = self.sorter.state
+        for item_id in self.items:
+            # The seeded defaults were replaced by the journaled items.
+            self.store.remove(item_id)
+        self.items = self.sorter.snapshot_ordering()
+        if isinstance(state, (DoneState, CompareState)):
+            # A finished top-K session must not pass its unordered tail off
+            # as ranked.
+            self._top_k = state.limit
+            for item_id in self._ranked_prefix(state):
+                self.store.set_ranked(item_id, True)
+        if isinstance(state, CompareState):
+            self._remember_positions()
+            self.show_compare_view()
+            return
+        self.refresh_items()
+        self._update_sort_button()
+
+    def _ranked_prefix(self, state: DoneState[int] | CompareState[int]) -> List[int]:
+        """Items whose relative order `state` has settled."""
+        if self._top_k is None:
+            return list(state.sorted)
+        return list(state.sorted[: self._top_k])
+
+    def _persist_items(self) -> None:
+        """Journal the plain item list while no sort is in progress."""
+        if self.journal is not None:
+            self.journal.snapshot(EmptyState(list(self.items)))
 
     def _build_ui(self) -> None:
         self.style = ttk.Style(self.root)
@@ -79,13 +429,32 @@ class PrioritySorterApp:
         add_button = ttk.Button(entry_row, text="Add", command=self.create_item)
         add_button.pack(side="right")
 
+        sort_row = ttk.Frame(self.list_frame)
+        sort_row.pack(fill="x", pady=(0, 20))
+
         self.sort_button = ttk.Button(
-            self.list_frame, text="Sort Items", command=self.enter_compare_mode
+            sort_row, text="Sort Items", command=self.enter_compare_mode
         )
-        self.sort_button.pack(fill="x", pady=(0, 20))
+        self.sort_button.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
-        self.scroll_frame = ScrollableFrame(self.list_frame)
-        self.scroll_frame.pack(fill="both", expand=True)
+        # Only rank the K most important items: far fewer questions.
+        self.top_k_var = tk.IntVar(value=DEFAULT_TOP_K)
+        self.top_k_spinbox = ttk.Spinbox(
+            sort_row, from_=1, to=999, width=4, textvariable=self.top_k_var
+        )
+        self.top_k_spinbox.pack(side="right")
+        self.top_k_button = ttk.Button(
+            sort_row, text="Sort Top K", command=self.enter_top_k_mode
+        )
+        self.top_k_button.pack(side="right", padx=(0, 4))
+
+        self.item_list = VirtualList(
+            self.list_frame,
+            row_height=44,
+            create_row=lambda parent: ItemRow(parent, self),
+            bind_row=self._bind_item_row,
+        )
+        self.item_list.pack(fill="both", expand=True)
 
         # Comparison view container
         self.compare_frame = ttk.Frame(self.root, padding=30)
@@ -114,6 +483,20 @@ class PrioritySorterApp:
         )
         self.right_button.pack(fill="x")
 
+        # Progress through the session, with an ETA once answers come in.
+        self.progress_bar = ttk.Progressbar(
+            self.choice_frame, mode="determinate", maximum=1.0
+        )
+        self.progress_bar.pack(fill="x", pady=(20, 4))
+        self.progress_var = tk.StringVar(value="")
+        self.progress_label = ttk.Label(
+            self.choice_frame,
+            textvariable=self.progress_var,
+            justify="left",
+            wraplength=240,
+        )
+        self.progress_label.pack(anchor="w")
+
         # Right column: legend + toggle + scrollable live view of current ordering.
         self.state_column = ttk.Frame(self.body_frame, width=180)
         self.state_column.pack(side="right", fill="y", padx=(20, 0))
@@ -144,8 +527,16 @@ class PrioritySorterApp:
         )
         self.state_toggle.pack(anchor="w", pady=(0, 8))
 
-        self.state_scroll = ScrollableFrame(self.state_column)
-        self.state_scroll.pack(fill="both", expand=True)
+        self.state_list = VirtualList(
+            self.state_column,
+            row_height=24,
+            create_row=LiveRow,
+            bind_row=self._bind_live_row,
+        )
+        self.state_list.pack(fill="both", expand=True)
+        # Marks behind the rows on screen, None until they are drawn.
+        self._live_marks: LiveMarks | None = None
+        self._live_view: OrderingView[int] = self.sorter.ordering_view(self.items)
 
         self.results_var = tk.StringVar(value="")
         self.results_frame = ttk.Frame(self.compare_frame)
@@ -176,6 +567,8 @@ class PrioritySorterApp:
         self.root.bind("<F11>", self._toggle_fullscreen)
         self.root.bind("<Left>", lambda event: self._select_choice(Choice.LEFT))
         self.root.bind("<Right>", lambda event: self._select_choice(Choice.RIGHT))
+        self.root.bind("<Control-z>", lambda event: self._undo_choice())
+        self.root.bind("<Control-y>", lambda event: self._redo_choice())
 
     def _toggle_fullscreen(self, event: tk.Event | None = None) -> None:
         current = self.root.attributes("-fullscreen")
@@ -198,118 +591,172 @@ class PrioritySorterApp:
         self.update_compare_view()
 
     def refresh_items(self) -> None:
-        for child in self.scroll_frame.inner.winfo_children():
-            child.destroy()
-        self._edit_vars = {}
-        for index, item in enumerate(self.items):
-            self._render_item_row(index, item)
-
-    def _render_item_row(self, index: int, item: Item) -> None:
-        row = ttk.Frame(self.scroll_frame.inner, padding=8)
-        row.pack(fill="x", pady=4)
-        counter = ttk.Label(row, text=f"{index + 1}.", width=4)
-        counter.pack(side="left")
+        self.item_list.set_count(len(self.items))
+        self.item_list.refresh()
 
-        if not item.is_editing:
-            description = ttk.Label(
-                row,
-                text=item.description,
-                wraplength=280,
-            )
-            description.pack(side="left", fill="x", expand=True)
-            edit_btn = ttk.Button(
-                row, text="Edit", command=lambda i=index: self.start_edit(i)
-            )
-            edit_btn.pack(side="left", padx=5)
-            delete_btn = ttk.Button(
-                row, text="Delete", command=lambda i=index: self.delete_item(i)
-            )
-            delete_btn.pack(side="left")
-        else:
-            var = tk.StringVar(value=item.description)
-            self._edit_vars[index] = var
-            entry = ttk.Entry(row, textvariable=var)
-            entry.pack(side="left", fill="x", expand=True)
-            entry.bind("<Return>", lambda event, i=index: self.finish_edit(i))
-            self.root.after(0, entry.focus_set)
-            done_btn = ttk.Button(
-                row, text="Done", command=lambda i=index: self.finish_edit(i)
-            )
-            done_btn.pack(side="left", padx=5)
-            delete_btn = ttk.Button(
-                row, text="Delete", command=lambda i=index: self.delete_item(i)
-            )
-            delete_btn.pack(side="left")
+    def _bind_item_row(self, row: ItemRow, index: int) -> None:
+        row.show(index, self.store.handle(self.items[index]), self._edit_var)
 
     def create_item(self) -> None:
         text = self.new_item_var.get().strip()
         if not text:
             return
-        self.items.append(Item(description=text))
+        self.items.append(self.store.add(text))
         self.new_item_var.set("")
-        self.refresh_items()
+        self._persist_items()
+        # Appending shifts nothing: grow the list and reveal the new row.
+        self.item_list.set_count(len(self.items))
+        self.item_list.see(len(self.items) - 1)
         self._update_sort_button()
 
     def delete_item(self, index: int) -> None:
-        del self.items[index]
+        item_id = self.items.pop(index)
+        self.knowledge.forget(item_id)
+        self.store.remove(item_id)
+        if self._editing_index == index:
+            self._editing_index = None
+        elif self._editing_index is not None and self._editing_index > index:
+            self._editing_index -= 1
+        self._persist_items()
         self.refresh_items()
         self._update_sort_button()
 
     def start_edit(self, index: int) -> None:
-        for item in self.items:
-            item.is_editing = False
-        self.items[index].is_editing = True
-        self.refresh_items()
+        previous = self._editing_index
+        if previous is not None and previous < len(self.items):
+            self.store.set_editing(self.items[previous], False)
+        self.store.set_editing(self.items[index], True)
+        self._editing_index = index
+        self._edit_var.set(self.store.description(self.items[index]))
+        if previous is not None:
+            self.item_list.refresh_row(previous)
+        self.item_list.refresh_row(index)
+        # Focus once, as the edit starts; rebinding on scroll must not steal it.
+        row = self.item_list.row(index)
+        if isinstance(row, ItemRow):
+            row.entry.after(0, row.entry.focus_set)
 
     def finish_edit(self, index: int) -> None:
-        text = (
-            self._edit_vars.get(index).get().strip() if index in self._edit_vars else ""
-        )
+        text = self._edit_var.get().strip() if index == self._editing_index else ""
         if text:
-            self.items[index].description = text
-            self.items[index].is_editing = False
-            self.refresh_items()
+            item_id = self.items[index]
+            if text != self.store.description(item_id):
+                # A reworded item may deserve a different rank.
+                self.store.set_ranked(item_id, False)
+                self.knowledge.forget(item_id)
+            self.store.set_description(item_id, text)
+            self.store.set_editing(item_id, False)
+            self._editing_index = None
+            self._persist_items()
+            self.item_list.refresh_row(index)
 
     def _update_sort_button(self) -> None:
         state = "normal" if len(self.items) >= 2 else "disabled"
         self.sort_button.configure(state=state)
+        self.top_k_button.configure(state=state)
 
-    def enter_compare_mode(self) -> None:
+    def enter_top_k_mode(self) -> None:
+        try:
+            k = self.top_k_var.get()
+        except tk.TclError:
+            # Not a number; leave the spinbox for the user to fix.
+            return
+        if k >= 1:
+            self.enter_compare_mode(limit=k)
+
+    def enter_compare_mode(self, limit: int | None = None) -> None:
         if len(self.items) < 2:
             return
-        for item in self.items:
-            item.is_editing = False
+        for item_id in self.items:
+            self.store.set_editing(item_id, False)
+        self._editing_index = None
         # Remember original positions so we can show how things move during sorting.
-        self._original_index = {id(item): index for index, item in enumerate(self.items)}
-        self.sorter.start_sorting(self.items)
+        self._remember_positions()
+        self._live_marks = None
+        self._top_k = limit
+        ranked = [item_id for item_id in self.items if self.store.is_ranked(item_id)]
+        fresh = [item_id for item_id in self.items if not self.store.is_ranked(item_id)]
+        if limit is not None:
+            self.sorter.start_sorting(self.items, limit=limit)
+        elif ranked and fresh:
+            # Only place the new arrivals instead of asking everything again.
+            self.sorter.add_items(DoneState(ranked), fresh)
+        else:
+            # Re-sorting a previous result: search from each item's old spot.
+            self.sorter.start_sorting(self.items, adaptive=bool(ranked))
         if self.sorter.current_pair() is None and not self.sorter.is_done():
             return
         self.show_compare_view()
 
+    def _remember_positions(self) -> None:
+        positions = array("l", [-1]) * self.store.capacity
+        for index, item_id in enumerate(self.items):
+            positions[item_id] = index
+        self._original_index = positions
+
     def _select_choice(self, choice: Choice) -> None:
         if self.mode != "compare":
             return
+        prepared = self._prepared.get(choice)
+        self._prepared = {}
         self.sorter.make_choice(choice)
+        if prepared is not None and self.sorter.current_pair() == prepared[0]:
+            # Only swap in the labels prepared while idle; progress and the
+            # live panel catch up once the new question is on screen.
+            self.left_button.configure(text=prepared[1])
+            self.right_button.configure(text=prepared[2])
+            self._catch_up = True
+            self._schedule_idle()
+            return
         self.update_compare_view()
 
+    def _undo_choice(self) -> None:
+        if self.mode != "compare":
+            return
+        if self.sorter.undo():
+            # Undoing the final answer leaves the results screen, so re-pack
+            # the comparison widgets instead of only relabelling them.
+            self.show_compare_view()
+
+    def _redo_choice(self) -> None:
+        if self.mode != "compare":
+            return
+        if self.sorter.redo():
+            self.update_compare_view()
+
     def update_compare_view(self) -> None:
+        self._prepared = {}
+        self._catch_up = False
         pair = self.sorter.current_pair()
         if pair:
             left, right = pair
             self.prompt_label.configure(text="Which one is more important?")
-            self.left_button.configure(text=left.description, state="normal")
-            self.right_button.configure(text=right.description, state="normal")
+            description = self.store.description
+            self.left_button.configure(text=description(left), state="normal")
+            self.right_button.configure(text=description(right), state="normal")
             self.results_frame.pack_forget()
             self.results_var.set("")
+            self._update_progress()
             self._refresh_state_view()
+            self._schedule_idle()
         elif self.sorter.is_done():
             # Hide the comparison controls and show the final ordered list
             self.prompt_label.pack_forget()
             self.body_frame.pack_forget()
             ordered = self.sorter.finish_sorting(self.items)
+            ranked = ordered if self._top_k is None else ordered[: self._top_k]
             listing = "\n".join(
-                f"{index + 1}. {item.description}" for index, item in enumerate(ordered)
+                f"{index + 1}. {self.store.description(item_id)}"
+                for index, item_id in enumerate(ranked)
             )
+            if len(ranked) < len(ordered):
+                self.results_title.configure(text=f"Top {len(ranked)}")
+                listing += "\n\nNot ranked:\n" + "\n".join(
+                    f"• {self.store.description(item_id)}"
+                    for item_id in ordered[len(ranked) :]
+                )
+            else:
+                self.results_title.configure(text="Sorted items")
             self.results_var.set(listing or "No items to show.")
             if not self.results_frame.winfo_ismapped():
                 self.results_frame.pack(fill="both", expand=True)
@@ -322,6 +769,38 @@ class PrioritySorterApp:
             self.results_var.set("")
             self._refresh_state_view()
 
+    def _schedule_idle(self) -> None:
+        if self._idle_job is None:
+            self._idle_job = self.root.after_idle(self._on_idle)
+
+    def _on_idle(self) -> None:
+        """Catch up after a fast-path click, then prepare both possible answers."""
+        self._idle_job = None
+        if self.mode != "compare" or self.sorter.current_pair() is None:
+            return
+        if self._catch_up:
+            self._catch_up = False
+            self._update_progress()
+            self._refresh_state_view()
+        description = self.store.description
+        prepared: Dict[Choice, Tuple[Tuple[int, int], str, str]] = {}
+        for choice, pair in self.sorter.lookahead().items():
+            if pair is not None:
+                prepared[choice] = (pair, description(pair[0]), description(pair[1]))
+        self._prepared = prepared
+
+    def _update_progress(self) -> None:
+        progress = self.sorter.progress()
+        self.progress_bar.configure(value=progress.fraction)
+        text = (
+            f"{progress.comparisons} answered, about "
+            f"{round(progress.expected_remaining)} to go "
+            f"(at most {progress.worst_remaining})"
+        )
+        if progress.eta_seconds is not None:
+            text += f"\nETA {_format_duration(progress.eta_seconds)}"
+        self.progress_var.set(text)
+
     def _on_toggle_state_view(self) -> None:
         # Show or hide the legend together with the live ordering.
         if self.show_state_var.get():
@@ -332,89 +811,74 @@ class PrioritySorterApp:
         self._refresh_state_view()
 
     def _refresh_state_view(self) -> None:
-        """Render the current best-known ordering with movement indicators."""
-        # Clear existing rows
-        for child in self.state_scroll.inner.winfo_children():
-            child.destroy()
+        """
+        Bring the live ordering up to date by re-binding only changed rows.
 
+        A choice that merely narrows the search window only moves the □
+        markers at the window edges. An insertion shifts rows and resets the
+        window, which touches every visible row but still nothing off-screen.
+        """
         if not self.show_state_var.get():
+            self._live_marks = None
+            self.state_list.set_count(0)
             return
 
-        # Inspect sorter internals to highlight the current item and search window.
-        current_id: int | None = None
-        lo: int | None = None
-        hi: int | None = None
-        sorted_len: int = 0
-        if isinstance(self.sorter.state, CompareState):
-            state = self.sorter.state
-            lo = state.lo
-            hi = state.hi
-            sorted_len = len(state.sorted)
-            if state.unsorted:
-                current_id = id(state.unsorted[-1])
-
-        snapshot = self.sorter.snapshot_ordering(self.items)
-        for index, item in enumerate(snapshot):
-            row = ttk.Frame(self.state_scroll.inner, padding=2)
-            row.pack(fill="x", pady=1)
-
-            original_index = self._original_index.get(id(item))
-            indicator = ""
-            color = None
-            if original_index is not None:
-                delta = original_index - index
-                if delta > 0:
-                    indicator = "↑"
-                    color = "#1a7f37"  # moved up (from below)
-                elif delta < 0:
-                    indicator = "↓"
-                    color = "#b42318"  # moved down (from above)
-                else:
-                    indicator = "•"
-                    color = "#6c6c6c"
-
-            # Visualize the binary-search step:
-            # - "●" marks the current item being inserted.
-            # - "□" marks the active search window in the sorted prefix.
-            status_symbol = ""
-            if current_id is not None and id(item) == current_id:
-                status_symbol = "●"
-            elif (
-                lo is not None
-                and hi is not None
-                and index < sorted_len
-                and lo <= index < hi
-            ):
-                status_symbol = "□"
-
-            if status_symbol:
-                status_label = ttk.Label(row, text=status_symbol, width=2)
-                status_label.pack(side="left")
-
-            arrow_label = ttk.Label(row, text=indicator, width=2)
-            if color is not None:
-                try:
-                    arrow_label.configure(foreground=color)
-                except tk.TclError:
-                    # Some themes may not support custom foreground; ignore.
-                    pass
-            arrow_label.pack(side="left")
-
-            text_label = ttk.Label(
-                row,
-                text=f"{index + 1}. {item.description}",
-                wraplength=160,
-                anchor="w",
-                justify="left",
-            )
-            text_label.pack(side="left", fill="x", expand=True)
+        self._live_view = self.sorter.ordering_view(self.items)
+        count = len(self._live_view)
+        marks = live_marks(self.sorter.state, count)
+        ranges = live_rows_to_refresh(self._live_marks, marks)
+        self._live_marks = marks
+        if ranges is None:
+            self.state_list.set_count(count)
+            self.state_list.refresh()
+            return
+        for start, stop in ranges:
+            self.state_list.refresh_range(start, stop)
+
+    def _bind_live_row(self, row: LiveRow, index: int) -> None:
+        """Render one row of the best-known ordering with movement indicators."""
+        if not self._live_view.is_valid():
+            # Scrolled after the sorter moved on but before the next refresh.
+            self._live_view = self.sorter.ordering_view(self.items)
+        item_id = self._live_view[index]
+        positions = self._original_index
+        original_index = positions[item_id] if item_id < len(positions) else -1
+        indicator = ""
+        color = None
+        if original_index >= 0:
+            delta = original_index - index
+            if delta > 0:
+                indicator = "↑"
+                color = "#1a7f37"  # moved up (from below)
+            elif delta < 0:
+                indicator = "↓"
+                color = "#b42318"  # moved down (from above)
+            else:
+                indicator = "•"
+                color = "#6c6c6c"
+
+        # Visualize the binary-search step.
+        marks = live_marks(self.sorter.state, len(self._live_view))
+        status_symbol = live_marker(index, marks)
+
+        row.show(f"{index + 1}. {self.store.description(item_id)}", status_symbol, indicator, color)
 
     def return_to_list(self) -> None:
         if self.mode == "compare":
+            state = self.sorter.state
+            for item_id in self.items:
+                self.store.set_ranked(item_id, False)
+            if isinstance(state, (DoneState, CompareState)):
+                # Even an abandoned session leaves a correctly ranked prefix.
+                for item_id in self._ranked_prefix(state):
+                    self.store.set_ranked(item_id, True)
             ordered = self.sorter.finish_sorting(self.items)
-            for item in ordered:
-                item.is_editing = False
+            for item_id in ordered:
+                self.store.set_editing(item_id, False)
             self.items = ordered
+            if not isinstance(state, DoneState):
+                # Leaving mid-sort: don't drop the user back into it on restart.
+                self._persist_items()
         self.show_list_view()
         self.refresh_items()
         self._update_sort_button()
@@ -423,6 +887,17 @@ class PrioritySorterApp:
         self.root.mainloop()
 
 
+def _format_duration(seconds: float) -> str:
+    total = max(0, round(seconds))
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
 def run_app() -> None:
-    app = PrioritySorterApp()
+    app = PrioritySorterApp(journal_path=DEFAULT_JOURNAL_PATH)
     app.run()
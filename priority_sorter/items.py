@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, Iterator, List
 
 
 @dataclass
@@ -15,6 +15,141 @@ class Item:
         return Item(self.description, self.is_editing)
 
 
+_EDITING = 1
+_RANKED = 2
+_REMOVED = 4
+
+
+class ItemStore:
+    """
+    Struct-of-arrays storage for many items, addressed by integer ids.
+
+    Descriptions live in one list and per-item flags in a bytearray, so an
+    item costs a list slot and a byte on top of its string instead of a whole
+    `Item` object with its `__dict__`. Ids are positions in those arrays and
+    are never reused, so they stay valid as keys and as indexes into flat
+    side arrays (see `capacity`) for the lifetime of the store. Sorters and
+    knowledge stores can work on the ids directly.
+    """
+
+    __slots__ = ("_descriptions", "_flags", "_live")
+
+    def __init__(self, descriptions: Iterable[str] = ()) -> None:
+        self._descriptions: List[str] = list(descriptions)
+        self._flags = bytearray(len(self._descriptions))
+        self._live = len(self._descriptions)
+
+    def add(self, description: str, is_editing: bool = False) -> int:
+        """Store a new item and return its id."""
+        item_id = len(self._descriptions)
+        self._descriptions.append(description)
+        self._flags.append(_EDITING if is_editing else 0)
+        self._live += 1
+        return item_id
+
+    def extend(self, descriptions: Iterable[str]) -> List[int]:
+        return [self.add(description) for description in descriptions]
+
+    def remove(self, item_id: int) -> None:
+        """Drop an item; its id is retired rather than handed out again."""
+        if item_id not in self:
+            raise KeyError(item_id)
+        self._descriptions[item_id] = ""
+        self._flags[item_id] = _REMOVED
+        self._live -= 1
+
+    def __contains__(self, item_id: object) -> bool:
+        return (
+            isinstance(item_id, int)
+            and 0 <= item_id < len(self._flags)
+            and not self._flags[item_id] & _REMOVED
+        )
+
+    def __len__(self) -> int:
+        """Number of items currently stored."""
+        return self._live
+
+    @property
+    def capacity(self) -> int:
+        """One past the largest id handed out; size flat per-id arrays with it."""
+        return len(self._descriptions)
+
+    def ids(self) -> Iterator[int]:
+        flags = self._flags
+        return (item_id for item_id in range(len(flags)) if not flags[item_id] & _REMOVED)
+
+    def description(self, item_id: int) -> str:
+        return self._descriptions[item_id]
+
+    def set_description(self, item_id: int, description: str) -> None:
+        self._descriptions[item_id] = description
+
+    def is_editing(self, item_id: int) -> bool:
+        return bool(self._flags[item_id] & _EDITING)
+
+    def set_editing(self, item_id: int, editing: bool) -> None:
+        self._set_flag(item_id, _EDITING, editing)
+
+    def is_ranked(self, item_id: int) -> bool:
+        """Whether the item's place came out of a finished or partial sort."""
+        return bool(self._flags[item_id] & _RANKED)
+
+    def set_ranked(self, item_id: int, ranked: bool) -> None:
+        self._set_flag(item_id, _RANKED, ranked)
+
+    def _set_flag(self, item_id: int, flag: int, value: bool) -> None:
+        if value:
+            self._flags[item_id] |= flag
+        else:
+            self._flags[item_id] &= ~flag & 0xFF
+
+    def handle(self, item_id: int) -> ItemHandle:
+        return ItemHandle(self, item_id)
+
+    def to_item(self, item_id: int) -> Item:
+        return Item(self.description(item_id), self.is_editing(item_id))
+
+
+class ItemHandle:
+    """`Item`-shaped view of one `ItemStore` entry; cheap to create and drop."""
+
+    __slots__ = ("store", "id")
+
+    def __init__(self, store: ItemStore, item_id: int) -> None:
+        self.store = store
+        self.id = item_id
+
+    @property
+    def description(self) -> str:
+        return self.store.description(self.id)
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self.store.set_description(self.id, value)
+
+    @property
+    def is_editing(self) -> bool:
+        return self.store.is_editing(self.id)
+
+    @is_editing.setter
+    def is_editing(self, value: bool) -> None:
+        self.store.set_editing(self.id, value)
+
+    def clone(self) -> Item:
+        return self.store.to_item(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ItemHandle):
+            return NotImplemented
+        return self.store is other.store and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.id))
+
+    def __repr__(self) -> str:
+        return f"ItemHandle({self.id}, {self.description!r})"
+
+
 DEFAULT_ITEM_LABELS: List[str] = [
     "Study for algorithms class",
     "Study for other classes",
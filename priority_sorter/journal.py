@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generic, List, Sequence, Tuple, TypeVar
+
+from .sorter import Choice, CompareState, DoneState, EmptyState, SortState, StepRecord
+
+
+T = TypeVar("T")
+
+# Upper case for answers the user gave, lower case for ones the knowledge
+# store inferred, and "U" for stepping one choice back.
+_CHOICE_CODES = {
+    (Choice.LEFT, False): b"L\n",
+    (Choice.RIGHT, False): b"R\n",
+    (Choice.LEFT, True): b"l\n",
+    (Choice.RIGHT, True): b"r\n",
+}
+_UNDO_CODE = b"U\n"
+_CODE_ENTRIES = {
+    code.decode("ascii").strip(): entry for entry, code in _CHOICE_CODES.items()
+}
+
+_ARRIVAL_PREFIX = b"+"
+
+# Undo steps a snapshot keeps, so undo and resume reach back past compactions.
+HISTORY_DEPTH = 1000
+
+
+@dataclass
+class Arrival(Generic[T]):
+    """An item a streamed session pulled onto its pending stack."""
+
+    item: T
+
+
+# (choice, inferred) for an applied choice, None for an undo, or an Arrival.
+JournalEntry = Tuple[Choice, bool] | Arrival[Any] | None
+
+
+@dataclass
+class Recording(Generic[T]):
+    """What `ChoiceJournal.load` found: the snapshot and the entries after it."""
+
+    state: SortState[T]
+    entries: List[JournalEntry]
+    # Undo steps leading up to `state`, oldest first, and the answer count.
+    history: List[StepRecord[T]]
+    answered: int = 0
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class ChoiceJournal(Generic[T]):
+    """
+    Append-only on-disk record of a sorting session.
+
+    The file starts with one JSON snapshot of the sorter state followed by one
+    two-byte line per applied or undone choice, so recording a decision is a
+    single small unbuffered write. Items a streamed session pulls in later
+    are logged as `+` lines holding their JSON. Every `snapshot_every` lines the log is
+    compacted into a fresh snapshot, written to a temporary file and swapped
+    in atomically, which keeps replay on resume short. A snapshot also keeps
+    the answer count and the last `HISTORY_DEPTH` undo steps, so taking back
+    a choice it already folded in is still a one-line append.
+
+    `encode` / `decode` convert items to and from JSON-friendly values.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        encode: Callable[[T], Any] = _identity,
+        decode: Callable[[Any], T] = _identity,
+        snapshot_every: int = 1000,
+        fsync: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self._encode = encode
+        self._decode = decode
+        self.snapshot_every = max(1, snapshot_every)
+        self.fsync = fsync
+        self._handle: BinaryIO | None = None
+        # Lines since the last snapshot, and how many choices they net out to.
+        self._pending = 0
+        self._replayable = 0
+        # Undo steps stored in the last snapshot.
+        self._kept = 0
+
+    def snapshot(
+        self, state: SortState[T], history: Sequence[StepRecord[T]] = (), answered: int = 0
+    ) -> None:
+        """Replace the journal with a single snapshot of `state` and its history."""
+        self.close()
+        record = self._encode_state(state)
+        kept = history[-HISTORY_DEPTH:]
+        if kept:
+            record["answered"] = answered
+            record["history"] = [_encode_step(step) for step in kept]
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, "wb") as handle:
+            handle.write(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+            handle.write(b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.path)
+        self._pending = 0
+        self._replayable = 0
+        self._kept = len(kept)
+
+    def append(
+        self,
+        choice: Choice,
+        state: SortState[T],
+        inferred: bool = False,
+        history: Sequence[StepRecord[T]] = (),
+        answered: int = 0,
+    ) -> None:
+        """
+        Record one applied choice.
+
+        `state`, `history` and `answered` describe the sorter right after it
+        and are only read when the log is due for compaction.
+        """
+        self._write(_CHOICE_CODES[choice, inferred])
+        self._replayable += 1
+        self._after_write(state, history, answered)
+
+    def arrive(self, item: T) -> None:
+        """Record an item pulled from a streamed session's source."""
+        encoded = json.dumps(self._encode(item), separators=(",", ":"))
+        self._write(_ARRIVAL_PREFIX + encoded.encode("utf-8") + b"\n")
+        # Arrivals happen mid-step, so they never trigger a compaction on
+        # their own; the choice logged right after them may.
+        self._pending += 1
+
+    def undo(
+        self, state: SortState[T], history: Sequence[StepRecord[T]] = (), answered: int = 0
+    ) -> None:
+        """Record that the latest choice was taken back, leaving `state`."""
+        if self._replayable + self._kept <= 0:
+            # Older than anything the snapshot remembers: replace it.
+            self.snapshot(state, history, answered)
+            return
+        # Resume takes the step back from the snapshot's history if need be.
+        self._write(_UNDO_CODE)
+        self._replayable -= 1
+        self._after_write(state, history, answered)
+
+    def _after_write(
+        self, state: SortState[T], history: Sequence[StepRecord[T]], answered: int
+    ) -> None:
+        self._pending += 1
+        if self._pending >= self.snapshot_every:
+            self.snapshot(state, history, answered)
+
+    def _write(self, payload: bytes) -> None:
+        if self._handle is None:
+            self._handle = open(self.path, "ab", buffering=0)
+        self._handle.write(payload)
+        if self.fsync:
+            os.fsync(self._handle.fileno())
+
+    def load(self) -> Recording[T] | None:
+        """
+        Return the last snapshot and the entries recorded after it.
+
+        Returns None when there is no journal yet. A torn final line left by a
+        crash mid-write is ignored.
+        """
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        lines = raw.split(b"\n")
+        # Everything after the last newline is either empty or a torn write.
+        complete = lines[:-1]
+        if not complete:
+            return None
+        record = json.loads(complete[0])
+        state = self._decode_state(record)
+        history = [_decode_step(step, state) for step in record.get("history", ())]
+        entries: List[JournalEntry] = []
+        for line in complete[1:]:
+            if not line:
+                continue
+            if line.startswith(_ARRIVAL_PREFIX):
+                entries.append(Arrival(self._decode(json.loads(line[1:]))))
+            elif line == _UNDO_CODE.strip():
+                entries.append(None)
+            else:
+                entries.append(_CODE_ENTRIES[line.decode("ascii")])
+        self._pending = len(entries)
+        self._replayable = 0
+        for entry in entries:
+            if entry is None:
+                self._replayable -= 1
+            elif not isinstance(entry, Arrival):
+                self._replayable += 1
+        self._kept = len(history)
+        return Recording(state, entries, history, record.get("answered", 0))
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _encode_state(self, state: SortState[T]) -> dict[str, Any]:
+        encode = self._encode
+        if isinstance(state, CompareState):
+            return {
+                "state": "compare",
+                "sorted": [encode(item) for item in state.sorted],
+                "unsorted": [encode(item) for item in state.unsorted],
+                "lo": state.lo,
+                "hi": state.hi,
+                "limit": state.limit,
+                "adaptive": state.adaptive,
+                "finger": state.finger,
+                "stride": state.stride,
+            }
+        if isinstance(state, DoneState):
+            return {
+                "state": "done",
+                "sorted": [encode(item) for item in state.sorted],
+                "limit": state.limit,
+            }
+        return {"state": "empty", "items": [encode(item) for item in state.items]}
+
+    def _decode_state(self, record: dict[str, Any]) -> SortState[T]:
+        decode = self._decode
+        kind = record["state"]
+        if kind == "compare":
+            return CompareState(
+                unsorted=[decode(item) for item in record["unsorted"]],
+                sorted=[decode(item) for item in record["sorted"]],
+                lo=record["lo"],
+                hi=record["hi"],
+                limit=record.get("limit"),
+                adaptive=record.get("adaptive", False),
+                finger=record.get("finger"),
+                stride=record.get("stride", 0),
+            )
+        if kind == "done":
+            return DoneState(
+                [decode(item) for item in record["sorted"]], record.get("limit")
+            )
+        return EmptyState([decode(item) for item in record["items"]])
+
+
+def _encode_step(step: StepRecord[Any]) -> List[Any]:
+    code = _CHOICE_CODES[step.choice, step.inferred].decode("ascii").strip()
+    # Only a final step has `finished`; the flag is all it takes to rebuild it.
+    finished = None if step.finished is None else step.finished.adaptive
+    return [code, step.lo, step.hi, step.finger, step.stride, step.inserted_at, finished]
+
+
+def _decode_step(encoded: List[Any], state: SortState[Any]) -> StepRecord[Any]:
+    code, lo, hi, finger, stride, inserted_at, finished = encoded
+    choice, inferred = _CODE_ENTRIES[code]
+    step: StepRecord[Any] = StepRecord(
+        choice, lo, hi, finger, stride, inserted_at, inferred=inferred
+    )
+    if finished is not None and isinstance(state, DoneState):
+        # The live state the session finished from; undo restores its window.
+        step.finished = CompareState(
+            unsorted=[], sorted=state.sorted, lo=lo, hi=hi, limit=state.limit, adaptive=finished
+        )
+    return step
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Generic, Hashable, List, Set, Tuple, TypeVar
+
+from .sorter import Choice
+
+
+T = TypeVar("T")
+
+# (upper key, keys it newly outranks) for every pair one `record` added.
+Learned = List[Tuple[Hashable, Set[Hashable]]]
+
+
+class ComparisonKnowledge(Generic[T]):
+    """
+    Transitively closed memory of every answer the user has given.
+
+    Items are identified by `key(item)` (object identity by default), so the
+    same store can be shared across sorting sessions. Each recorded answer is
+    expanded to everything it implies, which keeps lookups O(1) at the cost of
+    up to n²/2 stored pairs once a full order is known.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable] = id) -> None:
+        self._key = key
+        # key -> keys it outranks / keys that outrank it.
+        self._below: Dict[Hashable, Set[Hashable]] = {}
+        self._above: Dict[Hashable, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def outranks(self, left: T, right: T) -> bool | None:
+        """Return whether `left` is known to outrank `right`, or None if unknown."""
+        left_key, right_key = self._key(left), self._key(right)
+        if right_key in self._below.get(left_key, ()):
+            return True
+        if left_key in self._below.get(right_key, ()):
+            return False
+        return None
+
+    def lookup(self, left: T, right: T) -> Choice | None:
+        """Answer a `current_pair` question if it is implied, counting hits and misses."""
+        known = self.outranks(left, right)
+        if known is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Choice.LEFT if known else Choice.RIGHT
+
+    def record(self, winner: T, loser: T) -> Learned:
+        """
+        Store `winner` outranking `loser` together with its transitive closure.
+
+        Returns exactly the pairs that were new, which `retract` accepts to
+        take the answer back again.
+        """
+        winner_key, loser_key = self._key(winner), self._key(loser)
+        if winner_key == loser_key:
+            return []
+        if winner_key in self._below.get(loser_key, ()):
+            raise ValueError("answer contradicts an earlier comparison")
+
+        uppers = {winner_key, *self._above.get(winner_key, ())}
+        lowers = {loser_key, *self._below.get(loser_key, ())}
+        learned: Learned = []
+        for upper in uppers:
+            known = self._below.setdefault(upper, set())
+            fresh = lowers - known
+            if fresh:
+                known.update(fresh)
+                learned.append((upper, fresh))
+                for lower in fresh:
+                    self._above.setdefault(lower, set()).add(upper)
+        return learned
+
+    def record_choice(self, pair: tuple[T, T], choice: Choice) -> Learned:
+        left, right = pair
+        if choice == Choice.LEFT:
+            return self.record(left, right)
+        return self.record(right, left)
+
+    def retract(self, learned: Learned) -> None:
+        """Undo the most recent `record` call that returned `learned`."""
+        for upper, lowers in learned:
+            self._below.get(upper, set()).difference_update(lowers)
+            for lower in lowers:
+                self._above.get(lower, set()).discard(upper)
+
+    def forget(self, item: T) -> None:
+        """
+        Drop everything known about `item`, e.g. after its description changed.
+
+        Facts between other items that were inferred through it stay valid:
+        they still follow from answers the user actually gave.
+        """
+        key = self._key(item)
+        for lower in self._below.pop(key, ()):
+            self._above[lower].discard(key)
+        for upper in self._above.pop(key, ()):
+            self._below[upper].discard(key)
+
+    def clear(self) -> None:
+        self._below.clear()
+        self._above.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of ordered pairs currently known."""
+        return sum(len(lowers) for lowers in self._below.values())
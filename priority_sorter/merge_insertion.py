@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generator, Generic, Iterable, List, Sequence, Tuple, TypeVar
+
+from .sorter import Choice, DoneState, EmptyState
+
+
+T = TypeVar("T")
+
+# Yields (left, right) index pairs and receives True when `left` outranks
+# `right`; returns the indices ordered from most to least important.
+Steps = Generator[Tuple[int, int], bool, List[int]]
+
+
+@dataclass
+class MergeState(Generic[T]):
+    """Represents an ongoing merge-insertion session."""
+
+    items: List[T]
+    steps: Steps
+    pair: Tuple[int, int]
+
+
+MergeSortState = EmptyState[T] | MergeState[T] | DoneState[T]
+
+
+def _merge_insertion(indices: List[int]) -> Steps:
+    if len(indices) <= 1:
+        return list(indices)
+
+    # Pair everything up; the loser of each pair joins the recursively sorted
+    # main chain while the winner waits to be inserted in front of it.
+    winners: dict[int, int] = {}
+    losers: List[int] = []
+    for position in range(0, len(indices) - 1, 2):
+        left, right = indices[position], indices[position + 1]
+        if (yield left, right):
+            winners[right] = left
+            losers.append(right)
+        else:
+            winners[left] = right
+            losers.append(left)
+    straggler = indices[-1] if len(indices) % 2 else None
+
+    chain = yield from _merge_insertion(losers)
+    # (winner, partner) in chain order; the first winner precedes its partner
+    # without needing a question.
+    pending: List[Tuple[int, int | None]] = [(winners[loser], loser) for loser in chain]
+    if straggler is not None:
+        pending.append((straggler, None))
+    chain = [pending[0][0], *chain]
+
+    boundary, span = 1, 1
+    while boundary < len(pending):
+        boundary, span = boundary + 2 * span, boundary
+        # Jacobsthal numbers 1, 3, 5, 11, 21, ... bound each group so every
+        # binary search runs over a chain of at most 2**k - 1 elements.
+        for number in range(min(boundary, len(pending)), span, -1):
+            item, partner = pending[number - 1]
+            lo = 0
+            hi = len(chain) if partner is None else chain.index(partner)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if (yield item, chain[mid]):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            chain.insert(lo, item)
+    return chain
+
+
+class MergeInsertionSorter(Generic[T]):
+    """
+    Interactive sorter using Ford–Johnson merge insertion.
+
+    Exposes the same `start_sorting` / `current_pair` / `make_choice` /
+    `finish_sorting` protocol as `PairwiseSorter`, but asks close to the
+    information-theoretic minimum number of questions. The price is that no
+    meaningful partial order exists until the very end, so mid-session
+    snapshots fall back to the input order.
+    """
+
+    def __init__(self) -> None:
+        self.state: MergeSortState[T] = EmptyState([])
+
+    def snapshot_ordering(self, fallback: Iterable[T] | None = None) -> List[T]:
+        """Return the best-known ordering *without* mutating internal state."""
+        if isinstance(self.state, DoneState):
+            return list(self.state.sorted)
+        if isinstance(self.state, MergeState):
+            return list(self.state.items)
+        if fallback is None:
+            return list(self.state.items)
+        return list(fallback)
+
+    def start_sorting(self, items: Sequence[T]) -> None:
+        """Initialize the sorter with a fresh batch of items."""
+        data = list(items)
+        steps = _merge_insertion(list(range(len(data))))
+        self._advance(data, steps, lambda: next(steps))
+
+    def make_choice(self, choice: Choice) -> None:
+        """Apply the user's decision and advance to the next question."""
+        if not isinstance(self.state, MergeState):
+            return
+        state = self.state
+        self._advance(
+            state.items, state.steps, lambda: state.steps.send(choice == Choice.LEFT)
+        )
+
+    def _advance(
+        self, items: List[T], steps: Steps, resume: Callable[[], Tuple[int, int]]
+    ) -> None:
+        try:
+            pair = resume()
+        except StopIteration as finished:
+            self.state = DoneState([items[index] for index in finished.value])
+            return
+        self.state = MergeState(items=items, steps=steps, pair=pair)
+
+    def finish_sorting(self, fallback: Iterable[T] | None = None) -> List[T]:
+        """Return the best-known ordering, mirroring `PairwiseSorter`."""
+        return self.snapshot_ordering(fallback)
+
+    def current_pair(self) -> Tuple[T, T] | None:
+        """Return the active comparison pair (item being placed, pivot)."""
+        if not isinstance(self.state, MergeState):
+            return None
+        left, right = self.state.pair
+        return self.state.items[left], self.state.items[right]
+
+    def is_done(self) -> bool:
+        return isinstance(self.state, DoneState)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import bisect
+import os
+import weakref
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, TypeVar
+
+from .sorter import Choice, PairwiseSorter, SorterObserver
+
+
+T = TypeVar("T")
+
+DECISION_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+TRANSITION_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 0.1)
+QUESTIONS_BUCKETS = (0.0, 1.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 16.0, 20.0)
+SESSION_BUCKETS = (10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0)
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram rendered in the Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = sorted(buckets)
+        # One slot per bound plus the implicit +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {running}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class PrometheusMetrics(SorterObserver[T]):
+    """
+    Observer that aggregates sorter events into Prometheus histograms.
+
+    Tracks how long the user takes per answer, how many answers each item
+    needed before it was placed, how long the sorter itself spends between an
+    answer and the next question, and whole-session durations. When `path`
+    is set, the metrics file is rewritten atomically whenever a session
+    finishes, which suits node_exporter's textfile collector (use a `.prom`
+    name). Attach one instance to any number of sorters.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = None if path is None else Path(path)
+        self.decision_seconds = Histogram(
+            "priority_sorter_decision_seconds",
+            "Time from a question being shown to the user answering it.",
+            DECISION_BUCKETS,
+        )
+        self.transition_seconds = Histogram(
+            "priority_sorter_transition_seconds",
+            "Time the sorter spends between an answer and the next question.",
+            TRANSITION_BUCKETS,
+        )
+        self.questions_per_item = Histogram(
+            "priority_sorter_questions_per_item",
+            "User answers needed to place one item.",
+            QUESTIONS_BUCKETS,
+        )
+        self.session_seconds = Histogram(
+            "priority_sorter_session_seconds",
+            "Wall time from session start to the final insertion.",
+            SESSION_BUCKETS,
+        )
+        self.sessions_started = 0
+        self.sessions_finished = 0
+        self.choices: Dict[Tuple[Choice, bool], int] = {}
+        # Per-sorter bookkeeping, keyed by id() so sorters need not be hashable.
+        # Entries are dropped when their sorter is collected, so abandoned
+        # sessions do not pile up and a recycled id() starts clean.
+        self._asked_at: Dict[int, float] = {}
+        self._answered_at: Dict[int, float] = {}
+        self._started_at: Dict[int, float] = {}
+        self._questions: Dict[int, int] = {}
+        self._finalizers: Dict[int, weakref.finalize] = {}
+
+    def on_start(self, sorter: PairwiseSorter[T], timestamp: float) -> None:
+        key = id(sorter)
+        self._forget(key)
+        self._finalizers[key] = weakref.finalize(sorter, self._forget, key)
+        self.sessions_started += 1
+        self._started_at[key] = timestamp
+        self._questions[key] = 0
+
+    def on_question(self, sorter: PairwiseSorter[T], pair: Tuple[T, T], timestamp: float) -> None:
+        key = id(sorter)
+        self._close_transition(key, timestamp)
+        self._asked_at[key] = timestamp
+
+    def on_choice(
+        self,
+        sorter: PairwiseSorter[T],
+        pair: Tuple[T, T],
+        choice: Choice,
+        inferred: bool,
+        timestamp: float,
+    ) -> None:
+        self.choices[choice, inferred] = self.choices.get((choice, inferred), 0) + 1
+        if inferred:
+            return
+        key = id(sorter)
+        asked_at = self._asked_at.pop(key, None)
+        if asked_at is not None:
+            self.decision_seconds.observe(timestamp - asked_at)
+        self._answered_at[key] = timestamp
+        self._questions[key] = self._questions.get(key, 0) + 1
+
+    def on_insert(
+        self, sorter: PairwiseSorter[T], item: T, position: int, timestamp: float
+    ) -> None:
+        self.questions_per_item.observe(self._questions.get(id(sorter), 0))
+        self._questions[id(sorter)] = 0
+
+    def on_done(self, sorter: PairwiseSorter[T], timestamp: float) -> None:
+        key = id(sorter)
+        self._close_transition(key, timestamp)
+        started_at = self._started_at.pop(key, None)
+        if started_at is not None:
+            self.session_seconds.observe(timestamp - started_at)
+            self.sessions_finished += 1
+        self._asked_at.pop(key, None)
+        self._questions.pop(key, None)
+        if self.path is not None:
+            self.write()
+
+    def _forget(self, key: int) -> None:
+        finalizer = self._finalizers.pop(key, None)
+        if finalizer is not None:
+            finalizer.detach()
+        self._asked_at.pop(key, None)
+        self._answered_at.pop(key, None)
+        self._started_at.pop(key, None)
+        self._questions.pop(key, None)
+
+    def _close_transition(self, key: int, timestamp: float) -> None:
+        answered_at = self._answered_at.pop(key, None)
+        if answered_at is not None:
+            self.transition_seconds.observe(timestamp - answered_at)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = [
+            "# HELP priority_sorter_sessions_started_total Sorting sessions started.",
+            "# TYPE priority_sorter_sessions_started_total counter",
+            f"priority_sorter_sessions_started_total {self.sessions_started}",
+            "# HELP priority_sorter_sessions_finished_total Sorting sessions finished.",
+            "# TYPE priority_sorter_sessions_finished_total counter",
+            f"priority_sorter_sessions_finished_total {self.sessions_finished}",
+            "# HELP priority_sorter_choices_total Applied choices by answer and source.",
+            "# TYPE priority_sorter_choices_total counter",
+        ]
+        for choice in Choice:
+            for inferred, source in ((False, "user"), (True, "inferred")):
+                count = self.choices.get((choice, inferred), 0)
+                lines.append(
+                    f'priority_sorter_choices_total{{choice="{choice.value}",'
+                    f'source="{source}"}} {count}'
+                )
+        for histogram in (
+            self.decision_seconds,
+            self.transition_seconds,
+            self.questions_per_item,
+            self.session_seconds,
+        ):
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Atomically replace the metrics file with the current values."""
+        target = self.path if path is None else Path(path)
+        if target is None:
+            raise ValueError("no metrics path configured")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_text(self.render(), encoding="utf-8")
+        os.replace(temporary, target)
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .journal import ChoiceJournal
+from .sorter import Choice, PairwiseSorter
+
+logger = logging.getLogger(__name__)
+
+_SESSION_ID = re.compile(r"[0-9a-f]{32}")
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    414: "URI Too Long",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+Response = Tuple[int, Dict[str, Any]]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class SessionStore:
+    """
+    Sorting sessions keyed by id, with at most `capacity` held in memory.
+
+    Every session records its choices in its own `ChoiceJournal` under
+    `directory`, one small append per answer, so the file on disk is always
+    current. Sessions are kept in least-recently-used order; touching one past
+    the capacity simply drops the coldest from memory, and the next request
+    for it resumes it from its journal with its answer count and undo
+    history intact. Journal files are closed between requests, so resident
+    sessions hold no open file handles.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self._resident: OrderedDict[str, PairwiseSorter[Any]] = OrderedDict()
+        self.evictions = 0
+        self.restores = 0
+
+    def __len__(self) -> int:
+        """Number of sessions currently held in memory."""
+        return len(self._resident)
+
+    def _journal(self, session_id: str) -> ChoiceJournal[Any]:
+        return ChoiceJournal(self.directory / f"{session_id}.json")
+
+    def create(self, items: List[Any], limit: int | None = None) -> Tuple[str, PairwiseSorter[Any]]:
+        session_id = uuid.uuid4().hex
+        sorter: PairwiseSorter[Any] = PairwiseSorter(journal=self._journal(session_id))
+        sorter.start_sorting(items, limit=limit)
+        self._admit(session_id, sorter)
+        return session_id, sorter
+
+    def get(self, session_id: str) -> PairwiseSorter[Any]:
+        """Return a session, restoring it from disk if it was evicted."""
+        sorter = self._resident.get(session_id)
+        if sorter is not None:
+            self._resident.move_to_end(session_id)
+            return sorter
+        if not _SESSION_ID.fullmatch(session_id):
+            raise KeyError(session_id)
+        sorter = PairwiseSorter(journal=self._journal(session_id))
+        try:
+            resumed = sorter.resume()
+        except Exception:
+            # A damaged journal is the server's fault, not a bad request.
+            logger.exception("cannot restore session %s", session_id)
+            raise HTTPError(500, "session journal is unreadable") from None
+        if not resumed:
+            raise KeyError(session_id)
+        self.restores += 1
+        self._admit(session_id, sorter)
+        return sorter
+
+    def release(self, sorter: PairwiseSorter[Any]) -> None:
+        """Close a session's journal file until its next write reopens it."""
+        if sorter.journal is not None:
+            sorter.journal.close()
+
+    def delete(self, session_id: str) -> None:
+        sorter = self._resident.pop(session_id, None)
+        known = sorter is not None
+        if sorter is not None:
+            self.release(sorter)
+        if _SESSION_ID.fullmatch(session_id):
+            try:
+                (self.directory / f"{session_id}.json").unlink()
+                known = True
+            except FileNotFoundError:
+                pass
+        if not known:
+            raise KeyError(session_id)
+
+    def flush(self) -> None:
+        """Close every resident session's journal, e.g. before shutting down."""
+        for sorter in self._resident.values():
+            self.release(sorter)
+
+    def _admit(self, session_id: str, sorter: PairwiseSorter[Any]) -> None:
+        self._resident[session_id] = sorter
+        while len(self._resident) > self.capacity:
+            # Its journal is already up to date; there is nothing to write.
+            _, evicted = self._resident.popitem(last=False)
+            self.release(evicted)
+            self.evictions += 1
+
+
+def _session_view(session_id: str, sorter: PairwiseSorter[Any]) -> Dict[str, Any]:
+    """O(log n) summary of a session: never includes the whole ordering."""
+    pair = sorter.current_pair()
+    progress = sorter.progress()
+    return {
+        "id": session_id,
+        "done": sorter.is_done(),
+        "question": None if pair is None else {"left": pair[0], "right": pair[1]},
+        "comparisons": progress.comparisons,
+        "remaining": progress.worst_remaining,
+    }
+
+
+class SortingServer:
+    """
+    Minimal asyncio HTTP/1.1 JSON service hosting many sorting sessions.
+
+    Routes:
+
+    - `POST /sessions` with `{"items": [...], "limit": k}` starts a session.
+    - `GET /sessions/<id>` returns its current question and progress.
+    - `POST /sessions/<id>/choice` with `{"choice": "left" | "right"}`.
+    - `POST /sessions/<id>/undo` takes back the latest answer.
+    - `GET /sessions/<id>/ordering` returns the best-known ordering.
+    - `DELETE /sessions/<id>` forgets the session.
+
+    Connections are kept alive, so a client can answer a whole session over
+    one socket. Requests are dispatched on a single worker thread, so journal
+    writes and restores never stall the event loop while the store is still
+    only touched by one thread. Bind to port 0 to let the OS pick a free port.
+    """
+
+    def __init__(
+        self,
+        store: SessionStore,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_body: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.store = store
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self._server: asyncio.Server | None = None
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sessions")
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._worker.shutdown()
+        self.store.flush()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    try:
+                        request_line = await reader.readline()
+                    except ValueError:
+                        raise HTTPError(414, "request line too long") from None
+                    if not request_line.strip():
+                        break
+                    headers = await _read_headers(reader)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                    body = await self._read_body(reader, headers)
+                    status, payload = await loop.run_in_executor(
+                        self._worker, self.dispatch, method, target, body
+                    )
+                except HTTPError as error:
+                    status, payload = error.status, {"error": str(error)}
+                    keep_alive = False
+                except ValueError as error:
+                    status, payload = 400, {"error": str(error)}
+                    keep_alive = False
+                except Exception:
+                    logger.exception("unhandled error while serving a request")
+                    status, payload = 500, {"error": "internal server error"}
+                    keep_alive = False
+                writer.write(_encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> Any:
+        length = int(headers.get("content-length", "0"))
+        if length > self.max_body:
+            raise HTTPError(413, "request body too large")
+        if not length:
+            return None
+        return json.loads(await reader.readexactly(length))
+
+    def dispatch(self, method: str, target: str, body: Any) -> Response:
+        """Route one request; usable directly without a socket."""
+        parts = [part for part in target.split("?", 1)[0].split("/") if part]
+        if not parts or parts[0] != "sessions":
+            raise HTTPError(404, "no such route")
+        if len(parts) == 1:
+            if method != "POST":
+                raise HTTPError(405, "use POST to start a session")
+            return self._create(body)
+
+        session_id = parts[1]
+        action = parts[2] if len(parts) == 3 else None
+        if len(parts) > 3:
+            raise HTTPError(404, "no such route")
+        try:
+            if method == "DELETE" and action is None:
+                self.store.delete(session_id)
+                return 200, {"id": session_id, "deleted": True}
+            sorter = self.store.get(session_id)
+        except KeyError:
+            raise HTTPError(404, "no such session") from None
+
+        if method == "GET" and action is None:
+            return 200, _session_view(session_id, sorter)
+        if method == "GET" and action == "ordering":
+            return 200, {"id": session_id, "ordering": sorter.snapshot_ordering()}
+        if method == "POST" and action == "choice":
+            choice = body.get("choice") if isinstance(body, dict) else None
+            if choice not in ("left", "right"):
+                raise ValueError('expected {"choice": "left" | "right"}')
+            sorter.make_choice(Choice.LEFT if choice == "left" else Choice.RIGHT)
+            self.store.release(sorter)
+            return 200, _session_view(session_id, sorter)
+        if method == "POST" and action == "undo":
+            sorter.undo()
+            self.store.release(sorter)
+            return 200, _session_view(session_id, sorter)
+        if action in (None, "ordering", "choice", "undo"):
+            raise HTTPError(405, "method not allowed")
+        raise HTTPError(404, "no such route")
+
+    def _create(self, body: Any) -> Response:
+        if not isinstance(body, dict) or not isinstance(body.get("items"), list):
+            raise ValueError('expected {"items": [...]}')
+        limit = body.get("limit")
+        if limit is not None and (
+            isinstance(limit, bool) or not isinstance(limit, int) or limit < 1
+        ):
+            raise ValueError("limit must be a positive integer")
+        session_id, sorter = self.store.create(body["items"], limit)
+        return 201, _session_view(session_id, sorter)
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(431, "header line too long") from None
+        if not line or line in (b"\r\n", b"\n"):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def _encode_response(status: int, payload: Dict[str, Any], keep_alive: bool) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
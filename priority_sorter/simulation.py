@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import bisect
+import os
+import random
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from .containers import BlockedList
+from .merge_insertion import MergeInsertionSorter
+from .sorter import Choice, PairwiseSorter, expected_max_comparisons
+
+# (strategy, n, seed, noise): answers are flipped with probability `noise`.
+Trial = Tuple[str, int, int, float]
+# Trial fields followed by (comparisons, inversions left in the result).
+TrialResult = Tuple[str, int, int, float, int, int]
+
+Prefer = Callable[[int, int], bool]
+
+
+def _insertion(items: List[int], prefer: Prefer) -> List[int]:
+    return PairwiseSorter().sort_with(items, prefer)
+
+
+def _blocked_insertion(items: List[int], prefer: Prefer) -> List[int]:
+    return PairwiseSorter(BlockedList).sort_with(items, prefer)
+
+
+def _merge_insertion(items: List[int], prefer: Prefer) -> List[int]:
+    sorter: MergeInsertionSorter[int] = MergeInsertionSorter()
+    sorter.start_sorting(items)
+    while (pair := sorter.current_pair()) is not None:
+        sorter.make_choice(Choice.LEFT if prefer(*pair) else Choice.RIGHT)
+    return sorter.finish_sorting()
+
+
+def _bradley_terry(items: List[int], prefer: Prefer) -> List[int]:
+    from .bradley_terry import BradleyTerrySorter
+
+    sorter: BradleyTerrySorter[int] = BradleyTerrySorter()
+    sorter.start_sorting(items)
+    while (pair := sorter.current_pair()) is not None:
+        sorter.make_choice(Choice.LEFT if prefer(*pair) else Choice.RIGHT)
+    return sorter.finish_sorting()
+
+
+# Workers look strategies up by name, so only names cross process borders.
+STRATEGIES: Dict[str, Callable[[List[int], Prefer], List[int]]] = {
+    "insertion": _insertion,
+    "blocked_insertion": _blocked_insertion,
+    "merge_insertion": _merge_insertion,
+    "bradley_terry": _bradley_terry,
+}
+
+
+def count_inversions(ordering: Sequence[int]) -> int:
+    """Pairs of `ordering` (best first) that are out of descending order."""
+    seen: List[int] = []
+    inversions = 0
+    for value in ordering:
+        # Earlier values smaller than this one should have come after it.
+        inversions += bisect.bisect_left(seen, value)
+        bisect.insort(seen, value)
+    return inversions
+
+
+def run_trial(trial: Trial) -> TrialResult:
+    """Sort a seeded shuffle of range(n) with a simulated, possibly noisy judge."""
+    strategy, n, seed, noise = trial
+    items = list(range(n))
+    random.Random(seed).shuffle(items)
+    flips = random.Random(f"{seed}:{noise}")
+    comparisons = 0
+
+    def prefer(left: int, right: int) -> bool:
+        nonlocal comparisons
+        comparisons += 1
+        outranks = left > right
+        if noise and flips.random() < noise:
+            return not outranks
+        return outranks
+
+    ordering = STRATEGIES[strategy](items, prefer)
+    return strategy, n, seed, noise, comparisons, count_inversions(ordering)
+
+
+def _run_chunk(trials: List[Trial]) -> List[TrialResult]:
+    return [run_trial(trial) for trial in trials]
+
+
+def trial_grid(
+    strategies: Iterable[str], sizes: Iterable[int], seeds: int, noises: Iterable[float] = (0.0,)
+) -> Iterator[Trial]:
+    """Every (strategy, n, seed, noise) combination, seeds numbered from 0."""
+    strategies = list(strategies)
+    for strategy in strategies:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}")
+    sizes = list(sizes)
+    noises = list(noises)
+    return (
+        (strategy, n, seed, noise)
+        for strategy in strategies
+        for n in sizes
+        for noise in noises
+        for seed in range(seeds)
+    )
+
+
+def run_trials(
+    trials: Iterable[Trial], workers: int | None = None, chunk_size: int = 16
+) -> Iterator[List[TrialResult]]:
+    """
+    Run `trials` on a process pool and yield result chunks as they finish.
+
+    Trials are sent in chunks of `chunk_size` and at most two chunks per
+    worker are in flight, so neither the grid nor its results need to fit in
+    memory at once. Chunks arrive in completion order, not submission order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        ahead = 2 * workers
+        pending: Set[Future[List[TrialResult]]] = set()
+        chunk: List[Trial] = []
+
+        def drain(limit: int) -> Iterator[List[TrialResult]]:
+            nonlocal pending
+            while len(pending) > limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        for trial in trials:
+            chunk.append(trial)
+            if len(chunk) == chunk_size:
+                pending.add(pool.submit(_run_chunk, chunk))
+                chunk = []
+                yield from drain(ahead)
+        if chunk:
+            pending.add(pool.submit(_run_chunk, chunk))
+        yield from drain(0)
+
+
+@dataclass
+class Summary:
+    """Comparison-count distribution for one (strategy, n, noise) cell."""
+
+    strategy: str
+    n: int
+    noise: float
+    histogram: Counter = field(default_factory=Counter)
+    inversions: int = 0
+
+    @property
+    def trials(self) -> int:
+        return sum(self.histogram.values())
+
+    @property
+    def worst(self) -> int:
+        return max(self.histogram)
+
+    @property
+    def best(self) -> int:
+        return min(self.histogram)
+
+    @property
+    def mean(self) -> float:
+        return sum(count * times for count, times in self.histogram.items()) / self.trials
+
+    @property
+    def bound(self) -> int:
+        """Binary insertion's worst case, the yardstick for every strategy."""
+        return expected_max_comparisons(self.n)
+
+    @property
+    def mean_inversions(self) -> float:
+        return self.inversions / self.trials
+
+
+def summarize(chunks: Iterable[Iterable[TrialResult]]) -> List[Summary]:
+    """Fold result chunks into one `Summary` per (strategy, n, noise)."""
+    cells: Dict[Tuple[str, int, float], Summary] = {}
+    for chunk in chunks:
+        for strategy, n, _, noise, comparisons, inversions in chunk:
+            key = (strategy, n, noise)
+            summary = cells.get(key)
+            if summary is None:
+                summary = cells[key] = Summary(strategy, n, noise)
+            summary.histogram[comparisons] += 1
+            summary.inversions += inversions
+    return [cells[key] for key in sorted(cells)]
+
+
+def format_report(summaries: Iterable[Summary]) -> str:
+    lines = [
+        f"{'strategy':<18} {'n':>6} {'noise':>5} {'trials':>6} {'best':>7} "
+        f"{'mean':>9} {'worst':>7} {'bound':>7} {'worst/bound':>11} {'inversions':>10}"
+    ]
+    for summary in summaries:
+        lines.append(
+            f"{summary.strategy:<18} {summary.n:>6} {summary.noise:>5.2f} "
+            f"{summary.trials:>6} {summary.best:>7} {summary.mean:>9.1f} "
+            f"{summary.worst:>7} {summary.bound:>7} "
+            f"{summary.worst / max(1, summary.bound):>11.3f} "
+            f"{summary.mean_inversions:>10.1f}"
+        )
+    return "\n".join(lines)
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
+import itertools
+import math
+import random
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Generic, Iterable, List, Sequence, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from .journal import ChoiceJournal
+    from .knowledge import ComparisonKnowledge, Learned
 
 
 T = TypeVar("T")
 
+SortedFactory = Callable[[Iterable[T]], MutableSequence[T]]
+
 
 class Choice(Enum):
     """Represents which option the user picked during a comparison."""
@@ -24,29 +48,239 @@ class EmptyState(Generic[T]):
 
 @dataclass
 class CompareState(Generic[T]):
-    """Represents an ongoing binary-search insertion."""
+    """
+    Represents an ongoing binary-search insertion.
+
+    With a `limit`, only the first `limit` entries of `sorted` are kept in
+    order; items that do not beat the cut-off are parked behind them.
+
+    In an `adaptive` session each search starts at `finger`, the slot of the
+    item placed just before, and gallops away from it in `stride` steps
+    that double until the answers bracket the item; `finger` is None once
+    the rest of the window is binary-searched.
+    """
 
     unsorted: List[T]
-    sorted: List[T]
+    sorted: MutableSequence[T]
     lo: int
     hi: int
+    limit: int | None = None
+    adaptive: bool = False
+    finger: int | None = None
+    stride: int = 0
 
 
 @dataclass
 class DoneState(Generic[T]):
-    """Represents a finished sort."""
+    """
+    Represents a finished sort.
+
+    A finished top-k session keeps its `limit`: only the first `limit`
+    entries of `sorted` are ranked.
+    """
 
-    sorted: List[T]
+    sorted: MutableSequence[T]
+    limit: int | None = None
 
 
 SortState = EmptyState[T] | CompareState[T] | DoneState[T]
 
 
+@dataclass
+class StepRecord(Generic[T]):
+    """
+    Delta needed to take back one applied choice.
+
+    Instead of copying `sorted`/`unsorted`, a step remembers the search window
+    it replaced and where (if anywhere) it inserted an item. `finished` keeps
+    the live `CompareState` a final step replaced with a `DoneState`.
+    """
+
+    choice: Choice
+    lo: int
+    hi: int
+    finger: int | None = None
+    stride: int = 0
+    inserted_at: int | None = None
+    finished: CompareState[T] | None = None
+    inferred: bool = False
+    learned: Learned | None = None
+
+
+@dataclass
+class SortProgress:
+    """How far a session has come and how much is left."""
+
+    comparisons: int
+    worst_remaining: int
+    expected_remaining: float
+    eta_seconds: float | None
+
+    @property
+    def fraction(self) -> float:
+        """Expected share of the session that is done, in [0, 1]."""
+        total = self.comparisons + self.expected_remaining
+        return 1.0 if total <= 0 else self.comparisons / total
+
+
+class SorterObserver(Generic[T]):
+    """
+    Hooks a `PairwiseSorter` calls as a session unfolds.
+
+    Every method receives the sorter and a timestamp from its (monotonic)
+    clock; subclasses override only the events they care about. Inferred
+    answers from a knowledge store are reported through `on_choice` as well,
+    flagged with `inferred=True`.
+    """
+
+    def on_start(self, sorter: PairwiseSorter[T], timestamp: float) -> None:
+        """A new session began (also after `add_items` and `resume`, unless done)."""
+
+    def on_question(
+        self, sorter: PairwiseSorter[T], pair: Tuple[T, T], timestamp: float
+    ) -> None:
+        """`pair` is now waiting for an answer."""
+
+    def on_choice(
+        self,
+        sorter: PairwiseSorter[T],
+        pair: Tuple[T, T],
+        choice: Choice,
+        inferred: bool,
+        timestamp: float,
+    ) -> None:
+        """`choice` was applied to `pair`."""
+
+    def on_insert(
+        self, sorter: PairwiseSorter[T], item: T, position: int, timestamp: float
+    ) -> None:
+        """`item` was placed at `position` of the sorted prefix."""
+
+    def on_done(self, sorter: PairwiseSorter[T], timestamp: float) -> None:
+        """The session finished."""
+
+
+class OrderingView(Sequence[T]):
+    """
+    Read-only, zero-copy view of a sorter's best-known ordering.
+
+    Indexes straight into the sorted prefix followed by the pending stack,
+    exactly as `snapshot_ordering` would stitch them, without building the
+    list. The view belongs to one state: once the sorter advances, any access
+    raises RuntimeError instead of returning a shifted item.
+    """
+
+    def __init__(self, sorter: PairwiseSorter[T], fallback: Sequence[T] | None = None) -> None:
+        self._sorter = sorter
+        self._version = sorter._version
+        state = sorter.state
+        self._head: Sequence[T]
+        self._tail: Sequence[T] = ()
+        if isinstance(state, CompareState):
+            self._head, self._tail = state.sorted, state.unsorted
+        elif isinstance(state, DoneState):
+            self._head = state.sorted
+        elif fallback is not None:
+            self._head = fallback
+        else:
+            self._head = state.items
+
+    def _check(self) -> None:
+        if self._sorter._version != self._version:
+            raise RuntimeError("sorter advanced; this ordering view is stale")
+
+    def is_valid(self) -> bool:
+        return self._sorter._version == self._version
+
+    def __len__(self) -> int:
+        self._check()
+        return len(self._head) + len(self._tail)
+
+    def __getitem__(self, index):
+        self._check()
+        split = len(self._head)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(split + len(self._tail))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            window = list(self._head[start : min(stop, split)]) if start < split else []
+            if stop > split:
+                window.extend(self._tail[max(start, split) - split : stop - split])
+            return window
+        size = split + len(self._tail)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ordering view index out of range")
+        if index < split:
+            return self._head[index]
+        return self._tail[index - split]
+
+    def __iter__(self) -> Iterator[T]:
+        self._check()
+        yield from self._head
+        yield from self._tail
+        self._check()
+
+
 class PairwiseSorter(Generic[T]):
-    """Interactive priority sorter using safe pairwise comparisons."""
+    """
+    Interactive priority sorter using safe pairwise comparisons.
+
+    `sorted_factory` builds the container backing `CompareState.sorted`. The
+    default plain list is fastest for the handful of items a person sorts by
+    hand; pass `BlockedList` for large simulated runs where the O(n) memmove
+    of `list.insert` would dominate.
+
+    With a `knowledge` store attached, every answer is remembered and any
+    question it already implies is answered automatically, so `current_pair`
+    only ever surfaces comparisons the user has not effectively made yet.
+
+    With a `journal` attached, each new session is snapshotted to disk and
+    every applied choice is appended to it, so `resume` can rebuild the
+    session after a crash.
 
-    def __init__(self) -> None:
+    Every applied choice is delta-logged, so `undo` and `redo` step through a
+    session in O(1) bookkeeping plus a single positional insert or delete.
+
+    `observers` receive `SorterObserver` events with timestamps from `clock`.
+    With none attached each step only pays for one empty-list check.
+    """
+
+    def __init__(
+        self,
+        sorted_factory: SortedFactory[T] = list,
+        knowledge: ComparisonKnowledge[T] | None = None,
+        journal: ChoiceJournal[T] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        observers: Iterable[SorterObserver[T]] = (),
+    ) -> None:
         self.state: SortState[T] = EmptyState([])
+        self._sorted_factory = sorted_factory
+        self.knowledge = knowledge
+        self.journal = journal
+        self.observers: List[SorterObserver[T]] = list(observers)
+        self._history: List[StepRecord[T]] = []
+        self._redo: List[Choice] = []
+        self._answered = 0
+        # Where a streamed session pulls its next pending item from.
+        self._source: Iterator[T] | None = None
+        self._async_source: AsyncIterator[T] | None = None
+        # Bumped on every state change so outstanding OrderingViews go stale.
+        self._version = 0
+        self._clock = clock
+        self._asked_at: float | None = None
+        # Smoothed seconds per answered question, for ETAs.
+        self._latency: float | None = None
+
+    def ordering_view(self, fallback: Sequence[T] | None = None) -> OrderingView[T]:
+        """
+        Return a zero-copy view of the best-known ordering.
+
+        Same contents as `snapshot_ordering`, but O(1) to create and index;
+        prefer it on hot paths such as live progress rendering.
+        """
+        return OrderingView(self, fallback)
 
     def snapshot_ordering(self, fallback: Iterable[T] | None = None) -> List[T]:
         """
@@ -65,62 +299,557 @@ class PairwiseSorter(Generic[T]):
             return list(self.state.items)
         return list(fallback)
 
-    def start_sorting(self, items: Sequence[T]) -> None:
+    def start_sorting(
+        self, items: Iterable[T], limit: int | None = None, adaptive: bool = False
+    ) -> None:
         """
         Initialize the sorter with a fresh batch of items.
 
         Works by seeding the ordered list with the first entry
         and treating the rest as a stack processed from the tail backwards.
+
+        An iterator (a generator, an open file, ...) is consumed lazily
+        instead: questions start once two items have arrived, and each
+        further item is pulled onto the stack only when the previous one has
+        been placed, so items are asked about in arrival order.
+
+        With `limit=k` only the top k items are ranked: once k items are
+        placed, each newcomer is first compared with the k-th, and only those
+        that beat it are binary-inserted. Pending items are shuffled, so any
+        input costs about n + k·ln(n/k)·log2(k) questions on average
+        (n·(1 + log2 k) at worst), and the final ordering is the exact top k
+        followed by the rest, unordered.
+
+        `adaptive=True` suits input that is already nearly in order, such as
+        a previous result with a few changes. The search for each item starts
+        next to its neighbour in the input and gallops outwards. An unchanged
+        list costs n - 1 questions. An item moved d places towards the front
+        costs up to 4·log2(d) more; one moved d places towards the end costs
+        about d more, since each item it was moved past then has to be
+        checked against it as well. Shuffled input costs up to twice as many
+        questions.
         """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        if adaptive and limit is not None:
+            raise ValueError("adaptive sorting cannot be combined with a limit")
+        if isinstance(items, Iterator):
+            head = list(itertools.islice(items, 2))
+            if len(head) <= 1:
+                self._begin(DoneState(head))
+                return
+            self._begin(self._streamed_state(head, limit, adaptive), source=items)
+            return
         data = list(items)
-        if not data:
-            self.state = DoneState([])
+        if len(data) <= 1:
+            self._begin(DoneState(data))
             return
-
-        if len(data) == 1:
-            self.state = DoneState([data[0]])
+        if adaptive:
+            # Seed with the last item so each one popped off the stack is
+            # searched for right next to its input successor.
+            self._begin(
+                CompareState(
+                    unsorted=data[:-1],
+                    sorted=self._sorted_factory(data[-1:]),
+                    lo=0,
+                    hi=1,
+                    adaptive=True,
+                    finger=0,
+                )
+            )
             return
 
-        sorted_block = [data[0]]
+        sorted_block = self._sorted_factory([data[0]])
         # Treat the remainder as a stack where the current item is last().
         unsorted_block = data[1:]
-        self.state = CompareState(
-            unsorted=unsorted_block,
-            sorted=sorted_block,
+        if limit is not None:
+            # Re-sorting an ordered list would feed ever better items and make
+            # every one of them beat the cut-off; a fixed shuffle avoids that
+            # while keeping sessions reproducible.
+            random.Random(len(data)).shuffle(unsorted_block)
+        self._begin(
+            CompareState(
+                unsorted=unsorted_block,
+                sorted=sorted_block,
+                lo=0,
+                hi=len(sorted_block),
+                limit=limit,
+            )
+        )
+
+    async def start_sorting_async(
+        self,
+        items: AsyncIterable[T] | Iterable[T],
+        limit: int | None = None,
+        adaptive: bool = False,
+    ) -> None:
+        """
+        Like `start_sorting` for an iterator, but items may arrive asynchronously.
+
+        Returns once the first question is ready. When the pending stack runs
+        dry the session waits (`current_pair()` is None but `is_done()` is
+        False) until `fill` awaits the next item; `make_choice_async` does
+        that after every answer.
+        """
+        if not isinstance(items, AsyncIterable):
+            self.start_sorting(iter(items), limit, adaptive)
+            return
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        if adaptive and limit is not None:
+            raise ValueError("adaptive sorting cannot be combined with a limit")
+        source = aiter(items)
+        head: List[T] = []
+        while len(head) < 2:
+            try:
+                head.append(await anext(source))
+            except StopAsyncIteration:
+                self._begin(DoneState(head))
+                return
+        self._begin(self._streamed_state(head, limit, adaptive), async_source=source)
+
+    async def make_choice_async(self, choice: Choice) -> None:
+        """`make_choice`, then wait for more input if the session needs it."""
+        self.make_choice(choice)
+        await self.fill()
+
+    async def fill(self) -> None:
+        """Await items from the async source until a question is pending or it ends."""
+        while (
+            isinstance(self.state, CompareState)
+            and not self.state.unsorted
+            and self._async_source is not None
+        ):
+            state = self.state
+            try:
+                item = await anext(self._async_source)
+            except StopAsyncIteration:
+                self._async_source = None
+                self._finish_stream(state)
+            else:
+                self._receive(state, item)
+                self._version += 1
+                self._resolve_known()
+            self._announce()
+
+    def _streamed_state(
+        self, head: List[T], limit: int | None, adaptive: bool
+    ) -> CompareState[T]:
+        return CompareState(
+            unsorted=[head[1]],
+            sorted=self._sorted_factory([head[0]]),
             lo=0,
-            hi=len(sorted_block),
+            hi=1,
+            limit=limit,
+            adaptive=adaptive,
+            finger=0 if adaptive else None,
+        )
+
+    def _pull(self, state: CompareState[T]) -> bool:
+        """Push the next streamed item onto the pending stack, if there is one."""
+        if self._source is None:
+            return False
+        for item in self._source:
+            self._receive(state, item)
+            return True
+        self._source = None
+        return False
+
+    def _receive(self, state: CompareState[T], item: T) -> None:
+        state.unsorted.append(item)
+        if self.journal is not None:
+            self.journal.arrive(item)
+
+    def _finish_stream(self, state: CompareState[T]) -> None:
+        """The async source ran out while the session waited for it."""
+        self.state = DoneState(state.sorted, state.limit)
+        self._version += 1
+        if self._history and self._history[-1].finished is None:
+            # Undo has to re-adopt the waiting state, as after a final insert.
+            self._history[-1].finished = state
+        if self.journal is not None:
+            self.journal.snapshot(self.state, self._history, self._answered)
+
+    def add_items(self, ordering: DoneState[T], items: Sequence[T]) -> None:
+        """
+        Extend a finished `ordering` with `items` without re-sorting it.
+
+        Only the new items are binary-inserted, costing about log2(n)
+        questions each instead of a full session. New items are taken from the
+        tail, just like the pending stack built by `start_sorting`.
+        """
+        ranked = list(ordering.sorted)
+        pending = list(items)
+        if not ranked:
+            self.start_sorting(pending)
+            return
+        if not pending:
+            self._begin(DoneState(ranked))
+            return
+
+        sorted_block = self._sorted_factory(ranked)
+        self._begin(
+            CompareState(
+                unsorted=pending,
+                sorted=sorted_block,
+                lo=0,
+                hi=len(sorted_block),
+            )
         )
 
+    def _begin(
+        self,
+        state: SortState[T],
+        source: Iterator[T] | None = None,
+        async_source: AsyncIterator[T] | None = None,
+    ) -> None:
+        """Install a fresh session state and settle any already-known answers."""
+        self.state = state
+        self._source = source
+        self._async_source = async_source
+        self._version += 1
+        self._forget_history()
+        self._asked_at = self._clock()
+        if self.journal is not None:
+            self.journal.snapshot(state)
+        self._notify_start()
+        self._resolve_known()
+        self._announce()
+
+    def resume(self) -> bool:
+        """
+        Rebuild the session recorded in the attached journal.
+
+        Replays every logged choice on top of the last snapshot; the undo
+        history and answer count the snapshot kept come back with it, so undo
+        reaches back past compactions. Returns False when there is nothing to
+        resume. A streamed session resumes with the items that had arrived;
+        the rest of its source is not reopened. Resuming a finished session
+        notifies no observers.
+        """
+        journal = self.journal
+        if journal is None:
+            return False
+        recorded = journal.load()
+        if recorded is None:
+            return False
+
+        from .journal import Arrival
+
+        state, entries = recorded.state, recorded.entries
+        if isinstance(state, (CompareState, DoneState)):
+            state.sorted = self._sorted_factory(state.sorted)
+            for step in recorded.history[-1:]:
+                if step.finished is not None:
+                    step.finished.sorted = state.sorted
+        observers = self.observers
+        self.journal = None
+        self.observers = []
+        try:
+            self.state = state
+            self._version += 1
+            self._forget_history()
+            self._history = recorded.history
+            self._answered = recorded.answered
+            # Replay pulls streamed items in the order they first arrived.
+            self._source = iter(
+                [entry.item for entry in entries if isinstance(entry, Arrival)]
+            )
+            self._async_source = None
+            for entry in entries:
+                if entry is None:
+                    self._revert()
+                elif not isinstance(entry, Arrival):
+                    choice, inferred = entry
+                    self._advance(choice, inferred=inferred)
+        finally:
+            self._source = None
+            self.journal = journal
+            self.observers = observers
+        state = self.state
+        if isinstance(state, CompareState) and not state.unsorted:
+            self._finish_stream(state)
+        if isinstance(self.state, DoneState):
+            # Reopening a finished session neither starts nor finishes one.
+            return True
+        self._notify_start()
+        self._resolve_known()
+        self._announce()
+        return True
+
+    def sort_with(self, items: Sequence[T], prefer: Callable[[T, T], bool]) -> List[T]:
+        """
+        Sort `items` in one pass, asking `prefer` instead of a person.
+
+        `prefer(current, pivot)` returns True where a user would pick
+        `Choice.LEFT`. Questions are asked in exactly the order the
+        interactive state machine would ask them, so the resulting ordering
+        and comparison count match a `current_pair`/`make_choice` session.
+        Observers only see `on_start` and `on_done` for this fast path.
+        """
+        data = list(items)
+        if len(data) <= 1:
+            self._begin(DoneState(data))
+            return list(data)
+
+        ordered = self._sorted_factory([data[0]])
+        insert = ordered.insert
+        size = 1
+        for current in reversed(data[1:]):
+            lo = 0
+            hi = size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if prefer(current, ordered[mid]):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            insert(lo, current)
+            size += 1
+
+        self.state = DoneState(ordered)
+        self._version += 1
+        self._forget_history()
+        self._source = self._async_source = None
+        if self.journal is not None:
+            self.journal.snapshot(self.state)
+        self._notify_start()
+        self._announce()
+        return list(ordered)
+
     def make_choice(self, choice: Choice) -> None:
         """Apply the user's decision and advance the binary-search insertion."""
         if not isinstance(self.state, CompareState):
             return
+        now = self._clock()
+        if self._asked_at is not None:
+            sample = now - self._asked_at
+            self._latency = (
+                sample if self._latency is None else 0.8 * self._latency + 0.2 * sample
+            )
+        self._redo.clear()
+        self._choose(choice)
+        self._asked_at = now
+        self._announce()
 
+    def progress(self) -> SortProgress:
+        """
+        Report questions answered, remaining work and an ETA, in O(1).
+
+        Remaining counts cover the current search window plus every pending
+        item, including top-k sessions (for a streamed session, only items
+        that have arrived); the expected figure assumes each item is equally
+        likely to land in any slot, or for an adaptive session extrapolates
+        from the questions its placed items took. The ETA multiplies it by
+        the smoothed time the user has been taking per question.
+        """
         state = self.state
+        if not isinstance(state, CompareState) or not state.unsorted:
+            return SortProgress(self._answered, 0, 0.0, 0.0)
+
+        window = state.hi - state.lo + 1
+        placed = len(state.sorted)
+        pending = len(state.unsorted) - 1
+        limit = state.limit
+        if state.hi == limit:
+            # One cut-off question, then a search of the top `limit` slots for
+            # the limit / (placed + 1) share of items that beat it.
+            worst = 1 + (limit - 1).bit_length()
+            expected = 1 + limit / (placed + 1) * _expected_insert(limit)
+        else:
+            worst = (window - 1).bit_length()
+            expected = _expected_insert(window)
+
+        # Pending items that still fit under the limit cost a full search ...
+        filling = pending if limit is None else max(0, min(pending, limit - placed - 1))
+        worst += _ceil_log2_prefix(placed + filling + 1) - _ceil_log2_prefix(placed + 1)
+        expected += _expected_prefix(placed + filling + 1) - _expected_prefix(placed + 1)
+        # ... the rest are screened against the cut-off first.
+        screened = pending - filling
+        if screened:
+            assert limit is not None
+            worst += screened * (1 + (limit - 1).bit_length())
+            expected += screened + limit * _expected_insert(limit) * (
+                _harmonic(placed + pending + 1) - _harmonic(placed + filling + 1)
+            )
+        if state.adaptive:
+            # Galloping out and then bisecting back takes up to twice as long.
+            worst *= 2
+            expected = _expected_adaptive(self._answered, placed, pending)
+        eta = None if self._latency is None else expected * self._latency
+        return SortProgress(self._answered, worst, expected, eta)
+
+    def undo(self) -> bool:
+        """
+        Take back the user's most recent choice.
+
+        Questions the knowledge store answered on the user's behalf after that
+        choice are rolled back with it. Returns False when there is nothing to
+        undo in the current session.
+        """
+        if not self._answered or not self._history:
+            return False
+        while self._history:
+            step = self._revert()
+            if not step.inferred:
+                self._redo.append(step.choice)
+                break
+        self._asked_at = self._clock()
+        self._announce()
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the most recently undone choice, if any."""
+        if not self._redo or not isinstance(self.state, CompareState):
+            return False
+        self._choose(self._redo.pop())
+        self._asked_at = self._clock()
+        self._announce()
+        return True
+
+    def can_undo(self) -> bool:
+        return self._answered > 0 and bool(self._history)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def _choose(self, choice: Choice) -> None:
+        learned = None
+        if self.knowledge is not None:
+            pair = self.current_pair()
+            if pair is not None:
+                learned = self.knowledge.record_choice(pair, choice)
+        self._advance(choice, learned=learned)
+        self._resolve_known()
+
+    def _resolve_known(self) -> None:
+        """Auto-answer every upcoming question the knowledge store already implies."""
+        if self.knowledge is None:
+            return
+        while (pair := self.current_pair()) is not None:
+            choice = self.knowledge.lookup(*pair)
+            if choice is None:
+                return
+            self._advance(choice, inferred=True)
+
+    def _notify_start(self) -> None:
+        if self.observers:
+            now = self._clock()
+            for observer in self.observers:
+                observer.on_start(self, now)
+
+    def _announce(self) -> None:
+        """Tell observers what the sorter is waiting for after a state change."""
+        if not self.observers:
+            return
+        now = self._clock()
+        pair = self.current_pair()
+        if pair is not None:
+            for observer in self.observers:
+                observer.on_question(self, pair, now)
+        elif isinstance(self.state, DoneState):
+            for observer in self.observers:
+                observer.on_done(self, now)
+
+    def _forget_history(self) -> None:
+        self._history = []
+        self._redo = []
+        self._answered = 0
+
+    def _advance(
+        self, choice: Choice, inferred: bool = False, learned: Learned | None = None
+    ) -> None:
+        state = self.state
+        if not isinstance(state, CompareState):
+            return
         if not state.unsorted:
-            self.state = DoneState(state.sorted.copy())
+            if self._async_source is None:
+                self.state = DoneState(state.sorted, state.limit)
+                self._version += 1
             return
 
-        mid = (state.lo + state.hi) // 2
+        self._version += 1
+        observers = self.observers
+        if observers:
+            pair = (state.unsorted[-1], state.sorted[_probe(state)])
+        step: StepRecord[T] = StepRecord(
+            choice,
+            state.lo,
+            state.hi,
+            state.finger,
+            state.stride,
+            inferred=inferred,
+            learned=learned,
+        )
+        step.inserted_at = self._step(state, choice)
+        if observers:
+            now = self._clock()
+            for observer in observers:
+                observer.on_choice(self, pair, choice, inferred, now)
+                if step.inserted_at is not None:
+                    observer.on_insert(self, pair[0], step.inserted_at, now)
+        if self.state is not state:
+            step.finished = state
+        self._history.append(step)
+        if not inferred:
+            self._answered += 1
+        if self.journal is not None:
+            self.journal.append(choice, self.state, inferred, self._history, self._answered)
+
+    def _revert(self) -> StepRecord[T]:
+        """Roll back the latest applied step without copying any list."""
+        step = self._history.pop()
+        self._version += 1
+        if step.finished is not None:
+            self.state = step.finished
+        state = self.state
+        assert isinstance(state, CompareState)
+        if step.inserted_at is not None:
+            state.unsorted.append(state.sorted.pop(step.inserted_at))
+        state.lo = step.lo
+        state.hi = step.hi
+        state.finger = step.finger
+        state.stride = step.stride
+        if not step.inferred:
+            self._answered -= 1
+        if step.learned is not None and self.knowledge is not None:
+            self.knowledge.retract(step.learned)
+        if self.journal is not None:
+            self.journal.undo(self.state, self._history, self._answered)
+        return step
+
+    def _step(self, state: CompareState[T], choice: Choice) -> int | None:
+        """Narrow the search window; return the insert position once it closes."""
+        mid = _probe(state)
 
         if choice == Choice.LEFT:
             state.hi = mid
         else:
             state.lo = mid + 1
+        if state.finger is not None:
+            _gallop(state, choice, mid)
 
         if state.lo < state.hi:
-            return
+            return None
 
         insert_pos = state.lo
         current = state.unsorted.pop()
         state.sorted.insert(insert_pos, current)
 
-        if not state.unsorted:
-            self.state = DoneState(state.sorted.copy())
-            return
+        if not state.unsorted and not self._pull(state) and self._async_source is None:
+            # Hand the prefix over rather than copying it; undo re-adopts the
+            # same container through StepRecord.finished.
+            self.state = DoneState(state.sorted, state.limit)
+            return insert_pos
 
         state.lo = 0
         state.hi = len(state.sorted)
+        if state.limit is not None:
+            state.hi = min(state.hi, state.limit)
+        if state.adaptive:
+            state.finger = insert_pos
+            state.stride = 0
+        return insert_pos
 
     def finish_sorting(self, fallback: Iterable[T] | None = None) -> List[T]:
         """
@@ -145,7 +874,7 @@ class PairwiseSorter(Generic[T]):
             return None
         if not self.state.unsorted:
             return None
-        mid = (self.state.lo + self.state.hi) // 2
+        mid = _probe(self.state)
         current = self.state.unsorted[-1]
         pivot = self.state.sorted[mid]
         return current, pivot
@@ -153,13 +882,166 @@ class PairwiseSorter(Generic[T]):
     def is_done(self) -> bool:
         return isinstance(self.state, DoneState)
 
+    def lookahead(self) -> Dict[Choice, Tuple[T, T] | None]:
+        """
+        Return the pair each possible answer would lead to, without committing.
+
+        Accounts for questions the knowledge store would answer in between.
+        A pair is None when that answer would finish the session, or when the
+        next item of a streamed session has not arrived yet; nothing is pulled
+        from the source to find out. The sorter, its knowledge store and any
+        outstanding `OrderingView` are left exactly as they were.
+        """
+        if self.current_pair() is None:
+            return {Choice.LEFT: None, Choice.RIGHT: None}
+        return {choice: self._peek(choice) for choice in Choice}
+
+    def _peek(self, choice: Choice) -> Tuple[T, T] | None:
+        """Apply `choice` with side effects detached, read the next pair, roll back."""
+        journal, observers = self.journal, self.observers
+        source, async_source = self._source, self._async_source
+        version, depth = self._version, len(self._history)
+        knowledge = self.knowledge
+        counters = None if knowledge is None else (knowledge.hits, knowledge.misses)
+        self.journal = None
+        self.observers = []
+        # Without a source a dry stack finishes the session: reported as None.
+        self._source = self._async_source = None
+        try:
+            self._choose(choice)
+            return self.current_pair()
+        finally:
+            while len(self._history) > depth:
+                self._revert()
+            self.journal, self.observers = journal, observers
+            self._source, self._async_source = source, async_source
+            self._version = version
+            if knowledge is not None and counters is not None:
+                knowledge.hits, knowledge.misses = counters
+
+
+def _probe(state: CompareState[T]) -> int:
+    """Index of the sorted item the current item is compared with next."""
+    if state.finger is not None:
+        return state.finger
+    if state.hi == state.limit:
+        # A full top-k window: most newcomers miss the cut-off, so test it first.
+        return state.hi - 1
+    return (state.lo + state.hi) // 2
+
+
+def _gallop(state: CompareState[T], choice: Choice, probed: int) -> None:
+    """Move the finger after an answer at `probed`; the window is already narrowed."""
+    direction = 1 if choice == Choice.RIGHT else -1
+    if state.stride and (state.stride > 0) != (direction > 0):
+        # Answers on both sides bracket the item: bisect what is left.
+        state.finger = None
+        return
+    state.stride = state.stride * 2 if state.stride else direction
+    target = probed + state.stride
+    state.finger = target if state.lo <= target < state.hi else None
+
 
 def expected_max_comparisons(n: int) -> int:
     if n <= 1:
         return 0
+    return _ceil_log2_prefix(n)
+
+
+def _ceil_log2_prefix(n: int) -> int:
+    """Closed form of sum(ceil(log2(x)) for x in 1..n)."""
+    if n <= 1:
+        return 0
+    k = (n - 1).bit_length()
+    return n * k - (1 << k) + 1
+
+
+_EULER_GAMMA = 0.5772156649015329
+_SMALL_HARMONIC = [0.0]
+for _n in range(1, 64):
+    _SMALL_HARMONIC.append(_SMALL_HARMONIC[-1] + 1 / _n)
+
+
+def _harmonic(n: int) -> float:
+    if n < len(_SMALL_HARMONIC):
+        return _SMALL_HARMONIC[n]
+    inverse = 1 / n
+    inverse_sq = inverse * inverse
+    return (
+        math.log(n)
+        + _EULER_GAMMA
+        + inverse / 2
+        - inverse_sq / 12
+        + inverse_sq * inverse_sq / 120
+    )
+
+
+def _power_block_sum(k: int, stop: int) -> float:
+    """sum(2**k / N) for N in (2**(k-1), stop], the outcomes needing k questions."""
+    if k == 0:
+        return 1.0 if stop >= 1 else 0.0
+    return (1 << k) * (_harmonic(stop) - _harmonic(1 << (k - 1)))
+
+
+# _POWER_PREFIX[k] = sum(2**ceil(log2 N) / N) over N in 1..2**k.
+_POWER_PREFIX = [_power_block_sum(0, 1)]
+for _k in range(1, 64):
+    _POWER_PREFIX.append(_POWER_PREFIX[-1] + _power_block_sum(_k, 1 << _k))
+
+
+def _expected_prefix(m: int) -> float:
+    """
+    Expected questions to insert into lists of size 0 .. m - 1, O(1).
+
+    Inserting into L items has N = L + 1 equally likely slots; midpoint binary
+    search resolves them in k = ceil(log2 N) or k - 1 steps, averaging
+    k + 1 - 2**k / N. Summing k uses `_ceil_log2_prefix`; the 2**k / N terms
+    are a precomputed sum over whole power-of-two blocks plus one partial block
+    of harmonic numbers.
+    """
+    if m <= 0:
+        return 0.0
+    k = (m - 1).bit_length()
+    powers = _POWER_PREFIX[k - 1] + _power_block_sum(k, m) if k else 1.0
+    return _ceil_log2_prefix(m) + m - powers
+
+
+def _expected_adaptive(answered: int, placed: int, pending: int) -> float:
+    """
+    Expected questions left in an adaptive session, from its answers so far.
+
+    Galloping costs one question per item plus an extra that grows with how
+    far the item moved. The extra is measured as a share of what binary
+    insertion would have asked for the items placed so far (starting from
+    `_ADAPTIVE_PRIOR` before there is much to go on), and that share of the
+    binary cost of the current and pending items is added to one question each.
+    """
+    done = placed - 1
+    binary_done = _expected_prefix(placed) - _expected_prefix(1)
+    share = (max(0, answered - done) + _ADAPTIVE_PRIOR * _ADAPTIVE_PRIOR_WEIGHT) / (
+        binary_done + _ADAPTIVE_PRIOR_WEIGHT
+    )
+    left = pending + 1
+    return left + share * (_expected_prefix(placed + left) - _expected_prefix(placed))
+
+
+# Before its first answers an adaptive session is assumed to gallop about as
+# far as binary insertion would bisect, a belief worth this many questions.
+_ADAPTIVE_PRIOR = 1.0
+_ADAPTIVE_PRIOR_WEIGHT = 32.0
+
+
+def _expected_insert(outcomes: int) -> float:
+    """Expected questions for a binary search over `outcomes` equally likely slots."""
+    k = (outcomes - 1).bit_length()
+    return k + 1 - (1 << k) / outcomes
+
+
+def merge_insertion_max_comparisons(n: int) -> int:
+    """Worst-case question count of Ford–Johnson merge insertion."""
+    # Sum of ceil(log2(3k / 4)) for k in 1..n, computed on integers:
+    # 2**e >= 3k/4  <=>  2**(e + 2) >= 3k.
     total = 0
-    for k in range(1, n):
-        x = k + 1
-        ceil_log2 = (x - 1).bit_length()
-        total += ceil_log2
+    for k in range(1, n + 1):
+        total += max(0, (3 * k - 1).bit_length() - 2)
     return total
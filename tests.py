@@ -1,18 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import itertools
+import json
+import math
 import random
+import subprocess
+import sys
+import tempfile
 import traceback
+from pathlib import Path
 from collections.abc import Callable
 
-from priority_sorter.sorter import Choice, PairwiseSorter, expected_max_comparisons
-
-
-def _run_simulated_sort(n: int, seed: int) -> tuple[int, list[int], list[int]]:
+from priority_sorter.async_sorter import AsyncMergeSorter
+from priority_sorter.containers import BlockedList
+from priority_sorter.items import Item, ItemStore
+from priority_sorter.journal import ChoiceJournal
+from priority_sorter.knowledge import ComparisonKnowledge
+from priority_sorter.merge_insertion import MergeInsertionSorter
+from priority_sorter.metrics import PrometheusMetrics
+from priority_sorter.sorter import (
+    Choice,
+    DoneState,
+    PairwiseSorter,
+    SortedFactory,
+    SorterObserver,
+    expected_max_comparisons,
+    merge_insertion_max_comparisons,
+)
+
+
+def _run_simulated_sort(
+    n: int, seed: int, sorted_factory: SortedFactory[int] = list
+) -> tuple[int, list[int], list[int]]:
     rng = random.Random(seed)
     items = list(range(n))
     rng.shuffle(items)
 
-    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter: PairwiseSorter[int] = PairwiseSorter(sorted_factory)
     sorter.start_sorting(items)
 
     comparisons = 0
@@ -52,6 +78,1358 @@ def test_sorts_matches_ground_truth_large_sizes() -> None:
         assert comparisons <= expected_max_comparisons(n)
 
 
+def test_blocked_list_backend_matches_list_backend() -> None:
+    for n in [0, 1, 2, 13, 377, 4181]:
+        expected = _run_simulated_sort(n, seed=0xC0FFEE)
+        blocked = _run_simulated_sort(
+            n, seed=0xC0FFEE, sorted_factory=lambda values: BlockedList(values, load=8)
+        )
+        assert blocked == expected
+
+
+def test_blocked_list_mirrors_list_operations() -> None:
+    rng = random.Random(0xB10C)
+    reference: list[int] = []
+    blocked: BlockedList[int] = BlockedList(load=4)
+    for step in range(3000):
+        if reference and rng.random() < 0.3:
+            index = rng.randrange(-len(reference), len(reference))
+            assert blocked.pop(index) == reference.pop(index)
+        else:
+            index = rng.randrange(-len(reference) - 2, len(reference) + 2)
+            reference.insert(index, step)
+            blocked.insert(index, step)
+        assert len(blocked) == len(reference)
+        if reference:
+            probe = rng.randrange(len(reference))
+            assert blocked[probe] == reference[probe]
+            assert blocked[-1] == reference[-1]
+    assert list(blocked) == reference
+    assert list(reversed(blocked)) == list(reversed(reference))
+    assert blocked[5:40:3] == reference[5:40:3]
+    for _ in range(300):
+        start, stop = rng.randrange(-30, len(reference) + 30), rng.randrange(-30, len(reference) + 30)
+        step = rng.choice([-9, -4, -2, -1, 1, 2, 3, 4, 5, 7, 30])
+        assert blocked[start:stop:step] == reference[start:stop:step]
+
+
+class _SlotRecorder:
+    """Stands in for VirtualList's canvas: remembers what each slot shows."""
+
+    def __init__(self) -> None:
+        self.shown: dict[int, int] = {}
+        self.binds: list[int] = []
+
+    def place(self, slot: int, index: int) -> None:
+        self.shown[slot] = index
+
+    def bind(self, slot: int, index: int) -> None:
+        self.binds.append(index)
+
+    def hide(self, slot: int) -> None:
+        self.shown.pop(slot, None)
+
+    def layout(self, slots, first: int, stop: int) -> list[int]:
+        self.binds = []
+        slots.layout(first, stop, self.place, self.bind, self.hide)
+        return self.binds
+
+
+def test_virtual_list_slots_rebind_only_rows_that_scrolled_in() -> None:
+    from priority_sorter.gui import RowSlots
+
+    slots = RowSlots()
+    recorder = _SlotRecorder()
+    assert recorder.layout(slots, 0, 12) == []
+    slots.grow(12)
+    assert recorder.layout(slots, 0, 12) == list(range(12))
+    assert all(slots.slot(index) == index % 12 for index in range(12))
+
+    # Scrolling by one line rebinds the single row that came into view, in
+    # the slot the row that left it freed up.
+    assert recorder.layout(slots, 1, 13) == [12]
+    assert slots.slot(12) == 0 and slots.slot(0) is None
+    assert sorted(recorder.shown.values()) == list(range(1, 13))
+    assert recorder.layout(slots, 1, 13) == []
+    assert recorder.layout(slots, 4, 16) == [13, 14, 15]
+    assert recorder.layout(slots, 2, 14) == [2, 3]
+    assert recorder.layout(slots, 500, 512) == list(range(500, 512))
+    assert all(slots.slot(index) == index % 12 for index in range(500, 512))
+
+    # A shorter visible range hides the slots it no longer needs.
+    assert recorder.layout(slots, 500, 505) == []
+    assert len(recorder.shown) == 5 and slots.slot(510) is None
+
+    slots.invalidate()
+    assert recorder.layout(slots, 500, 505) == list(range(500, 505))
+    # Growing the pool remaps every index, so everything is rebound once.
+    slots.grow(16)
+    assert recorder.layout(slots, 500, 516) == list(range(500, 516))
+    slots.grow(8)
+    assert len(slots) == 16 and recorder.layout(slots, 500, 516) == []
+
+
+def test_live_panel_rebinds_only_rows_whose_marker_changed() -> None:
+    from priority_sorter.gui import RowSlots, live_marker, live_marks, live_rows_to_refresh
+
+    items = list(range(500))
+    random.Random(0x11FE).shuffle(items)
+    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter.start_sorting(items)
+    slots = RowSlots()
+    slots.grow(30)
+    recorder = _SlotRecorder()
+    first, stop = 200, 230
+    marks = live_marks(sorter.state, len(items))
+    assert live_rows_to_refresh(None, marks) is None
+    window_moves = insertions = 0
+    while (pair := sorter.current_pair()) is not None:
+        sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+        previous, marks = marks, live_marks(sorter.state, len(items))
+        ranges = live_rows_to_refresh(previous, marks)
+        if ranges is None:
+            # An insertion rebinds the visible rows and nothing off-screen.
+            insertions += 1
+            assert previous[2] != marks[2]
+            slots.invalidate()
+            assert recorder.layout(slots, first, stop) == list(range(first, stop))
+            continue
+        window_moves += 1
+        changed = {
+            index
+            for index in range(len(items))
+            if live_marker(index, previous) != live_marker(index, marks)
+        }
+        covered = {index for start, end in ranges for index in range(start, end)}
+        assert covered == changed
+    assert insertions == len(items) - 1 and window_moves > insertions
+    assert live_marks(sorter.state, len(items)) == (0, 0, 500, 500)
+    assert not any(live_marker(index, marks) for index in range(len(items)))
+
+
+def test_sort_with_matches_interactive_session() -> None:
+    rng = random.Random(0x5EED)
+    for n in [0, 1, 2, 3, 8, 89, 987]:
+        items = [rng.randrange(n // 2 + 1) for _ in range(n)]
+
+        interactive: list[tuple[int, int]] = []
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        sorter.start_sorting(items)
+        while (pair := sorter.current_pair()) is not None:
+            interactive.append(pair)
+            sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+        expected = sorter.finish_sorting()
+
+        batch: list[tuple[int, int]] = []
+
+        def prefer(current: int, pivot: int) -> bool:
+            batch.append((current, pivot))
+            return current > pivot
+
+        batch_sorter: PairwiseSorter[int] = PairwiseSorter(BlockedList)
+        assert batch_sorter.sort_with(items, prefer) == expected
+        assert batch == interactive
+        assert batch_sorter.is_done()
+        assert batch_sorter.finish_sorting() == expected
+
+
+def test_add_items_only_inserts_new_items() -> None:
+    rng = random.Random(0xADD)
+    ranked = sorted(rng.sample(range(10_000), 500), reverse=True)
+    fresh = rng.sample(range(10_000, 20_000), 5) + [ranked[250], -1]
+
+    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter.add_items(DoneState(ranked), fresh)
+
+    comparisons = 0
+    while (pair := sorter.current_pair()) is not None:
+        current, pivot = pair
+        assert current in fresh
+        sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        comparisons += 1
+
+    assert sorter.finish_sorting() == sorted(ranked + fresh, reverse=True)
+    size = len(ranked)
+    bound = sum((size + k).bit_length() for k in range(len(fresh)))
+    assert comparisons <= bound
+
+
+def test_add_items_edge_cases() -> None:
+    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter.add_items(DoneState([3, 2, 1]), [])
+    assert sorter.is_done()
+    assert sorter.finish_sorting() == [3, 2, 1]
+
+    sorter.add_items(DoneState([]), [42])
+    assert sorter.is_done()
+    assert sorter.finish_sorting() == [42]
+
+    sorter.add_items(DoneState([]), [1, 3, 2])
+    while (pair := sorter.current_pair()) is not None:
+        sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+    assert sorter.finish_sorting() == [3, 2, 1]
+
+
+def _answer_all(sorter: PairwiseSorter[int]) -> int:
+    questions = 0
+    while (pair := sorter.current_pair()) is not None:
+        current, pivot = pair
+        sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        questions += 1
+    return questions
+
+
+def test_knowledge_skips_answered_questions_across_sessions() -> None:
+    items = list(range(200))
+    random.Random(0x4B).shuffle(items)
+    knowledge: ComparisonKnowledge[int] = ComparisonKnowledge(key=lambda value: value)
+    sorter: PairwiseSorter[int] = PairwiseSorter(knowledge=knowledge)
+
+    sorter.start_sorting(items)
+    first = _answer_all(sorter)
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+    assert first > 0
+    assert knowledge.misses == first
+    assert len(knowledge) == len(items) * (len(items) - 1) // 2
+
+    random.Random(0x4C).shuffle(items)
+    sorter.start_sorting(items)
+    assert _answer_all(sorter) == 0
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+    assert knowledge.misses == first
+    assert knowledge.hits > 0
+
+    knowledge.forget(117)
+    sorter.start_sorting(items)
+    assert 0 < _answer_all(sorter) <= (len(items) - 1).bit_length()
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+
+
+def test_knowledge_transitive_closure_and_contradictions() -> None:
+    knowledge: ComparisonKnowledge[str] = ComparisonKnowledge(key=str)
+    knowledge.record("a", "b")
+    knowledge.record("c", "d")
+    assert knowledge.outranks("a", "d") is None
+    knowledge.record("b", "c")
+    assert knowledge.outranks("a", "d") is True
+    assert knowledge.outranks("d", "a") is False
+    assert knowledge.lookup("d", "b") == Choice.RIGHT
+    assert (knowledge.hits, knowledge.misses) == (1, 0)
+    try:
+        knowledge.record("d", "a")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("contradicting answer was accepted")
+
+    knowledge.forget("b")
+    assert knowledge.outranks("a", "b") is None
+    assert knowledge.outranks("a", "c") is True
+
+
+def test_journal_resumes_interrupted_session() -> None:
+    items = list(range(300))
+    random.Random(0x10C).shuffle(items)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path, snapshot_every=250)
+        )
+        sorter.start_sorting(items)
+        for _ in range(1000):
+            current, pivot = sorter.current_pair()
+            sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        expected_pair = sorter.current_pair()
+        expected_state = sorter.snapshot_ordering()
+        sorter.journal.close()
+        # Compaction keeps the tail short: one snapshot plus < 250 choices.
+        assert len(path.read_bytes().split(b"\n")) <= 252
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.current_pair() == expected_pair
+        assert resumed.snapshot_ordering() == expected_state
+        _answer_all(resumed)
+        assert resumed.finish_sorting() == sorted(items, reverse=True)
+        resumed.journal.close()
+
+        finished: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert finished.resume()
+        assert finished.is_done()
+        assert finished.finish_sorting() == sorted(items, reverse=True)
+        finished.journal.close()
+
+
+def test_journal_ignores_torn_write_and_missing_file() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        assert not PairwiseSorter(journal=ChoiceJournal(path)).resume()
+
+        sorter: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        sorter.start_sorting([1, 3, 2, 5, 4])
+        sorter.make_choice(Choice.RIGHT)
+        expected_pair = sorter.current_pair()
+        sorter.journal.close()
+        with open(path, "ab") as handle:
+            handle.write(b"L")
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.current_pair() == expected_pair
+        resumed.journal.close()
+
+
+def test_undo_redo_round_trip() -> None:
+    items = list(range(60))
+    random.Random(0x0DD).shuffle(items)
+    sorter: PairwiseSorter[int] = PairwiseSorter(BlockedList)
+    sorter.start_sorting(items)
+    assert not sorter.undo()
+
+    history: list[tuple[tuple[int, int], list[int]]] = []
+    while (pair := sorter.current_pair()) is not None:
+        history.append((pair, sorter.snapshot_ordering()))
+        sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+    assert sorter.is_done()
+
+    for pair, ordering in reversed(history):
+        assert sorter.undo()
+        assert sorter.current_pair() == pair
+        assert sorter.snapshot_ordering() == ordering
+    assert not sorter.undo()
+
+    for _ in range(len(history)):
+        assert sorter.redo()
+    assert not sorter.redo()
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+
+
+def test_undo_fixes_misclick_and_clears_redo() -> None:
+    items = [4, 8, 1, 6, 3, 7]
+    sorter: PairwiseSorter[int] = PairwiseSorter()
+    sorter.start_sorting(items)
+    current, pivot = sorter.current_pair()
+    wrong = Choice.RIGHT if current > pivot else Choice.LEFT
+    sorter.make_choice(wrong)
+    assert sorter.undo()
+    assert sorter.current_pair() == (current, pivot)
+    assert sorter.can_redo()
+    sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+    assert not sorter.can_redo()
+    _answer_all(sorter)
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+
+
+def test_undo_rolls_back_inferred_answers_and_knowledge() -> None:
+    knowledge: ComparisonKnowledge[int] = ComparisonKnowledge(key=lambda value: value)
+    knowledge.record(5, 1)
+    sorter: PairwiseSorter[int] = PairwiseSorter(knowledge=knowledge)
+    sorter.start_sorting([9, 1, 5, 3])
+    asked = sorter.current_pair()
+    sorter.make_choice(Choice.LEFT if asked[0] > asked[1] else Choice.RIGHT)
+    learned = len(knowledge)
+    assert sorter.undo()
+    assert sorter.current_pair() == asked
+    assert len(knowledge) < learned
+    assert knowledge.outranks(5, 1) is True
+    _answer_all(sorter)
+    assert sorter.finish_sorting() == [9, 5, 3, 1]
+
+
+def test_journal_replays_undo() -> None:
+    items = list(range(40))
+    random.Random(0x1DD).shuffle(items)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path, snapshot_every=7)
+        )
+        sorter.start_sorting(items)
+        for _ in range(30):
+            current, pivot = sorter.current_pair()
+            sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        for _ in range(9):
+            assert sorter.undo()
+        expected_pair = sorter.current_pair()
+        expected_state = sorter.snapshot_ordering()
+        sorter.journal.close()
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.current_pair() == expected_pair
+        assert resumed.snapshot_ordering() == expected_state
+        _answer_all(resumed)
+        assert resumed.finish_sorting() == sorted(items, reverse=True)
+        resumed.journal.close()
+
+
+def test_journal_keeps_undo_history_across_compaction() -> None:
+    items = list(range(40))
+    random.Random(0x1DE).shuffle(items)
+    reference: PairwiseSorter[int] = PairwiseSorter()
+    reference.start_sorting(items)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path, snapshot_every=7)
+        )
+        sorter.start_sorting(items)
+        for _ in range(28):
+            current, pivot = sorter.current_pair()
+            choice = Choice.LEFT if current > pivot else Choice.RIGHT
+            sorter.make_choice(choice)
+            reference.make_choice(choice)
+        sorter.journal.close()
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.progress().comparisons == 28
+        # The log was just compacted, so these undos reach into the snapshot.
+        for _ in range(5):
+            before = path.stat().st_size
+            assert resumed.undo() and reference.undo()
+            assert path.stat().st_size == before + 2
+            assert resumed.current_pair() == reference.current_pair()
+        resumed.journal.close()
+
+        again: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert again.resume()
+        assert again.progress().comparisons == 23
+        assert again.current_pair() == reference.current_pair()
+        assert again.undo() and reference.undo()
+        assert again.snapshot_ordering() == reference.snapshot_ordering()
+        _answer_all(again)
+        assert again.finish_sorting() == sorted(items, reverse=True)
+        again.journal.close()
+
+
+def test_streamed_items_are_pulled_on_demand() -> None:
+    items = list(range(60))
+    random.Random(0x57E).shuffle(items)
+    arrived = 0
+
+    def feed():
+        nonlocal arrived
+        for item in items:
+            arrived += 1
+            yield item
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path, snapshot_every=7)
+        )
+        sorter.start_sorting(feed())
+        assert arrived == 2 and sorter.current_pair() == (items[1], items[0])
+        for _ in range(40):
+            current, pivot = sorter.current_pair()
+            sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        # At most the item being placed is pending; the rest stays unread.
+        assert arrived == len(sorter.snapshot_ordering()) < len(items)
+        for _ in range(5):
+            assert sorter.undo()
+        expected_pair = sorter.current_pair()
+        expected_state = sorter.snapshot_ordering()
+        sorter.journal.close()
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.current_pair() == expected_pair
+        assert resumed.snapshot_ordering() == expected_state
+        resumed.journal.close()
+        sorter.journal = None
+
+    _answer_all(sorter)
+    assert arrived == len(items)
+    assert sorter.finish_sorting() == sorted(items, reverse=True)
+
+
+def test_async_stream_waits_for_items() -> None:
+    items = list(range(25))
+    random.Random(0xA57).shuffle(items)
+
+    async def feed():
+        for item in items:
+            await asyncio.sleep(0)
+            yield item
+
+    async def scenario() -> None:
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        await sorter.start_sorting_async(feed())
+        questions = 0
+        while (pair := sorter.current_pair()) is not None:
+            current, pivot = pair
+            await sorter.make_choice_async(
+                Choice.LEFT if current > pivot else Choice.RIGHT
+            )
+            questions += 1
+        assert sorter.finish_sorting() == sorted(items, reverse=True)
+        assert questions <= expected_max_comparisons(len(items))
+        assert sorter.undo() and not sorter.is_done()
+
+        # Answering synchronously leaves the session waiting for input.
+        waiting: PairwiseSorter[int] = PairwiseSorter()
+        await waiting.start_sorting_async(feed())
+        current, pivot = waiting.current_pair()
+        waiting.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        assert waiting.current_pair() is None and not waiting.is_done()
+        await waiting.fill()
+        assert waiting.current_pair() is not None
+
+        empty: PairwiseSorter[int] = PairwiseSorter()
+        await empty.start_sorting_async(feed() for _ in ())
+        assert empty.is_done()
+
+    asyncio.run(scenario())
+
+
+def test_adaptive_sort_gallops_from_previous_positions() -> None:
+    for n in range(12):
+        for seed in range(10):
+            items = list(range(n))
+            random.Random(seed).shuffle(items)
+            sorter: PairwiseSorter[int] = PairwiseSorter()
+            sorter.start_sorting(items, adaptive=True)
+            worst = sorter.progress().worst_remaining
+            assert _answer_all(sorter) <= worst
+            assert sorter.finish_sorting() == sorted(items, reverse=True)
+
+    ranked = list(range(499, -1, -1))
+    sorter = PairwiseSorter()
+    sorter.start_sorting(ranked, adaptive=True)
+    assert _answer_all(sorter) == len(ranked) - 1
+
+    for source, target in [(400, 50), (499, 0), (120, 119), (0, 250), (300, 480)]:
+        changed = ranked[:]
+        changed.insert(target, changed.pop(source))
+        sorter.start_sorting(changed, adaptive=True)
+        extra = _answer_all(sorter) - (len(ranked) - 1)
+        assert sorter.finish_sorting() == ranked
+        moved = abs(source - target)
+        if target < source:
+            assert extra <= 4 * moved.bit_length()
+        else:
+            assert extra <= moved + 2 * moved.bit_length()
+
+    changed = ranked[:]
+    rng = random.Random(0xF1)
+    moved = 0
+    for _ in range(5):
+        target, source = rng.randrange(len(changed)), rng.randrange(len(changed))
+        changed.insert(target, changed.pop(source))
+        moved += abs(source - target)
+    sorter.start_sorting(changed, adaptive=True)
+    questions = _answer_all(sorter)
+    assert sorter.finish_sorting() == ranked
+    assert questions <= len(ranked) - 1 + moved < expected_max_comparisons(len(ranked))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        sorter = PairwiseSorter(journal=ChoiceJournal(path, snapshot_every=5))
+        sorter.start_sorting(changed, adaptive=True)
+        for _ in range(37):
+            current, pivot = sorter.current_pair()
+            sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        assert sorter.undo()
+        expected_pair = sorter.current_pair()
+        sorter.journal.close()
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+        assert resumed.resume()
+        assert resumed.current_pair() == expected_pair
+        _answer_all(resumed)
+        assert resumed.finish_sorting() == ranked
+        resumed.journal.close()
+
+    try:
+        PairwiseSorter().start_sorting(ranked, limit=3, adaptive=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("adaptive top-k accepted")
+
+
+def test_lookahead_predicts_both_answers_without_side_effects() -> None:
+    items = list(range(45))
+    random.Random(0x10C).shuffle(items)
+    knowledge: ComparisonKnowledge[int] = ComparisonKnowledge(key=lambda value: value)
+    # Settled answers make some lookaheads skip inferred questions.
+    for high, low in ((40, 3), (30, 12), (22, 21), (9, 1)):
+        knowledge.record(high, low)
+
+    for adaptive, limit in ((False, None), (True, None), (False, 4)):
+        sorter: PairwiseSorter[int] = PairwiseSorter(knowledge=knowledge)
+        sorter.start_sorting(items, limit=limit, adaptive=adaptive)
+        while (pair := sorter.current_pair()) is not None:
+            before = (
+                sorter.snapshot_ordering(),
+                sorter.progress(),
+                sorter.can_undo(),
+                len(knowledge),
+                knowledge.hits,
+                knowledge.misses,
+            )
+            view = sorter.ordering_view()
+            predicted = sorter.lookahead()
+            assert view.is_valid()
+            assert before == (
+                sorter.snapshot_ordering(),
+                sorter.progress(),
+                sorter.can_undo(),
+                len(knowledge),
+                knowledge.hits,
+                knowledge.misses,
+            )
+            current, pivot = pair
+            right = Choice.LEFT if current > pivot else Choice.RIGHT
+            wrong = Choice.RIGHT if right == Choice.LEFT else Choice.LEFT
+            # Try the answer the test will not keep, then take it back.
+            sorter.make_choice(wrong)
+            assert sorter.current_pair() == predicted[wrong]
+            sorter.undo()
+            sorter.make_choice(right)
+            assert sorter.current_pair() == predicted[right]
+        assert sorter.lookahead() == {Choice.LEFT: None, Choice.RIGHT: None}
+
+    def feed():
+        yield from (3, 1, 2)
+
+    streamed: PairwiseSorter[int] = PairwiseSorter()
+    streamed.start_sorting(feed())
+    # Either answer places 1 and needs the unread 2, which is not pulled early.
+    assert streamed.lookahead() == {Choice.LEFT: None, Choice.RIGHT: None}
+    assert streamed.snapshot_ordering() == [3, 1]
+    streamed.make_choice(Choice.RIGHT)
+    assert streamed.current_pair() == (2, 1)
+
+
+def test_ordering_view_matches_snapshot_and_goes_stale() -> None:
+    items = list(range(90))
+    random.Random(0x71E).shuffle(items)
+    sorter: PairwiseSorter[int] = PairwiseSorter(lambda values: BlockedList(values, load=4))
+    assert list(sorter.ordering_view(items)) == items
+
+    sorter.start_sorting(items)
+    while (pair := sorter.current_pair()) is not None:
+        view = sorter.ordering_view()
+        snapshot = sorter.snapshot_ordering()
+        assert len(view) == len(snapshot)
+        assert list(view) == snapshot
+        assert view[0] == snapshot[0] and view[-1] == snapshot[-1]
+        assert view[10:50] == snapshot[10:50]
+        assert view[80:200] == snapshot[80:200]
+        assert view[::7] == snapshot[::7]
+        sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+        assert not view.is_valid()
+        try:
+            view[0]
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("stale view was readable")
+
+    done_view = sorter.ordering_view()
+    assert list(done_view) == sorted(items, reverse=True)
+    assert sorter.undo()
+    assert not done_view.is_valid()
+
+
+def test_expected_max_comparisons_closed_form() -> None:
+    total = 0
+    for n in range(1, 5000):
+        assert expected_max_comparisons(n) == total
+        total += n.bit_length()
+    assert expected_max_comparisons(0) == 0
+    # Large inputs stay O(1) rather than looping.
+    assert expected_max_comparisons(10**12) > 0
+
+
+def test_progress_tracks_remaining_work() -> None:
+    n = 500
+    trials = 40
+    rng = random.Random(0x9A7)
+    actual_total = 0
+    expected_total = 0.0
+    for _ in range(trials):
+        items = list(range(n))
+        rng.shuffle(items)
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        sorter.start_sorting(items)
+        start = sorter.progress()
+        assert start.comparisons == 0
+        assert start.worst_remaining == expected_max_comparisons(n)
+        expected_total += start.expected_remaining
+        while (pair := sorter.current_pair()) is not None:
+            before = sorter.progress()
+            sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+            after = sorter.progress()
+            assert after.comparisons == before.comparisons + 1
+            assert after.worst_remaining <= before.worst_remaining - 1
+        actual_total += sorter.progress().comparisons
+        assert sorter.progress().worst_remaining == 0
+    assert abs(actual_total / trials - expected_total / trials) < 0.02 * expected_total / trials
+
+
+def test_adaptive_progress_extrapolates_from_answers() -> None:
+    n = 500
+    rng = random.Random(0xAD)
+    shuffled = list(range(n))
+    rng.shuffle(shuffled)
+    nearly_sorted = list(range(n - 1, -1, -1))
+    for _ in range(10):
+        nearly_sorted.insert(rng.randrange(n), nearly_sorted.pop(rng.randrange(n)))
+    for items in (shuffled, nearly_sorted):
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        sorter.start_sorting(items, adaptive=True)
+        estimates = []
+        while (pair := sorter.current_pair()) is not None:
+            progress = sorter.progress()
+            estimates.append((progress.comparisons, progress.expected_remaining))
+            sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+        total = sorter.progress().comparisons
+        for share in (0.25, 0.5, 0.75):
+            asked, expected = estimates[int(share * len(estimates))]
+            assert abs(expected - (total - asked)) < 0.2 * (total - asked)
+
+
+def test_progress_eta_uses_observed_latency() -> None:
+    now = [0.0]
+    sorter: PairwiseSorter[int] = PairwiseSorter(clock=lambda: now[0])
+    sorter.start_sorting(list(range(50)))
+    assert sorter.progress().eta_seconds is None
+    for _ in range(5):
+        now[0] += 3.0
+        current, pivot = sorter.current_pair()
+        sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+    progress = sorter.progress()
+    assert progress.eta_seconds is not None
+    assert abs(progress.eta_seconds - 3.0 * progress.expected_remaining) < 1e-6
+    assert 0 < progress.fraction < 1
+
+
+def test_top_k_ranks_only_the_leaders() -> None:
+    n = 1000
+    k = 5
+    trials = 20
+    total = 0
+    for seed in range(trials):
+        items = list(range(n))
+        if seed % 2:
+            random.Random(seed).shuffle(items)
+        else:
+            # Already ordered input must not push every item past the cut-off.
+            items.sort(reverse=bool(seed % 4))
+        sorter: PairwiseSorter[int] = PairwiseSorter()
+        sorter.start_sorting(items, limit=k)
+        bound = sorter.progress().worst_remaining
+        comparisons = _answer_all(sorter)
+        ordered = sorter.finish_sorting()
+        assert ordered[:k] == sorted(items, reverse=True)[:k]
+        assert sorted(ordered) == sorted(items)
+        assert comparisons <= bound
+        total += comparisons
+    # n + k·log2(n) questions, versus ~8,700 for a full sort.
+    assert total / trials < n + k * math.log2(n) * 1.5
+
+
+def test_top_k_undo_and_journal_resume() -> None:
+    items = list(range(60))
+    random.Random(0x70B).shuffle(items)
+    with tempfile.TemporaryDirectory() as directory:
+        journal: ChoiceJournal[int] = ChoiceJournal(Path(directory) / "session.jsonl")
+        sorter: PairwiseSorter[int] = PairwiseSorter(journal=journal)
+        sorter.start_sorting(items, limit=4)
+        for _ in range(30):
+            current, pivot = sorter.current_pair()
+            sorter.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+        for _ in range(5):
+            assert sorter.undo()
+        journal.close()
+
+        resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(journal.path))
+        assert resumed.resume()
+        assert resumed.state == sorter.state
+        _answer_all(resumed)
+        assert resumed.finish_sorting()[:4] == [59, 58, 57, 56]
+
+
+def test_finished_top_k_session_resumes_with_its_limit() -> None:
+    items = list(range(30))
+    random.Random(0x70C).shuffle(items)
+    for snapshot_every in (1, 1000):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "session.jsonl"
+            sorter: PairwiseSorter[int] = PairwiseSorter(
+                journal=ChoiceJournal(path, snapshot_every=snapshot_every)
+            )
+            sorter.start_sorting(items, limit=3)
+            _answer_all(sorter)
+            assert isinstance(sorter.state, DoneState) and sorter.state.limit == 3
+            sorter.journal.close()
+
+            resumed: PairwiseSorter[int] = PairwiseSorter(journal=ChoiceJournal(path))
+            assert resumed.resume()
+            state = resumed.state
+            assert isinstance(state, DoneState) and state.limit == 3
+            assert list(state.sorted[:3]) == [29, 28, 27]
+            # Only the leaders count as ranked when new items join later.
+            resumed.add_items(DoneState(list(state.sorted[: state.limit])), [30])
+            _answer_all(resumed)
+            assert resumed.finish_sorting() == [30, 29, 28, 27]
+            resumed.journal.close()
+
+
+def _inversions(ordering: list[int]) -> int:
+    return sum(
+        1
+        for left, right in itertools.combinations(ordering, 2)
+        if left < right
+    )
+
+
+def test_bradley_terry_outvotes_careless_answers() -> None:
+    from priority_sorter.bradley_terry import BradleyTerrySorter
+
+    items = list(range(80))
+    random.Random(0xB7).shuffle(items)
+
+    exact: BradleyTerrySorter[int] = BradleyTerrySorter()
+    exact.start_sorting(items)
+    _answer_all(exact)
+    assert exact.is_done()
+    assert exact.finish_sorting() == sorted(items, reverse=True)
+    # Consistent answers pin the order down before the budget runs out.
+    assert exact.comparisons < exact.budget
+    exact.start_sorting([1, 2])
+    assert _answer_all(exact) == 1 and exact.finish_sorting() == [2, 1]
+
+    # A tight budget ends the session with the order only partly resolved,
+    # still far closer than binary insertion cut off at the same point.
+    tight: BradleyTerrySorter[int] = BradleyTerrySorter(budget_factor=0.8)
+    tight.start_sorting(items)
+    _answer_all(tight)
+    assert tight.comparisons == tight.budget
+    cut_off: PairwiseSorter[int] = PairwiseSorter()
+    cut_off.start_sorting(items)
+    for _ in range(tight.budget):
+        current, pivot = cut_off.current_pair()
+        cut_off.make_choice(Choice.LEFT if current > pivot else Choice.RIGHT)
+    assert 0 < _inversions(tight.finish_sorting()) * 3 < _inversions(cut_off.finish_sorting())
+
+    def noisy_inversions(sorter) -> int:
+        rng = random.Random(0x4015E)
+        sorter.start_sorting(items)
+        while (pair := sorter.current_pair()) is not None:
+            outranks = (pair[0] > pair[1]) != (rng.random() < 0.1)
+            sorter.make_choice(Choice.LEFT if outranks else Choice.RIGHT)
+        return _inversions(sorter.finish_sorting())
+
+    rated: BradleyTerrySorter[int] = BradleyTerrySorter()
+    assert noisy_inversions(rated) * 2 < noisy_inversions(PairwiseSorter())
+    assert len(rated.scores()) == len(items)
+
+
+def test_batched_sorter_matches_individual_sessions() -> None:
+    import numpy as np
+
+    from priority_sorter.batched import BatchedSorter
+
+    rng = np.random.default_rng(0xBA)
+    for n in (0, 1, 2, 9, 33):
+        inputs = np.argsort(rng.random((40, n)), axis=1).astype(np.int16)
+        engine = BatchedSorter(inputs)
+        # Stop part-way first: snapshots must match the same number of answers.
+        sessions, current, pivot = engine.current_pairs()
+        for _ in range(7):
+            if not sessions.size:
+                break
+            sessions, current, pivot = engine.make_choices(current > pivot)
+        partial = engine.orderings()
+        counts = engine.comparisons
+        for row, answered, snapshot in zip(inputs.tolist(), counts, partial.tolist()):
+            sorter: PairwiseSorter[int] = PairwiseSorter()
+            sorter.start_sorting(row)
+            for _ in range(answered):
+                left, right = sorter.current_pair()  # type: ignore[misc]
+                sorter.make_choice(Choice.LEFT if left > right else Choice.RIGHT)
+            assert sorter.snapshot_ordering() == snapshot
+
+        result = engine.run(lambda current, pivot: current > pivot)
+        assert engine.is_done()
+        for row, asked, ordering in zip(inputs.tolist(), engine.comparisons, result.tolist()):
+            asks = 0
+
+            def prefer(current: int, pivot: int) -> bool:
+                nonlocal asks
+                asks += 1
+                return current > pivot
+
+            assert PairwiseSorter().sort_with(row, prefer) == ordering
+            assert asks == asked <= expected_max_comparisons(n)
+
+    engine = BatchedSorter(np.zeros((3, 4), dtype=np.int32))
+    try:
+        engine.make_choices(np.ones(2, dtype=bool))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("misaligned choices accepted")
+
+
+def test_consensus_streaming_matches_batch_and_brute_force() -> None:
+    from priority_sorter.consensus import ConsensusAccumulator
+
+    rng = random.Random(0xC0)
+    items = ["a", "b", "c", "d", "e", "f"]
+    orderings = []
+    for _ in range(600):
+        ordering = items[:]
+        rng.shuffle(ordering)
+        orderings.append(ordering)
+
+    batched: ConsensusAccumulator[str] = ConsensusAccumulator(items)
+    batched.add_many(orderings)
+    streamed: ConsensusAccumulator[str] = ConsensusAccumulator(items)
+    for ordering in orderings:
+        streamed.add(ordering)
+    assert streamed.count == batched.count == 600
+    assert (streamed.majority() == batched.majority()).all()
+    assert (streamed.borda_scores() == batched.borda_scores()).all()
+
+    majority = batched.majority()
+    assert majority[0, 1] == sum(o.index("a") < o.index("b") for o in orderings)
+    assert batched.borda_scores()[0] == sum(5 - o.index("a") for o in orderings)
+
+    best = min(
+        batched.disagreements(candidate) for candidate in itertools.permutations(items)
+    )
+    assert batched.disagreements(batched.kemeny_ordering()) == best
+
+    unanimous: ConsensusAccumulator[str] = ConsensusAccumulator(items)
+    unanimous.add_many([items] * 3 + [items[::-1]])
+    assert unanimous.kemeny_ordering() == unanimous.borda_ordering() == items
+    for broken in (items[:-1], items[:-1] + ["a"], items[:-1] + ["z"]):
+        try:
+            unanimous.add(broken)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"accepted {broken}")
+    assert unanimous.count == 4
+
+
+def test_cli_serve_answers_questions_over_json_lines() -> None:
+    from priority_sorter.cli import serve
+
+    output = io.StringIO()
+    items = [5, 3, 9, 1, 7]
+
+    def answers():
+        yield json.dumps({"items": items}) + "\n"
+        yield "not an answer\n"
+        while True:
+            last = json.loads(output.getvalue().splitlines()[-1])
+            if last["event"] == "result":
+                return
+            if last["event"] == "question":
+                yield "left\n" if last["left"] > last["right"] else '{"choice": "right"}\n'
+            else:
+                yield '"undo"\n'
+
+    assert serve(answers(), output) == 0
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert events[1]["event"] == "error"
+    assert events[-1] == {
+        "event": "result",
+        "done": True,
+        "ordering": [9, 7, 5, 3, 1],
+        "comparisons": sum(event["event"] == "question" for event in events) - 1,
+    }
+
+    # Answers left over after a session are reported, not parsed as requests.
+    output = io.StringIO()
+    assert serve(['{"items": [2, 1]}\n', "left\n", "right\n", '{"items": [4]}\n'], output) == 0
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [event["event"] for event in events] == ["question", "result", "error", "result"]
+    assert "no question is pending" in events[2]["message"]
+    assert events[3]["ordering"] == [4]
+
+
+def test_cli_batch_streams_one_result_per_session() -> None:
+    from priority_sorter.cli import run_batch
+
+    sessions = [
+        {"id": "full", "items": ["b", "c", "a"], "choices": ["left", "right"]},
+        {"items": ["b", "c", "a"], "choices": ["left"]},
+        {"items": "oops"},
+        {"items": [1, 2], "choices": 5},
+        {"items": [2, 1], "choices": ["left", "right", "left"]},
+        {"items": [1, 2], "limit": True},
+    ]
+    source = io.StringIO("".join(json.dumps(session) + "\n" for session in sessions))
+    output = io.StringIO()
+    assert run_batch(source, output) == 1
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    full, partial, broken, scalar, extra, flag = results
+    assert full["id"] == "full" and full["done"] and full["pending"] is None
+    assert full["unused_choices"] == 0
+    assert full["ordering"] == ["a", "b", "c"]
+    assert partial["id"] == 2 and not partial["done"] and partial["pending"] == ["c", "b"]
+    assert broken["id"] == 3 and "error" in broken
+    assert scalar["id"] == 4 and "choices" in scalar["error"]
+    assert extra["done"] and extra["unused_choices"] == 2
+    assert flag["id"] == 6 and "limit" in flag["error"]
+
+    probe = "import sys, priority_sorter.cli, main; print('tkinter' in sys.modules)"
+    check = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent,
+        check=True,
+    )
+    assert check.stdout.strip() == "False"
+
+
+async def _http(
+    port: int, method: str, path: str, body: object | None = None
+) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = b"" if body is None else json.dumps(body).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode()
+        + payload
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+def test_http_server_evicts_and_restores_sessions() -> None:
+    from priority_sorter.server import SessionStore, SortingServer
+
+    async def scenario(directory: str) -> None:
+        store = SessionStore(directory, capacity=3)
+        server = SortingServer(store)
+        await server.start()
+        try:
+            sessions = {}
+            answered = {}
+            for seed in range(8):
+                items = list(range(30))
+                random.Random(seed).shuffle(items)
+                status, view = await _http(server.port, "POST", "/sessions", {"items": items})
+                assert status == 201
+                sessions[view["id"]] = view
+                answered[view["id"]] = 0
+            # Interleave answers so every request touches a cold session.
+            while any(not view["done"] for view in sessions.values()):
+                for session_id, view in sessions.items():
+                    if view["done"]:
+                        continue
+                    question = view["question"]
+                    choice = "left" if question["left"] > question["right"] else "right"
+                    status, sessions[session_id] = await _http(
+                        server.port,
+                        "POST",
+                        f"/sessions/{session_id}/choice",
+                        {"choice": choice},
+                    )
+                    assert status == 200
+                    answered[session_id] += 1
+                    # Restores keep the answer count and undo history.
+                    assert sessions[session_id]["comparisons"] == answered[session_id]
+            for session_id in sessions:
+                status, result = await _http(server.port, "GET", f"/sessions/{session_id}/ordering")
+                assert status == 200 and result["ordering"] == list(range(29, -1, -1))
+            assert len(store) <= 3 and store.evictions > 0 and store.restores > 0
+            restores = store.restores
+            session_id = next(iter(sessions))
+            status, view = await _http(server.port, "POST", f"/sessions/{session_id}/undo")
+            assert store.restores == restores + 1
+            assert status == 200 and not view["done"]
+            assert view["comparisons"] == answered[session_id] - 1
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /sessions HTTP/1.1\r\nX-Padding: " + b"a" * 70000 + b"\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+            assert response.startswith(b"HTTP/1.1 431 ")
+
+            status, _ = await _http(server.port, "POST", f"/sessions/{session_id}/choice", {})
+            assert status == 400
+            status, _ = await _http(server.port, "POST", "/sessions", {"items": [1, 2], "limit": True})
+            assert status == 400
+            status, _ = await _http(server.port, "GET", "/sessions/" + "0" * 32)
+            assert status == 404
+            status, _ = await _http(server.port, "DELETE", f"/sessions/{session_id}")
+            assert status == 200
+            status, _ = await _http(server.port, "GET", f"/sessions/{session_id}")
+            assert status == 404
+            # A damaged journal is a server error, answered rather than dropped.
+            broken = "f" * 32
+            (Path(directory) / f"{broken}.json").write_text("[1, 2, 3]\n")
+            status, result = await _http(server.port, "GET", f"/sessions/{broken}")
+            assert status == 500 and "error" in result
+            server.dispatch = lambda method, target, body: {}["unexpected"]
+            status, result = await _http(server.port, "GET", "/sessions")
+            assert status == 500 and result == {"error": "internal server error"}
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(scenario(directory))
+
+
+def test_simulation_harness_matches_serial_runs() -> None:
+    from priority_sorter.simulation import (
+        count_inversions,
+        run_trial,
+        run_trials,
+        summarize,
+        trial_grid,
+    )
+
+    assert count_inversions([3, 2, 1, 0]) == 0
+    assert count_inversions([0, 1, 2, 3]) == 6
+    trials = list(trial_grid(["insertion", "merge_insertion"], [1, 12, 40], 6, [0.0, 0.2]))
+    chunks = list(run_trials(iter(trials), workers=2, chunk_size=5))
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    results = sorted(result for chunk in chunks for result in chunk)
+    assert results == sorted(run_trial(trial) for trial in trials)
+
+    summaries = summarize(chunks)
+    assert len(summaries) == 2 * 3 * 2
+    for summary in summaries:
+        assert summary.trials == 6
+        if summary.noise == 0.0:
+            assert summary.worst <= summary.bound and summary.mean_inversions == 0
+    try:
+        trial_grid(["nope"], [10], 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown strategy accepted")
+
+
+def test_item_store_ids_drive_a_sort() -> None:
+    store = ItemStore(["b", "d", "a", "c"])
+    ids = list(store.ids())
+    assert ids == [0, 1, 2, 3]
+    store.set_editing(1, True)
+    store.set_ranked(1, True)
+    store.set_editing(1, False)
+    assert store.is_ranked(1) and not store.is_editing(1)
+    handle = store.handle(2)
+    handle.description = "a" * 2
+    assert store.description(2) == "aa" and handle.clone() == Item("aa")
+
+    knowledge: ComparisonKnowledge[int] = ComparisonKnowledge(key=int)
+    sorter: PairwiseSorter[int] = PairwiseSorter(knowledge=knowledge)
+    sorter.start_sorting(ids)
+    while (pair := sorter.current_pair()) is not None:
+        left, right = (store.description(item_id) for item_id in pair)
+        sorter.make_choice(Choice.LEFT if left < right else Choice.RIGHT)
+    ordered = sorter.finish_sorting()
+    assert [store.description(item_id) for item_id in ordered] == ["aa", "b", "c", "d"]
+
+    store.remove(0)
+    assert 0 not in store and len(store) == 3
+    assert store.add("e") == 4 and store.capacity == 5
+
+
+class _RecordingObserver(SorterObserver[int]):
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_start(self, sorter, timestamp):
+        self.events.append(("start", timestamp))
+
+    def on_question(self, sorter, pair, timestamp):
+        self.events.append(("question", pair, timestamp))
+
+    def on_choice(self, sorter, pair, choice, inferred, timestamp):
+        self.events.append(("choice", pair, choice, inferred, timestamp))
+
+    def on_insert(self, sorter, item, position, timestamp):
+        self.events.append(("insert", item, position, timestamp))
+
+    def on_done(self, sorter, timestamp):
+        self.events.append(("done", timestamp))
+
+
+def test_observer_sees_every_event_in_order() -> None:
+    ticks = itertools.count()
+    observer = _RecordingObserver()
+    sorter: PairwiseSorter[int] = PairwiseSorter(
+        clock=lambda: float(next(ticks)), observers=[observer]
+    )
+    items = [3, 1, 4, 5, 9, 2, 6]
+    sorter.start_sorting(items)
+    asked = []
+    while (pair := sorter.current_pair()) is not None:
+        asked.append(pair)
+        sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+
+    kinds = [event[0] for event in observer.events]
+    assert kinds[0] == "start" and kinds[-1] == "done"
+    assert [event[1] for event in observer.events if event[0] == "question"] == asked
+    assert [event[1] for event in observer.events if event[0] == "choice"] == asked
+    inserted = [event[1] for event in observer.events if event[0] == "insert"]
+    assert sorted(inserted) == sorted(items[1:])
+    timestamps = [event[-1] for event in observer.events]
+    assert timestamps == sorted(timestamps)
+    # Every answer is followed by an insert (if the window closed) and the next question.
+    for index, kind in enumerate(kinds):
+        if kind == "choice":
+            assert kinds[index + 1] in ("insert", "question", "done")
+
+
+def test_prometheus_metrics_written_on_done() -> None:
+    now = [0.0]
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "sorter.prom"
+        metrics: PrometheusMetrics[int] = PrometheusMetrics(path)
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            clock=lambda: now[0], observers=[metrics]
+        )
+        sorter.start_sorting(list(range(20)))
+        answers = 0
+        while (pair := sorter.current_pair()) is not None:
+            now[0] += 2.0
+            sorter.make_choice(Choice.LEFT if pair[0] > pair[1] else Choice.RIGHT)
+            answers += 1
+        text = path.read_text()
+
+    assert metrics.decision_seconds.count == answers
+    assert metrics.decision_seconds.sum == 2.0 * answers
+    assert metrics.questions_per_item.count == 19
+    assert metrics.questions_per_item.sum == answers
+    assert metrics.session_seconds.sum == 2.0 * answers
+    assert "# TYPE priority_sorter_decision_seconds histogram" in text
+    assert f'priority_sorter_decision_seconds_bucket{{le="2"}} {answers}' in text
+    assert 'priority_sorter_decision_seconds_bucket{le="1"} 0' in text
+    assert "priority_sorter_sessions_finished_total 1" in text
+
+
+def test_prometheus_metrics_ignore_finished_resumes_and_forget_abandoned_sorters() -> None:
+    import gc
+
+    metrics: PrometheusMetrics[int] = PrometheusMetrics()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "session.json"
+        sorter: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path), observers=[metrics]
+        )
+        sorter.start_sorting(list(range(10)))
+        _answer_all(sorter)
+        sorter.journal.close()
+        resumed: PairwiseSorter[int] = PairwiseSorter(
+            journal=ChoiceJournal(path), observers=[metrics]
+        )
+        assert resumed.resume() and resumed.current_pair() is None
+        resumed.journal.close()
+    assert metrics.sessions_started == metrics.sessions_finished == 1
+    assert metrics.session_seconds.count == 1
+
+    abandoned: PairwiseSorter[int] = PairwiseSorter(observers=[metrics])
+    abandoned.start_sorting(list(range(10)))
+    abandoned.make_choice(Choice.LEFT)
+    assert metrics._started_at and metrics._questions
+    del abandoned
+    gc.collect()
+    assert not (metrics._started_at or metrics._questions or metrics._asked_at)
+
+
+def _run_merge_insertion_sort(items: list[int]) -> tuple[int, list[int]]:
+    sorter: MergeInsertionSorter[int] = MergeInsertionSorter()
+    sorter.start_sorting(items)
+
+    comparisons = 0
+    while True:
+        pair = sorter.current_pair()
+        if pair is None:
+            break
+        current, pivot = pair
+        choice = Choice.LEFT if current > pivot else Choice.RIGHT
+        sorter.make_choice(choice)
+        comparisons += 1
+
+    return comparisons, sorter.finish_sorting(items)
+
+
+def test_merge_insertion_bound_known_values() -> None:
+    # OEIS A001768: worst case of the Ford–Johnson algorithm.
+    expected = [0, 1, 3, 5, 7, 10, 13, 16, 19, 22, 26, 30, 34, 38, 42]
+    assert [merge_insertion_max_comparisons(n) for n in range(1, 16)] == expected
+    assert merge_insertion_max_comparisons(0) == 0
+
+
+def test_merge_insertion_matches_ground_truth() -> None:
+    rng = random.Random(0xF0CACC1A)
+    for n in [0, 1, 2, 3, 4, 5, 8, 13, 21, 34, 55, 89, 144, 377, 987]:
+        for _ in range(3):
+            items = list(range(n))
+            rng.shuffle(items)
+            comparisons, out = _run_merge_insertion_sort(items)
+            assert out == sorted(items, reverse=True)
+            assert comparisons <= merge_insertion_max_comparisons(n)
+
+
+def test_merge_insertion_exhaustive_small_worst_case() -> None:
+    for n in range(1, 8):
+        worst = 0
+        for items in itertools.permutations(range(n)):
+            comparisons, out = _run_merge_insertion_sort(list(items))
+            assert out == sorted(items, reverse=True)
+            worst = max(worst, comparisons)
+        assert worst == merge_insertion_max_comparisons(n)
+        assert worst <= expected_max_comparisons(n)
+
+
+def test_merge_insertion_handles_duplicates() -> None:
+    items = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    comparisons, out = _run_merge_insertion_sort(items)
+    assert out == sorted(items, reverse=True)
+    assert comparisons <= merge_insertion_max_comparisons(len(items))
+
+
+def test_async_merge_sorter_matches_ground_truth() -> None:
+    rng = random.Random(0xA5EC)
+
+    async def prefer(left: int, right: int) -> bool:
+        await asyncio.sleep(0)
+        return left > right
+
+    for n in [0, 1, 2, 3, 13, 144, 987]:
+        for max_in_flight in [1, 4, 32]:
+            items = [rng.randrange(n // 2 + 1) for _ in range(n)]
+            sorter: AsyncMergeSorter[int] = AsyncMergeSorter(max_in_flight)
+            out = asyncio.run(sorter.sort(items, prefer))
+            assert out == sorted(items, reverse=True)
+            assert sorter.finish_sorting() == out
+            assert sorter.peak_in_flight <= max_in_flight
+
+
+def test_async_merge_sorter_keeps_judges_busy() -> None:
+    items = list(range(256))
+    random.Random(7).shuffle(items)
+
+    async def prefer(left: int, right: int) -> bool:
+        await asyncio.sleep(0)
+        return left > right
+
+    sequential: AsyncMergeSorter[int] = AsyncMergeSorter(max_in_flight=1)
+    asyncio.run(sequential.sort(items, prefer))
+    assert sequential.peak_in_flight == 1
+
+    pooled: AsyncMergeSorter[int] = AsyncMergeSorter(max_in_flight=16)
+    asyncio.run(pooled.sort(items, prefer))
+    assert pooled.peak_in_flight == 16
+
+
 def test_empty_list() -> None:
     sorter: PairwiseSorter[int] = PairwiseSorter()
     sorter.start_sorting([])